@@ -4,6 +4,7 @@ from azfs.az_file_client import (
 )
 
 from azfs.az_file_system import AzFileSystem
+from azfs.cache import DiskCache, MemoryCache, ParsedCache
 from azfs.utils import BlobPathDecoder
 
 from .table_storage import (
@@ -20,6 +21,9 @@ __all__ = [
     "AzFileClient",
     "AzFileSystem",
     "BlobPathDecoder",
+    "DiskCache",
+    "MemoryCache",
+    "ParsedCache",
     "TableStorage",
     "TableStorageWrapper",
     "export_decorator"
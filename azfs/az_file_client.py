@@ -1,6 +1,7 @@
 import bz2
 import copy
-from functools import partial
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from functools import lru_cache, partial
 import gzip
 import io
 from inspect import signature
@@ -8,10 +9,17 @@ import json
 from logging import getLogger, INFO
 import lzma
 import multiprocessing as mp
+import os
 import pickle
+import queue
 import re
 import sys
+import tempfile
+import threading
 import traceback as trc
+from urllib.parse import quote, unquote
+import uuid
+import weakref
 # to accept all typing.*
 from typing import *
 import warnings
@@ -19,7 +27,9 @@ import warnings
 import pandas as pd
 from azure.identity import DefaultAzureCredential
 from azure.core.exceptions import ResourceNotFoundError
-from azfs.clients import AzfsClient, TextReader
+from azfs.clients import AzfsClient, RangeReader, StreamReader, TextReader
+from azfs.clients.client_interface import DEFAULT_CHUNK_SIZE, DEFAULT_MAX_CONCURRENCY, run_concurrently
+from azfs.cache import DiskCache, MemoryCache, ParsedCache
 from azfs.error import (
     AzfsInputError,
     AzfsDecoratorFileFormatError,
@@ -60,67 +70,993 @@ class ExportDecorator:
 export_decorator = ExportDecorator()
 
 
+# client of the worker process in the pool created by ``AzFileClient.create_pool()``,
+# which is created once in ``_init_worker()`` and reused among the tasks
+_worker_client = None
+
+
+def _init_worker(
+        credential: Optional[str] = None,
+        connection_string: Optional[str] = None,
+        disk_cache: Optional[DiskCache] = None,
+        parsed_cache: Optional[ParsedCache] = None):
+    """
+    initializer of the worker process, to create the client and the credential only once.
+
+    Args:
+        credential: account key, or None to use DefaultAzureCredential
+        connection_string: connection_string
+        disk_cache: disk cache shared with the parent process
+        parsed_cache: parsed cache shared with the parent process
+
+    Returns:
+        None
+    """
+    global _worker_client
+    _worker_client = AzFileClient(
+        credential=credential,
+        connection_string=connection_string,
+        disk_cache=disk_cache,
+        parsed_cache=parsed_cache)
+
+
 def _wrap_quick_load(inputs: dict):
     """
     read wrapper function for multiprocessing.
 
     Args:
-        inputs:
+        inputs: keywords to put ``_quick_load()``, and ``shared_memory`` to return the result via shared memory
+
+    Returns:
+
+    """
+    inputs = dict(inputs)
+    shared_memory = inputs.pop("shared_memory", False)
+    result = _quick_load(**inputs)
+    return _to_shared_memory(result) if shared_memory else result
+
+
+# directory of the memory-mapped files to return the results from the worker processes,
+# `/dev/shm` is backed by memory on Linux
+_SHARED_MEMORY_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
+
+class _SharedMemoryResult:
+    """
+    result of the worker process written in Arrow IPC file format,
+    which is passed to the parent process instead of pickling the data.
+    """
+    def __init__(self, path: str, as_arrow: bool):
+        self.path = path
+        self.as_arrow = as_arrow
+
+
+def _to_shared_memory(result) -> Union[_SharedMemoryResult, pd.DataFrame]:
+    """
+    write pd.DataFrame or pyarrow.Table in the worker process to the memory-mapped file.
+    pd.DataFrame which cannot be converted to pyarrow.Table exactly is returned as it is, to be pickled.
+
+    Args:
+        result: pd.DataFrame or pyarrow.Table
 
     Returns:
+        _SharedMemoryResult, or the result itself
+    """
+    import pyarrow as pa
+    as_arrow = isinstance(result, pa.Table)
+    if as_arrow:
+        table = result
+    else:
+        # the column names other than str are not restored from Arrow
+        if not all([isinstance(column, str) for column in result.columns]):
+            return result
+        try:
+            table = pa.Table.from_pandas(result)
+        except (pa.ArrowException, TypeError, ValueError):
+            return result
+    fd, path = tempfile.mkstemp(prefix="azfs-", suffix=".arrow", dir=_SHARED_MEMORY_DIR)
+    os.close(fd)
+    try:
+        with pa.OSFile(path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+    except BaseException:
+        os.remove(path)
+        raise
+    return _SharedMemoryResult(path=path, as_arrow=as_arrow)
+
+
+def _from_shared_memory(result):
+    """
+    attach the memory-mapped file written by the worker process, and remove the file.
+    pyarrow.Table refers the mapped memory without copy, and the memory is released with the table.
+
+    Args:
+        result: returned by ``_to_shared_memory()``
 
+    Returns:
+        pyarrow.Table, or pd.DataFrame if the worker returned pd.DataFrame
     """
-    return _quick_load(**inputs)
+    if not isinstance(result, _SharedMemoryResult):
+        return result
+    import pyarrow as pa
+    try:
+        with pa.memory_map(result.path) as source:
+            table = pa.ipc.open_file(source).read_all()
+    finally:
+        # the mapping is alive until the table is released, even after the file is removed
+        try:
+            os.remove(result.path)
+        except OSError:
+            pass
+    return table if result.as_arrow else table.to_pandas()
+
+
+def _discard_shared_memory(result):
+    """
+    remove the memory-mapped file written by the worker process, which is not attached.
+
+    Args:
+        result: returned by ``_to_shared_memory()``
+
+    Returns:
+        None
+    """
+    if isinstance(result, _SharedMemoryResult):
+        try:
+            os.remove(result.path)
+        except OSError:
+            pass
 
 
 def _quick_load(
         path: str,
         file_format: Optional[str] = None,
         credential: Optional[str] = None,
-        apply_method: Optional[callable] = None) -> pd.DataFrame:
+        apply_method: Optional[callable] = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        disk_cache: Optional[DiskCache] = None,
+        parsed_cache: Optional[ParsedCache] = None,
+        partitions: Optional[dict] = None,
+        as_arrow: bool = False,
+        select: Optional[List[str]] = None,
+        where=None,
+        **kwargs):
     """
     read function for multiprocessing.
 
     Args:
         path: file-path to read
         file_format: format of the file
-        credential:
+        credential: used only if the worker is not initialized with ``_init_worker()``
         apply_method:
+        start: start of the byte-range split, see ``AzFileClient.read_split()``
+        end: end of the byte-range split
+        disk_cache: disk cache shared with the parent process
+        parsed_cache: parsed cache shared with the parent process
+        partitions: partition values to add as columns, see ``DataFrameReader.parquet_dataset()``
+        as_arrow: return pyarrow.Table instead of pd.DataFrame
+        select: columns to return, applied in the worker before returned
+        where: predicates of the rows to return, applied in the worker before returned
+        **kwargs: keywords to put read_* function
 
     Returns:
-        pd.DataFrame
+        pd.DataFrame, or pyarrow.Table if ``as_arrow``
     """
-    if credential is None:
-        azc = AzFileClient()
+    if _worker_client is not None:
+        azc = _worker_client
+    elif credential is None:
+        azc = AzFileClient(disk_cache=disk_cache, parsed_cache=parsed_cache)
     else:
-        azc = AzFileClient(credential=credential)
-
-    # set file_format if None
-    if file_format is None:
-        if path.endswith(".csv"):
-            file_format = "csv"
-        elif path.endswith(".parquet"):
-            file_format = "parquet"
-        elif path.endswith(".pkl"):
-            file_format = "pickle"
-        else:
-            raise AzfsInputError("file_format is incorrect")
+        azc = AzFileClient(credential=credential, disk_cache=disk_cache, parsed_cache=parsed_cache)
+    return _read_frame(
+        azc=azc,
+        path=path,
+        file_format=file_format,
+        apply_method=apply_method,
+        start=start,
+        end=end,
+        partitions=partitions,
+        as_arrow=as_arrow,
+        select=select,
+        where=where,
+        **kwargs)
+
+
+def _infer_file_format(path: str, file_format: Optional[str] = None, start: Optional[int] = None) -> str:
+    """
+    determine the file format from the extension, if ``file_format`` is not given.
 
+    Returns:
+        ``csv``, ``parquet`` or ``pickle``
+    """
+    if file_format is not None:
+        return file_format
+    if start is not None or path.endswith(".csv"):
+        return "csv"
+    elif path.endswith(".parquet"):
+        return "parquet"
+    elif path.endswith(".pkl"):
+        return "pickle"
+    raise AzfsInputError("file_format is incorrect")
+
+
+def _push_down(
+        file_format: str,
+        select: Optional[List[str]] = None,
+        where=None,
+        kwargs: Optional[dict] = None) -> Tuple[dict, Any]:
+    """
+    push the projection and the predicates down to the reader of the file format.
+    Parquet reads only ``columns`` and prunes the row-groups with ``filters``,
+    and csv parses only ``usecols``.
+
+    Args:
+        file_format: format of the file
+        select: columns to return
+        where: filters in pyarrow style, or the expression of ``pd.DataFrame.query()``
+        kwargs: keywords to put read_* function
+
+    Returns:
+        tuple of the keywords to put read_* function, and the predicates to evaluate after read
+    """
+    kwargs = dict(kwargs or {})
+    conjunctions = _normalize_parquet_filters(where) if where is not None else None
+    if file_format == "parquet":
+        if select is not None:
+            kwargs["columns"] = list(select)
+        if conjunctions is not None:
+            kwargs["filters"] = conjunctions
+            return kwargs, None
+    elif file_format == "csv" and select is not None and (where is None or conjunctions is not None):
+        # the columns only in the predicates are also parsed, and dropped after filtered
+        filter_columns = [p[0] for c in (conjunctions or []) for p in c]
+        kwargs["usecols"] = list(dict.fromkeys(list(select) + filter_columns))
+    return kwargs, where
+
+
+def _filter_frame(df: pd.DataFrame, where) -> pd.DataFrame:
+    """
+    filter the rows with the filters in pyarrow style, or the expression of ``pd.DataFrame.query()``.
+
+    Args:
+        df: pd.DataFrame
+        where: list of ``(column, op, value)``, list of the list, or str
+
+    Returns:
+        pd.DataFrame
+    """
+    if isinstance(where, str):
+        return df.query(where)
+    conjunctions = _normalize_parquet_filters(where)
+    if conjunctions is None:
+        raise AzfsInputError("`where` must be the filters in the list, or str")
+    if not conjunctions:
+        return df
+
+    def _mask(predicate: tuple) -> pd.Series:
+        column, op, value = predicate
+        series = df[column]
+        if op in ["=", "=="]:
+            return series == value
+        elif op == "!=":
+            return series != value
+        elif op == "<":
+            return series < value
+        elif op == "<=":
+            return series <= value
+        elif op == ">":
+            return series > value
+        elif op == ">=":
+            return series >= value
+        elif op == "in":
+            return series.isin(value)
+        elif op == "not in":
+            return ~series.isin(value)
+        raise AzfsInputError(f"operator `{op}` is not supported")
+
+    mask = pd.Series(False, index=df.index)
+    for conjunction in conjunctions:
+        conjunction_mask = pd.Series(True, index=df.index)
+        for predicate in conjunction:
+            conjunction_mask &= _mask(predicate)
+        mask |= conjunction_mask
+    return df[mask]
+
+
+def _finish_frame(
+        df: pd.DataFrame,
+        partitions: Optional[dict] = None,
+        apply_method: Optional[callable] = None,
+        as_arrow: bool = False,
+        select: Optional[List[str]] = None,
+        where=None):
+    """
+    add the partition columns, filter the rows and the columns, apply the function,
+    and convert to pyarrow.Table if ``as_arrow``.
+
+    Returns:
+        pd.DataFrame, or pyarrow.Table if ``as_arrow``
+    """
+    if partitions is not None:
+        df = _attach_partitions(df, partitions=partitions)
+    if where is not None:
+        df = _filter_frame(df, where=where)
+    if select is not None:
+        df = df[[c for c in select if c in df.columns]]
+    # apply additional function
+    if apply_method is not None:
+        df = apply_method(df)
+    if as_arrow:
+        import pyarrow as pa
+        return pa.Table.from_pandas(df, preserve_index=False)
+    return df
+
+
+def _arrow_with_partitions(table, partitions: Optional[dict] = None):
+    """
+    append the partition values as the string columns of pyarrow.Table.
+
+    Returns:
+        pyarrow.Table
+    """
+    import pyarrow as pa
+    for key, value in (partitions or {}).items():
+        table = table.append_column(key, pa.array([value] * table.num_rows, type=pa.string()))
+    return table
+
+
+def _read_frame(
+        azc,
+        path: str,
+        file_format: Optional[str] = None,
+        apply_method: Optional[callable] = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        partitions: Optional[dict] = None,
+        as_arrow: bool = False,
+        select: Optional[List[str]] = None,
+        where=None,
+        **kwargs):
+    """
+    read one file, or one byte-range split of the file, with the client.
+
+    Args:
+        azc: AzFileClient
+        path: file-path to read
+        file_format: format of the file, inferred from the extension if None
+        apply_method: function to apply the pd.DataFrame
+        start: start of the byte-range split, see ``AzFileClient.read_split()``
+        end: end of the byte-range split
+        partitions: partition values to add as columns
+        as_arrow: return pyarrow.Table instead of pd.DataFrame
+        select: columns to return, see ``DataFrameReader.select()``
+        where: predicates of the rows to return, see ``DataFrameReader.where()``
+        **kwargs: keywords to put read_* function
+
+    Returns:
+        pd.DataFrame, or pyarrow.Table if ``as_arrow``
+    """
+    file_format = _infer_file_format(path=path, file_format=file_format, start=start)
+    kwargs, where = _push_down(file_format=file_format, select=select, where=where, kwargs=kwargs)
+    if as_arrow and apply_method is None and where is None and file_format == "parquet" and start is None:
+        # parquet is read as pyarrow.Table without the conversion to pandas
+        return _arrow_with_partitions(azc.read_parquet_table(path=path, **kwargs), partitions=partitions)
+
+    # read the lines in the byte-range split
+    if start is not None and end is not None:
+        df = azc.read_split(path=path, start=start, end=end, file_format=file_format, **kwargs)
     # read file as pandas DataFrame
-    if file_format == "csv":
-        df = azc.read_csv(path=path)
+    elif file_format == "csv":
+        df = azc.read_csv(path=path, **kwargs)
     elif file_format == "parquet":
-        df = azc.read_parquet(path=path)
+        df = azc.read_parquet(path=path, **kwargs)
     elif file_format == "pickle":
-        df = azc.read_pickle(path=path)
+        df = azc.read_pickle(path=path, **kwargs)
     else:
         raise AzfsInputError("file_format is incorrect")
+    return _finish_frame(
+        df, partitions=partitions, apply_method=apply_method, as_arrow=as_arrow, select=select, where=where)
 
-    # apply additional function
-    if apply_method is None:
-        return df
+
+# keywords to download the file, which are not passed to the parser
+_DOWNLOAD_KEYWORDS = ["max_concurrency", "chunk_size", "stream"]
+
+
+def _fetch_bytes(
+        azc,
+        path: str,
+        file_format: Optional[str] = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        **kwargs) -> bytes:
+    """
+    download one file, or one byte-range split of the file, to be parsed by ``_parse_bytes()`` in another process.
+    ``.gz`` file is decompressed.
+
+    Returns:
+        bytes
+    """
+    file_format = _infer_file_format(path=path, file_format=file_format, start=start)
+    if start is not None and end is not None:
+        return azc._read_split_data(
+            path=path, start=start, end=end, file_format=file_format, header=kwargs.get("header", "infer"))
+    return azc._get(
+        path=path, max_concurrency=kwargs.get("max_concurrency"), chunk_size=kwargs.get("chunk_size")).read()
+
+
+def _wrap_parse_bytes(inputs: dict):
+    """
+    parse wrapper function for multiprocessing.
+
+    Args:
+        inputs: keywords to put ``_parse_bytes()``, and ``shared_memory`` to return the result via shared memory
+
+    Returns:
+
+    """
+    inputs = dict(inputs)
+    shared_memory = inputs.pop("shared_memory", False)
+    result = _parse_bytes(**inputs)
+    return _to_shared_memory(result) if shared_memory else result
+
+
+def _parse_bytes(
+        data: bytes,
+        path: str,
+        file_format: Optional[str] = None,
+        apply_method: Optional[callable] = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        partitions: Optional[dict] = None,
+        as_arrow: bool = False,
+        select: Optional[List[str]] = None,
+        where=None,
+        **kwargs):
+    """
+    parse the data downloaded by ``_fetch_bytes()``.
+
+    Args:
+        data: content of the file or the split
+        path: file-path, to infer the file format
+        file_format: format of the file
+        apply_method: function to apply the pd.DataFrame
+        start: start of the byte-range split
+        end: end of the byte-range split
+        partitions: partition values to add as columns
+        as_arrow: return pyarrow.Table instead of pd.DataFrame
+        select: columns to return, see ``DataFrameReader.select()``
+        where: predicates of the rows to return, see ``DataFrameReader.where()``
+        **kwargs: keywords to put read_* function
+
+    Returns:
+        pd.DataFrame, or pyarrow.Table if ``as_arrow``
+    """
+    file_format = _infer_file_format(path=path, file_format=file_format, start=start)
+    kwargs = {k: v for k, v in kwargs.items() if k not in _DOWNLOAD_KEYWORDS}
+    kwargs, where = _push_down(file_format=file_format, select=select, where=where, kwargs=kwargs)
+    if start is not None and end is not None:
+        df = _parse_split(data=data, file_format=file_format, **kwargs)
+    elif file_format == "csv":
+        df = pd.read_csv(io.BytesIO(data), **kwargs)
+    elif file_format == "parquet":
+        import pyarrow.parquet as pq
+        table = pq.read_table(
+            io.BytesIO(data), columns=kwargs.get("columns"), filters=kwargs.get("filters"), use_pandas_metadata=True)
+        if as_arrow and apply_method is None and where is None:
+            return _arrow_with_partitions(table, partitions=partitions)
+        df = table.to_pandas()
+    elif file_format == "pickle":
+        compression = kwargs.get("compression", "gzip")
+        if compression == "gzip":
+            data = gzip.decompress(data)
+        elif compression == "bz2":
+            data = bz2.decompress(data)
+        elif compression == "xz":
+            data = lzma.decompress(data)
+        df = pd.DataFrame(pickle.loads(data))
     else:
-        return apply_method(df)
+        raise AzfsInputError("file_format is incorrect")
+    return _finish_frame(
+        df, partitions=partitions, apply_method=apply_method, as_arrow=as_arrow, select=select, where=where)
+
+
+def _parse_split(data: bytes, file_format: str = "csv", **kwargs) -> pd.DataFrame:
+    """
+    parse the lines in the byte-range split.
+
+    Args:
+        data: lines in the split, see ``AzFileClient._read_split_data()``
+        file_format: ``csv`` or ``ndjson``
+        **kwargs: keywords to put pd.read_csv() or pd.read_json()
+
+    Returns:
+        pd.DataFrame
+    """
+    if file_format not in ["csv", "ndjson"]:
+        raise AzfsInputError("file_format must be `csv` or `ndjson`")
+    if not data:
+        return pd.DataFrame()
+    if file_format == "csv":
+        return pd.read_csv(io.BytesIO(data), **kwargs)
+    return pd.read_json(io.BytesIO(data), lines=True, **kwargs)
+
+
+class _GzipReader(gzip.GzipFile):
+    """
+    GzipFile, which also closes the underlying file object on ``close()``.
+    """
+    def __init__(self, fileobj: io.IOBase):
+        super().__init__(fileobj=fileobj, mode="rb")
+        self._underlying_fileobj = fileobj
+
+    def close(self):
+        try:
+            super().close()
+        finally:
+            self._underlying_fileobj.close()
+
+
+def _read_with_handle(read_function: callable, file_to_read: io.IOBase, **kwargs):
+    """
+    call ``pd.read_csv``-like function, and close the handle which pandas does not close.
+    With ``chunksize`` or ``iterator=True``, the handle is closed with the returned TextFileReader.
+
+    Args:
+        read_function: pd.read_csv or pd.read_table
+        file_to_read: file-like object
+        **kwargs: keywords to put read_function
+
+    Returns:
+        pd.DataFrame or TextFileReader
+    """
+    try:
+        result = read_function(file_to_read, **kwargs)
+    except BaseException:
+        file_to_read.close()
+        raise
+    if isinstance(result, pd.DataFrame):
+        file_to_read.close()
+        return result
+
+    reader_close = result.close
+
+    def _close():
+        try:
+            reader_close()
+        finally:
+            file_to_read.close()
+
+    # TextFileReader calls `close()` when the iteration ends, or on `__exit__`
+    result.close = _close
+    weakref.finalize(result, file_to_read.close)
+    return result
+
+
+def _promote_dtypes(df: pd.DataFrame, dtypes: pd.Series) -> Tuple[pd.DataFrame, pd.Series]:
+    """
+    promote the columns of ``df`` to the common dtype with ``dtypes`` of the previous chunks,
+    to keep dtypes consistent among the chunks without losing any value.
+    The column is never narrowed, ex. ``int64`` is promoted to ``float64``, but ``float64`` is left as it is.
+
+    Args:
+        df: pd.DataFrame to cast
+        dtypes: dtypes of the previous chunks
+
+    Returns:
+        tuple of pd.DataFrame and the dtypes updated with ``df``
+    """
+    dtypes = dtypes.copy()
+    for column in df.columns:
+        if column not in dtypes.index:
+            dtypes[column] = df[column].dtype
+            continue
+        # the same promotion as concatenating the chunks with `pd.concat`
+        common_dtype = pd.concat([
+            pd.Series([], dtype=dtypes[column]),
+            pd.Series([], dtype=df[column].dtype)
+        ]).dtype
+        if df[column].dtype != common_dtype:
+            df[column] = df[column].astype(common_dtype)
+        dtypes[column] = common_dtype
+    return df, dtypes
+
+
+# operators of the parquet filters, to check whether the row-group may have the matched rows with min/max statistics
+_PARQUET_FILTER_OPERATORS = {
+    "=": lambda min_value, max_value, value: min_value <= value <= max_value,
+    "==": lambda min_value, max_value, value: min_value <= value <= max_value,
+    "!=": lambda min_value, max_value, value: not (min_value == max_value == value),
+    "<": lambda min_value, max_value, value: min_value < value,
+    "<=": lambda min_value, max_value, value: min_value <= value,
+    ">": lambda min_value, max_value, value: max_value > value,
+    ">=": lambda min_value, max_value, value: max_value >= value,
+    "in": lambda min_value, max_value, value: any([min_value <= v <= max_value for v in value]),
+}
+
+
+def _normalize_parquet_filters(filters) -> Optional[List[List[tuple]]]:
+    """
+    normalize the parquet filters in pyarrow style to the disjunctive normal form.
+
+    Args:
+        filters: list of tuple ``(column, op, value)``, or list of the list
+
+    Returns:
+        list of the conjunctions, or None if the filters are not in the list style, such as pyarrow Expression
+    """
+    if filters is None:
+        return []
+    if not isinstance(filters, list):
+        return None
+    if len(filters) > 0 and isinstance(filters[0], tuple):
+        return [filters]
+    return [list(conjunction) for conjunction in filters]
+
+
+def _parquet_row_groups(metadata, filters) -> List[int]:
+    """
+    select the row-groups which may have the rows matched with ``filters``, by the min/max statistics.
+
+    Args:
+        metadata: pyarrow.parquet.FileMetaData
+        filters: parquet filters in pyarrow style
+
+    Returns:
+        list of the index of the row-groups
+    """
+    conjunctions = _normalize_parquet_filters(filters)
+    column_index = {metadata.schema.column(i).path: i for i in range(metadata.num_columns)}
+
+    def _may_match(row_group, predicate: tuple) -> bool:
+        column, op, value = predicate
+        index = column_index.get(column)
+        if index is None or op not in _PARQUET_FILTER_OPERATORS:
+            return True
+        statistics = row_group.column(index).statistics
+        if statistics is None or not statistics.has_min_max:
+            return True
+        try:
+            return bool(_PARQUET_FILTER_OPERATORS[op](statistics.min, statistics.max, value))
+        except TypeError:
+            return True
+
+    row_groups = []
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        if not conjunctions or any([all([_may_match(row_group, p) for p in c]) for c in conjunctions]):
+            row_groups.append(i)
+    return row_groups
+
+
+def _parquet_column_ranges(metadata, row_groups: List[int], columns: Optional[List[str]]) -> List[Tuple[int, int]]:
+    """
+    get the byte-ranges of the column-chunks in the row-groups.
+
+    Args:
+        metadata: pyarrow.parquet.FileMetaData
+        row_groups: list of the index of the row-groups
+        columns: top-level column names, or None for all columns
+
+    Returns:
+        list of ``(start, end)``
+    """
+    ranges = []
+    for i in row_groups:
+        row_group = metadata.row_group(i)
+        for j in range(row_group.num_columns):
+            column_chunk = row_group.column(j)
+            column_path = column_chunk.path_in_schema
+            if columns is not None and not any([column_path == c or column_path.startswith(f"{c}.") for c in columns]):
+                continue
+            start = column_chunk.data_page_offset
+            if column_chunk.has_dictionary_page and column_chunk.dictionary_page_offset:
+                start = min(start, column_chunk.dictionary_page_offset)
+            ranges.append((start, start + column_chunk.total_compressed_size))
+    return ranges
+
+
+# the directory name of null partition value, written by Hive, Spark and pyarrow
+_HIVE_NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+
+def _hive_partitions(relative_path: str) -> Dict[str, Optional[str]]:
+    """
+    parse ``key=value`` directories in the path, such as ``date=2026-01-01/part-0.parquet``.
+
+    Args:
+        relative_path: file path relative to the root of the dataset
+
+    Returns:
+        dict of the partition column and its value in str, or None for the null partition
+    """
+    partitions = {}
+    for segment in relative_path.split("/")[:-1]:
+        if "=" not in segment:
+            continue
+        key, value = segment.split("=", 1)
+        value = unquote(value)
+        partitions[unquote(key)] = None if value == _HIVE_NULL_PARTITION else value
+    return partitions
+
+
+def _match_partition(partition_value: Optional[str], predicate: tuple) -> bool:
+    """
+    evaluate the predicate with the partition value,
+    which is converted to the type of the value in the predicate.
+
+    Args:
+        partition_value: value parsed from the path
+        predicate: ``(column, op, value)``
+
+    Returns:
+        True if the rows in the partition match the predicate
+    """
+    _, op, value = predicate
+    if op != "not in" and op not in _PARQUET_FILTER_OPERATORS:
+        raise AzfsInputError(f"operator `{op}` is not supported for the partition column")
+    if partition_value is None:
+        # null never matches the comparison, like SQL
+        return False
+    if op == "not in":
+        return not _match_partition(partition_value, (None, "in", value))
+    sample = list(value)[0] if op == "in" and len(value) > 0 else value
+    try:
+        if isinstance(sample, bool):
+            partition_value = partition_value.lower() == "true"
+        elif isinstance(sample, (int, float)):
+            partition_value = type(sample)(partition_value)
+        return bool(_PARQUET_FILTER_OPERATORS[op](partition_value, partition_value, value))
+    except (TypeError, ValueError):
+        return op == "!="
+
+
+def _prune_partition(partitions: Dict[str, Optional[str]], filters) -> Tuple[bool, Optional[list]]:
+    """
+    decide whether the file in the partition is read, from the predicates on the partition columns.
+    The other predicates are returned to be pushed down to the parquet reader.
+
+    Args:
+        partitions: partition values of the file, see ``_hive_partitions()``
+        filters: parquet filters in pyarrow style
+
+    Returns:
+        tuple of whether the file is read, and the filters for the file
+    """
+    conjunctions = _normalize_parquet_filters(filters)
+    if conjunctions is None:
+        # such as pyarrow Expression, which cannot be evaluated with the path
+        return True, filters
+    if not conjunctions:
+        return True, None
+    file_conjunctions = []
+    for conjunction in conjunctions:
+        rest = [p for p in conjunction if p[0] not in partitions]
+        if not all([_match_partition(partitions[p[0]], p) for p in conjunction if p[0] in partitions]):
+            continue
+        if not rest:
+            # all rows in the file match the conjunction
+            return True, None
+        file_conjunctions.append(rest)
+    if not file_conjunctions:
+        return False, None
+    return True, file_conjunctions
+
+
+def _attach_partitions(df: pd.DataFrame, partitions: Dict[str, Optional[str]]) -> pd.DataFrame:
+    """
+    add the partition values as the columns of the DataFrame.
+
+    Args:
+        df: DataFrame read from the file
+        partitions: partition values of the file
+
+    Returns:
+        pd.DataFrame
+    """
+    for key, value in partitions.items():
+        df[key] = value
+    return df
+
+
+class _ParquetSink(io.RawIOBase):
+    """
+    writable stream for ``pyarrow.parquet.ParquetWriter``,
+    which holds the encoded bytes only until they are taken with ``pop()``.
+    """
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def pop(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _iter_parquet_bytes(table, row_group_size: int, compression: Optional[str], **kwargs) -> Iterator[bytes]:
+    """
+    encode the table into parquet format row-group by row-group,
+    and yield the bytes written for each row-group, so that the whole encoded file is not held in memory.
+
+    Args:
+        table: pyarrow.Table
+        row_group_size: number of rows in each row-group
+        compression: compression codec, such as ``snappy``, ``gzip``, ``zstd`` or None
+        **kwargs: keywords to put pyarrow.parquet.ParquetWriter
+
+    Returns:
+        iterator of bytes
+    """
+    import pyarrow.parquet as pq
+    sink = _ParquetSink()
+    with pq.ParquetWriter(sink, table.schema, compression=compression, **kwargs) as writer:
+        for start in range(0, table.num_rows, row_group_size):
+            writer.write_table(table.slice(start, row_group_size), row_group_size=row_group_size)
+            yield sink.pop()
+    # the footer is written on close
+    yield sink.pop()
+
+
+_GLOB_MAGIC_CHARS = "*?["
+
+
+def _has_glob_magic(pattern: str) -> bool:
+    """
+    whether the pattern has ``*``, ``?`` or ``[``.
+    """
+    return any([c in pattern for c in _GLOB_MAGIC_CHARS])
+
+
+def _is_glob_pattern(pattern: str) -> bool:
+    """
+    whether the path is the pattern of ``glob()``, with the wildcards or ``{a,b}``.
+    """
+    return _has_glob_magic(pattern) or len(_expand_braces(pattern)) > 1
+
+
+def _expand_braces(pattern: str) -> List[str]:
+    """
+    expand the alternatives in the braces, such as ``data/{2025,2026}-*.csv``, and also the nested braces.
+    ``{`` without the closing ``}`` is a literal.
+
+    Args:
+        pattern: glob pattern
+
+    Returns:
+        list of the patterns without the braces, in the order of the alternatives
+    """
+    depth = 0
+    start = 0
+    for i, c in enumerate(pattern):
+        if c == "{":
+            if depth == 0:
+                start = i
+            depth += 1
+        elif c == "}" and depth > 0:
+            depth -= 1
+            if depth > 0:
+                continue
+            # split with the commas not in the nested braces
+            alternatives = []
+            level = 0
+            last = start + 1
+            for j in range(start + 1, i):
+                if pattern[j] == "{":
+                    level += 1
+                elif pattern[j] == "}":
+                    level -= 1
+                elif pattern[j] == "," and level == 0:
+                    alternatives.append(pattern[last:j])
+                    last = j + 1
+            alternatives.append(pattern[last:i])
+            expanded = []
+            for alternative in alternatives:
+                expanded.extend(_expand_braces(f"{pattern[:start]}{alternative}{pattern[i + 1:]}"))
+            return list(dict.fromkeys(expanded))
+    return [pattern]
+
+
+def _translate_glob_segment(segment: str) -> str:
+    """
+    translate one segment of the glob pattern between ``/`` to the regular expression.
+    ``*`` matches any chars except ``/``, ``?`` matches one char, and ``[...]`` or ``[!...]`` matches the class.
+
+    Args:
+        segment: glob pattern without ``/``
+
+    Returns:
+        regular expression
+    """
+    result = []
+    i = 0
+    n = len(segment)
+    while i < n:
+        c = segment[i]
+        i += 1
+        if c == "*":
+            # `**` in the segment is as same as `*`
+            while i < n and segment[i] == "*":
+                i += 1
+            result.append("[^/]*")
+        elif c == "?":
+            result.append("[^/]")
+        elif c == "[":
+            j = i
+            if j < n and segment[j] in "!^":
+                j += 1
+            if j < n and segment[j] == "]":
+                j += 1
+            while j < n and segment[j] != "]":
+                j += 1
+            if j >= n:
+                # `[` without the closing `]` is a literal
+                result.append(re.escape(c))
+                continue
+            chars = segment[i:j]
+            i = j + 1
+            negate = chars[0] in "!^"
+            if negate:
+                chars = chars[1:]
+            chars = "".join([f"\\{ch}" if ch in "\\^[]" else ch for ch in chars])
+            result.append(f"[^/{chars}]" if negate else f"[{chars}]")
+        else:
+            result.append(re.escape(c))
+    return "".join(result)
+
+
+@lru_cache(maxsize=256)
+def _compile_glob_segment(segment: str) -> Pattern:
+    """
+    compile the segment of the glob pattern once, to match the names listed in a directory.
+
+    Returns:
+        compiled regular expression
+    """
+    return re.compile(_translate_glob_segment(segment))
+
+
+@lru_cache(maxsize=256)
+def _compile_glob_path(segments: Tuple[str, ...]) -> Pattern:
+    """
+    compile the segments of the glob pattern with ``**``, to match the relative path listed recursively.
+    ``**`` matches zero or more directories, or any files under the directory at the last.
+
+    Returns:
+        compiled regular expression
+    """
+    result = []
+    for i, segment in enumerate(segments):
+        is_last = i == len(segments) - 1
+        if segment == "**":
+            result.append("(?:[^/]+/)*[^/]+" if is_last else "(?:[^/]+/)*")
+        else:
+            result.append(_translate_glob_segment(segment) if is_last else f"{_translate_glob_segment(segment)}/")
+    return re.compile("".join(result))
+
+
+def _glob_literal_prefix(segment: str) -> str:
+    """
+    chars before the first wildcard of the segment, to narrow the listing.
+    """
+    for i, c in enumerate(segment):
+        if c in _GLOB_MAGIC_CHARS:
+            return segment[:i]
+    return segment
 
 
 class DataFrameReader:
@@ -131,15 +1067,28 @@ class DataFrameReader:
             path: Union[str, List[str]] = None,
             use_mp=False,
             cpu_count: Optional[int] = None,
-            file_format: Optional[str] = None):
+            file_format: Optional[str] = None,
+            split_size: Optional[int] = None,
+            io_concurrency: Optional[int] = None,
+            pool=None,
+            shared_memory: bool = False):
         self._azc: AzFileClient = _azc
         # DefaultCredential cannot be pickle (when use multiprocessing), so make it None
         self._credential = credential if type(credential) is str else None
+        # size of each file listed by glob(), to dispatch the large files first
+        self._sizes: Dict[str, int] = {}
         self.path: Optional[List[str]] = self._decode_path(path=path)
         self.file_format = file_format
         self.use_mp = use_mp
         self.cpu_count = mp.cpu_count() if cpu_count is None else cpu_count
+        self.split_size = split_size
+        self.io_concurrency = io_concurrency
+        self._pool = pool
+        self.shared_memory = shared_memory
         self._apply_method = None
+        self._select = None
+        self._where = None
+        self._limit = None
 
     def _decode_path(self, path: Optional[Union[str, List[str]]]) -> Optional[List[str]]:
         """
@@ -154,8 +1103,10 @@ class DataFrameReader:
         if path is None:
             return None
         elif type(path) is str:
-            if "*" in path:
-                decoded_path = self._azc.glob(pattern_path=path)
+            if _is_glob_pattern(path):
+                file_list = self._azc.glob(pattern_path=path, detail=True)
+                self._sizes.update({f["name"]: f["size"] for f in file_list if f["size"] is not None})
+                decoded_path = [f["name"] for f in file_list]
             else:
                 decoded_path = [path]
         elif type(path) is list:
@@ -164,95 +1115,271 @@ class DataFrameReader:
             raise AzfsInputError("path must be `str` or `list`")
         return decoded_path
 
-    def csv(self, path: Union[str, List[str]] = None, **kwargs) -> pd.DataFrame:
+    def csv(self, path: Union[str, List[str]] = None, **kwargs) -> pd.DataFrame:
+        """
+        read csv files in Azure Blob, like PySpark-method.
+
+        Args:
+            path: azure blob path
+            **kwargs: as same as pandas.read_csv
+
+        Returns:
+            pd.DataFrame
+
+        Examples:
+            >>> import azfs
+            >>> azc = azfs.AzFileClient()
+            >>> blob_path = "https://testazfs.blob.core.windows.net/test_container/test1.csv"
+            >>> df = azc.read().csv(blob_path)
+            # result is as same as azc.read_csv(blob_path)
+            >>> blob_path_list = [
+            ...     "https://testazfs.blob.core.windows.net/test_container/test1.csv",
+            ...     "https://testazfs.blob.core.windows.net/test_container/test2.csv"
+            ... ]
+            >>> df = azc.read().csv(blob_path_list)
+            # result is as same as pd.concat([each data-frame])
+            # in addition, you can use `*`
+            >>> blob_path_pattern = "https://testazfs.blob.core.windows.net/test_container/test*.csv"
+            >>> df = azc.read().csv(blob_path_pattern)
+            # you can use multiprocessing with `use_mp` argument
+            >>> df = azc.read(use_mp=True).csv(blob_path_pattern)
+            # if you want to filter or apply some method, you can use your defined function as below
+            >>> def filter_function(_df: pd.DataFrame, _id: str) -> pd.DataFrame:
+            ...     return _df[_df['id'] == _id]
+            >>> df = azc.read(use_mp=True).apply(function=filter_function, _id="aaa").csv(blob_path_pattern)
+
+
+        """
+        self.file_format = "csv"
+        if path is not None:
+            self.path = self._decode_path(path=path)
+        return self._load(**kwargs)
+
+    def parquet(self, path: Union[str, List[str]] = None) -> pd.DataFrame:
+        """
+        read parquet files in Azure Blob, like PySpark-method.
+
+        Args:
+            path: azure blob path
+
+        Returns:
+            pd.DataFrame
+
+        """
+        self.file_format = "parquet"
+        if path is not None:
+            self.path = self._decode_path(path=path)
+        return self._load()
+
+    def parquet_dataset(
+            self,
+            root: str,
+            filters=None,
+            columns: Optional[List[str]] = None,
+            max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> Optional[pd.DataFrame]:
+        """
+        read the parquet dataset partitioned in hive-style directories, such as ``root/date=2026-01-01/part-0.parquet``.
+        The files are listed with one request, and the partitions are pruned with ``filters`` before downloading.
+        The predicates on the other columns and ``columns`` are pushed down to ``read_parquet()`` for each file.
+
+        Args:
+            root: root directory of the dataset
+            filters: filters in pyarrow style, such as ``[("date", ">=", "2026-01-01")]``,
+                default the filters of ``where()``
+            columns: columns to read, including the partition columns, default the columns of ``select()``
+            max_concurrency: number of threads to read the files, when not use multiprocessing
+
+        Returns:
+            pd.DataFrame, whose partition columns hold the values in str. None if no file is matched.
+
+        Examples:
+            >>> import azfs
+            >>> azc = azfs.AzFileClient()
+            >>> root = "https://testazfs.blob.core.windows.net/test_container/table"
+            >>> df = azc.read().parquet_dataset(
+            ...     root,
+            ...     filters=[("date", ">=", "2026-01-01"), ("date", "<", "2026-01-08")],
+            ...     columns=["date", "id", "value"])
+            # files in the partitions can be read with multiprocessing
+            >>> df = azc.read(use_mp=True).parquet_dataset(root, filters=[("date", "=", "2026-01-01")])
+
+        """
+        self.file_format = "parquet"
+        if columns is None:
+            columns = self._select
+        if filters is None and not isinstance(self._where, str):
+            filters = self._where
+        root = root if root.endswith("/") else f"{root}/"
+        url, account_kind, container_name, root_folder = BlobPathDecoder(root).get_with_url()
+        base_path = f"{url}/{container_name}/"
+        root_folder = root_folder if root_folder.endswith("/") else f"{root_folder}/"
+        file_list = \
+            self._azc._client.get_client(account_kind=account_kind).ls_detail(path=base_path, file_path=root_folder)
+
+        tasks = []
+        for file_detail in sorted(file_list, key=lambda x: x["name"]):
+            f = file_detail["name"]
+            file_name = f.rsplit("/", 1)[-1]
+            # DataLake also lists the directories, and only the directories are parsed as the partitions
+            if file_detail["is_directory"] or not file_name or file_name[0] in "_.":
+                continue
+            partitions = _hive_partitions(f[len(root_folder):])
+            is_read, file_filters = _prune_partition(partitions=partitions, filters=filters)
+            if not is_read:
+                continue
+            # the stages are already applied as `columns` and `filters`, except the expression of `where`
+            task = {"path": f"{base_path}{f}", "filters": file_filters, "select": None}
+            if not isinstance(self._where, str):
+                task["where"] = None
+            if columns is not None:
+                task["columns"] = [c for c in columns if c not in partitions]
+                partitions = {k: v for k, v in partitions.items() if k in columns}
+            if partitions:
+                task["partitions"] = partitions
+            if file_detail["size"] is not None:
+                self._sizes[task["path"]] = file_detail["size"]
+            tasks.append(task)
+
+        self.path = [task["path"] for task in tasks]
+        df = self._load(tasks=tasks, max_workers=max_concurrency)
+        if df is not None and columns is not None:
+            df = df[[c for c in columns if c in df.columns]]
+        return df
+
+    def pickle(self, path: Union[str, List[str]] = None, compression: str = "gzip") -> pd.DataFrame:
+        """
+        read pickle files in Azure Blob, like PySpark-method.
+
+        Args:
+            path: azure blob path
+            compression: acceptable keywords are: gzip, bz2, xz. gzip is default value.
+
+        Returns:
+            pd.DataFrame
+
+        """
+        self.file_format = "pickle"
+        if path is not None:
+            self.path = self._decode_path(path=path)
+        return self._load(compression=compression)
+
+    def iter_csv(
+            self,
+            path: Union[str, List[str]] = None,
+            max_in_flight: Optional[int] = None,
+            **kwargs) -> Iterator[Tuple[str, pd.DataFrame]]:
         """
-        read csv files in Azure Blob, like PySpark-method.
+        read csv files in Azure Blob, and yield each pd.DataFrame as soon as the file is read.
+        The files are read with the threads of ``io_concurrency`` or the processes of ``use_mp``,
+        and at most ``max_in_flight`` results are held until consumed, so the memory does not grow with the files.
 
         Args:
             path: azure blob path
+            max_in_flight: number of the files read at the same time, default twice the number of workers
             **kwargs: as same as pandas.read_csv
 
         Returns:
-            pd.DataFrame
+            iterator of tuple of the path and pd.DataFrame, in the order of completion
 
         Examples:
             >>> import azfs
             >>> azc = azfs.AzFileClient()
-            >>> blob_path = "https://testazfs.blob.core.windows.net/test_container/test1.csv"
-            >>> df = azc.read().csv(blob_path)
-            # result is as same as azc.read_csv(blob_path)
-            >>> blob_path_list = [
-            ...     "https://testazfs.blob.core.windows.net/test_container/test1.csv",
-            ...     "https://testazfs.blob.core.windows.net/test_container/test2.csv"
-            ... ]
-            >>> df = azc.read().csv(blob_path_list)
-            # result is as same as pd.concat([each data-frame])
-            # in addition, you can use `*`
-            >>> blob_path_pattern = "https://testazfs.blob.core.windows.net/test_container/test*.csv"
-            >>> df = azc.read().csv(blob_path_pattern)
-            # you can use multiprocessing with `use_mp` argument
-            >>> df = azc.read(use_mp=True).csv(blob_path_pattern)
-            # if you want to filter or apply some method, you can use your defined function as below
-            >>> def filter_function(_df: pd.DataFrame, _id: str) -> pd.DataFrame:
-            ...     return _df[_df['id'] == _id]
-            >>> df = azc.read(use_mp=True).apply(function=filter_function, _id="aaa").csv(blob_path_pattern)
-
+            >>> blob_path_pattern = "https://testazfs.blob.core.windows.net/test_container/2026-*.csv"
+            >>> total = 0
+            >>> for path, df in azc.read(use_mp=True).iter_csv(blob_path_pattern):
+            ...     total += df["value"].sum()
 
         """
         self.file_format = "csv"
         if path is not None:
             self.path = self._decode_path(path=path)
-        return self._load(**kwargs)
+        return self._iter_load(max_in_flight=max_in_flight, **kwargs)
 
-    def parquet(self, path: Union[str, List[str]] = None) -> pd.DataFrame:
+    def iter_parquet(
+            self,
+            path: Union[str, List[str]] = None,
+            max_in_flight: Optional[int] = None,
+            **kwargs) -> Iterator[Tuple[str, pd.DataFrame]]:
         """
-        read parquet files in Azure Blob, like PySpark-method.
+        read parquet files in Azure Blob, and yield each pd.DataFrame as soon as the file is read.
+        See ``iter_csv()``.
 
         Args:
             path: azure blob path
+            max_in_flight: number of the files read at the same time, default twice the number of workers
+            **kwargs: keywords to put ``read_parquet()``, such as ``columns`` and ``filters``
 
         Returns:
-            pd.DataFrame
+            iterator of tuple of the path and pd.DataFrame, in the order of completion
+
+        Examples:
+            >>> import azfs
+            >>> azc = azfs.AzFileClient()
+            >>> blob_path_pattern = "https://testazfs.blob.core.windows.net/test_container/*.parquet"
+            >>> for path, df in azc.read(io_concurrency=8).iter_parquet(blob_path_pattern, columns=["value"]):
+            ...     print(path, df["value"].sum())
 
         """
         self.file_format = "parquet"
         if path is not None:
             self.path = self._decode_path(path=path)
-        return self._load()
+        return self._iter_load(max_in_flight=max_in_flight, **kwargs)
 
-    def pickle(self, path: Union[str, List[str]] = None, compression: str = "gzip") -> pd.DataFrame:
+    def to_arrow(self, path: Union[str, List[str]] = None, file_format: Optional[str] = None, **kwargs):
         """
-        read pickle files in Azure Blob, like PySpark-method.
+        read files in Azure Blob as one pyarrow.Table.
+        Parquet files are read as pyarrow.Table directly, and the other formats are converted from pd.DataFrame.
+        The tables are concatenated without copying the data, instead of ``pd.concat()``.
+        The index of pd.DataFrame is not kept.
 
         Args:
             path: azure blob path
-            compression: acceptable keywords are: gzip, bz2, xz. gzip is default value.
+            file_format: ``csv``, ``parquet`` or ``pickle``, default the format given to ``read()``
+            **kwargs: keywords to put read_* function, such as ``columns`` for parquet
 
         Returns:
-            pd.DataFrame
+            pyarrow.Table, or None if no file is read
+
+        Examples:
+            >>> import azfs
+            >>> azc = azfs.AzFileClient()
+            >>> blob_path_pattern = "https://testazfs.blob.core.windows.net/test_container/*.parquet"
+            >>> table = azc.read(file_format="parquet").to_arrow(blob_path_pattern)
+            >>> table = azc.read(use_mp=True).to_arrow(blob_path_pattern, file_format="parquet", columns=["id"])
 
         """
-        self.file_format = "pickle"
+        if file_format is not None:
+            self.file_format = file_format
         if path is not None:
             self.path = self._decode_path(path=path)
-        return self._load(compression=compression)
+        return self._load(as_arrow=True, **kwargs)
 
-    def _load_function(self) -> callable:
+    def arrow(self, path: Union[str, List[str]] = None, file_format: Optional[str] = None, **kwargs) -> pd.DataFrame:
         """
-        get read_* function according to the file_format
+        read files in Azure Blob via pyarrow.Table, see ``to_arrow()``.
+        The concatenated table is converted to pd.DataFrame only once,
+        and the converted columns are released from the table during the conversion,
+        so that the peak memory is lower than ``pd.concat()`` of many files.
+
+        Args:
+            path: azure blob path
+            file_format: ``csv``, ``parquet`` or ``pickle``, default the format given to ``read()``
+            **kwargs: keywords to put read_* function
 
         Returns:
+            pd.DataFrame, or None if no file is read
+
+        Examples:
+            >>> import azfs
+            >>> azc = azfs.AzFileClient()
+            >>> blob_path_pattern = "https://testazfs.blob.core.windows.net/test_container/*.parquet"
+            >>> df = azc.read(use_mp=True, file_format="parquet").arrow(blob_path_pattern)
 
         """
-        if self.file_format == "csv":
-            load_function = self._azc.read_csv
-        elif self.file_format == "parquet":
-            load_function = self._azc.read_parquet
-        elif self.file_format == "pickle":
-            load_function = self._azc.read_pickle
-        else:
-            raise AzfsInputError("file_format is incorrect")
-        return load_function
+        table = self.to_arrow(path=path, file_format=file_format, **kwargs)
+        if table is None:
+            return None
+        return table.to_pandas(split_blocks=True, self_destruct=True)
 
     def apply(self, *, function: callable, **kwargs):
         """
@@ -271,34 +1398,516 @@ class DataFrameReader:
             self._apply_method = function
         return self
 
-    def _load(self, **kwargs) -> Optional[pd.DataFrame]:
+    def select(self, *columns):
+        """
+        read only the columns.
+        The columns are pushed down to the reader, as ``columns`` of parquet and ``usecols`` of csv,
+        and selected in each worker before the result is returned.
+
+        Args:
+            *columns: column names, or one list of them
+
+        Returns:
+            self
+
+        Examples:
+            >>> import azfs
+            >>> azc = azfs.AzFileClient()
+            >>> blob_path_pattern = "https://testazfs.blob.core.windows.net/test_container/*.parquet"
+            >>> df = azc.read(use_mp=True).select("id", "value").parquet(blob_path_pattern)
+
+        """
+        if len(columns) == 1 and isinstance(columns[0], (list, tuple)):
+            columns = columns[0]
+        self._select = list(columns)
+        return self
+
+    def where(self, expr):
+        """
+        read only the rows matched with the predicates.
+        The filters in pyarrow style are pushed down to parquet, to prune the row-groups,
+        and evaluated in each worker before the result is returned for the other formats.
+        The expression of ``pd.DataFrame.query()`` is evaluated in each worker.
+
+        Args:
+            expr: filters such as ``[("date", ">=", "2026-01-01")]``, or str such as ``"value > 0"``
+
+        Returns:
+            self
+
+        Examples:
+            >>> import azfs
+            >>> azc = azfs.AzFileClient()
+            >>> blob_path_pattern = "https://testazfs.blob.core.windows.net/test_container/*.csv"
+            >>> df = azc.read(use_mp=True).select("id").where([("value", ">", 0)]).csv(blob_path_pattern)
+            >>> df = azc.read().where("value > 0 and id < 100").csv(blob_path_pattern)
+
+        """
+        if not isinstance(expr, str) and _normalize_parquet_filters(expr) is None:
+            raise AzfsInputError("`where` must be the filters in the list, or str")
+        self._where = expr
+        return self
+
+    def limit(self, n: int):
+        """
+        read only the first ``n`` rows, as same as ``head(n)`` of all the files.
+        The files are read in the order, and the rest are cancelled once ``n`` rows are collected.
+        Csv parses at most ``n`` rows of each file, unless ``where()`` or ``apply()`` filters them.
+
+        Args:
+            n: number of the rows
+
+        Returns:
+            self
+
+        Examples:
+            >>> import azfs
+            >>> azc = azfs.AzFileClient()
+            >>> blob_path_pattern = "https://testazfs.blob.core.windows.net/test_container/*.csv"
+            >>> df = azc.read(io_concurrency=8).limit(100).csv(blob_path_pattern)
+
+        """
+        if type(n) is not int or n < 0:
+            raise AzfsInputError("`limit` must be the non-negative int")
+        self._limit = n
+        return self
+
+    def _split_path(self) -> List[dict]:
+        """
+        split each file into byte-ranges of ``split_size``, if the file can be split by lines.
+
+        Returns:
+            list of dict, which has ``path`` and also ``start``, ``end`` if the file is split
+        """
+        if self.split_size is None or self.file_format != "csv":
+            return [{"path": f} for f in self.path]
+        tasks = []
+        for f in self.path:
+            if f.endswith(".gz"):
+                tasks.append({"path": f})
+                continue
+            for start, end in self._azc.plan_splits(path=f, split_size=self.split_size):
+                tasks.append({"path": f, "start": start, "end": end})
+        return tasks
+
+    def _get_pool(self):
+        """
+        get the pool given to ``read()``, or the persistent pool of the client.
+
+        Returns:
+            multiprocessing.pool.Pool
+        """
+        if self._pool is not None:
+            return self._pool
+        return self._azc.get_pool(processes=self.cpu_count)
+
+    def _schedule(self, tasks: List[dict]) -> List[int]:
+        """
+        order to dispatch the tasks, the largest first, so that a large file is not left to the end with idle workers.
+        The size is the byte-range of the split, or the size listed by ``glob()``, and the unknown size is the last.
+
+        Args:
+            tasks: list of dict, which has ``path`` and also keywords for each file
+
+        Returns:
+            list of the index of the tasks
+        """
+        def _size(index: int) -> int:
+            task = tasks[index]
+            if "end" in task:
+                return task["end"] - task["start"]
+            return self._sizes.get(task["path"]) or 0
+
+        # sorted() is stable, so the files of the same or unknown size are dispatched in the original order
+        return sorted(range(len(tasks)), key=_size, reverse=True)
+
+    def _limit_params(self, kwargs: dict) -> dict:
+        """
+        push ``limit()`` down to pd.read_csv() as ``nrows``, when no row of each file is filtered after read.
+
+        Returns:
+            dict, keywords to put read_* function
+        """
+        if self.file_format != "csv" or self._where is not None or self._apply_method is not None:
+            return kwargs
+        if "nrows" in kwargs:
+            return kwargs
+        return dict(kwargs, nrows=self._limit)
+
+    def _load(
+            self,
+            tasks: Optional[List[dict]] = None,
+            max_workers: int = 1,
+            as_arrow: bool = False,
+            **kwargs):
+        """
+        read the files, and concat them.
+        The files are dispatched largest-first to the idle worker one by one, and concatenated in the original order.
+
+        Args:
+            tasks: list of dict, which has ``path`` and also keywords for each file, default ``_split_path()``
+            max_workers: number of threads to read the files, when not use multiprocessing
+            as_arrow: read each file as pyarrow.Table, and concat them without copy
+            **kwargs: keywords to put read_* function
+
+        Returns:
+            pd.DataFrame, or pyarrow.Table if ``as_arrow``. None if no file is read
+        """
         if self.path is None:
             raise AzfsInputError("input azure blob path")
 
-        if self.use_mp:
-            params_list = []
-            for f in self.path:
-                _input = {
-                    "path": f,
-                    "file_format": self.file_format,
-                    "credential": self._credential,
-                    "apply_method": self._apply_method
-                }
-                _input.update(kwargs)
-                params_list.append(_input)
-            with mp.Pool(self.cpu_count) as pool:
-                df_list = pool.map(_wrap_quick_load, params_list)
-            pool.join()
+        if tasks is None:
+            tasks = self._split_path()
+        if self.io_concurrency is not None:
+            max_workers = self.io_concurrency
+        if self._limit is not None:
+            return self._load_limit(tasks=tasks, max_workers=max_workers, as_arrow=as_arrow, **kwargs)
+
+        order = self._schedule(tasks=tasks)
+        if self.use_mp and self.io_concurrency is not None:
+            df_list = self._load_hybrid(tasks=tasks, order=order, as_arrow=as_arrow, **kwargs)
+        elif self.use_mp:
+            # apply_async() is taken by the idle worker one by one, instead of the fixed chunks of pool.map()
+            pool = self._get_pool()
+            results = [None] * len(tasks)
+            for index in order:
+                _input = self._worker_params(task=tasks[index], as_arrow=as_arrow, **kwargs)
+                results[index] = pool.apply_async(_wrap_quick_load, (_input, ))
+            df_list = [_from_shared_memory(result.get()) for result in results]
         else:
-            load_function = self._load_function()
-            if self._apply_method is None:
-                df_list = [load_function(f, **kwargs) for f in self.path]
+            def _load_task(task: dict) -> pd.DataFrame:
+                return self._read_task(task=task, as_arrow=as_arrow, **kwargs)
+
+            if max_workers > 1 and len(tasks) > 1:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = [None] * len(tasks)
+                    for index in order:
+                        futures[index] = executor.submit(_load_task, tasks[index])
+                    df_list = [future.result() for future in futures]
             else:
-                df_list = [self._apply_method(load_function(f, **kwargs)) for f in self.path]
+                df_list = [_load_task(task) for task in tasks]
+        return self._concat(df_list=df_list, as_arrow=as_arrow)
+
+    def _load_limit(self, tasks: List[dict], max_workers: int = 1, as_arrow: bool = False, **kwargs):
+        """
+        read the files in the original order until ``limit()`` rows are collected, and cancel the rest.
+        The result is as same as ``head()`` of all the files.
+
+        Returns:
+            pd.DataFrame, or pyarrow.Table if ``as_arrow``. None if no file is read
+        """
+        frames = {}
+        collected = 0
+        next_index = 0
+        results = self._iter_tasks(
+            tasks=tasks,
+            order=list(range(len(tasks))),
+            max_workers=max_workers,
+            as_arrow=as_arrow,
+            **self._limit_params(kwargs))
+        try:
+            for index, df in results:
+                frames[index] = df
+                # count only the files without a gap from the first one, the first file is kept for the columns
+                while next_index in frames and (next_index == 0 or collected < self._limit):
+                    collected += len(frames[next_index])
+                    next_index += 1
+                if next_index > 0 and collected >= self._limit:
+                    break
+        finally:
+            # the files not read yet are cancelled
+            results.close()
+        df = self._concat(df_list=[frames[index] for index in range(next_index)], as_arrow=as_arrow)
+        if df is None:
+            return None
+        return df.slice(0, self._limit) if as_arrow else df.head(self._limit)
+
+    @staticmethod
+    def _concat(df_list: list, as_arrow: bool = False):
+        """
+        concat the results of the files.
+
+        Returns:
+            pd.DataFrame, or pyarrow.Table if ``as_arrow``. None if no file is read
+        """
         if len(df_list) == 0:
             return None
+        if as_arrow:
+            import pyarrow as pa
+            # only the list of the chunks is concatenated, and the columns missing in some files are filled with null
+            return pa.concat_tables(df_list, promote_options="permissive")
         return pd.concat(df_list)
 
+    def _load_hybrid(self, tasks: List[dict], order: List[int], as_arrow: bool = False, **kwargs) -> list:
+        """
+        download the files with ``io_concurrency`` threads in this process,
+        and parse each downloaded data with ``cpu_count`` processes as soon as it is downloaded.
+
+        Args:
+            tasks: list of dict, which has ``path`` and also keywords for each file
+            order: order to download the tasks, see ``_schedule()``
+            as_arrow: return pyarrow.Table instead of pd.DataFrame
+            **kwargs: keywords to put read_* function
+
+        Returns:
+            list of pd.DataFrame, or pyarrow.Table if ``as_arrow``, in the order of ``tasks``
+        """
+        def _fetch(task: dict) -> bytes:
+            return _fetch_bytes(azc=self._azc, file_format=self.file_format, **dict(kwargs, **task))
+
+        pool = self._get_pool()
+        results = [None] * len(tasks)
+        with ThreadPoolExecutor(max_workers=self.io_concurrency) as executor:
+            futures = {executor.submit(_fetch, tasks[index]): index for index in order}
+            for future in as_completed(futures):
+                index = futures[future]
+                _input = self._parse_params(task=tasks[index], data=future.result(), as_arrow=as_arrow, **kwargs)
+                results[index] = pool.apply_async(_wrap_parse_bytes, (_input, ))
+        return [_from_shared_memory(result.get()) for result in results]
+
+    def _read_task(self, task: dict, as_arrow: bool = False, **kwargs):
+        """
+        read the file of the task in this process.
+
+        Returns:
+            pd.DataFrame, or pyarrow.Table if ``as_arrow``
+        """
+        _input = {"apply_method": self._apply_method, "select": self._select, "where": self._where}
+        _input.update(kwargs)
+        _input.update(task)
+        return _read_frame(azc=self._azc, file_format=self.file_format, as_arrow=as_arrow, **_input)
+
+    def _worker_params(self, task: dict, as_arrow: bool = False, **kwargs) -> dict:
+        """
+        keywords to put ``_wrap_quick_load()`` in the worker process.
+
+        Returns:
+            dict
+        """
+        _input = {
+            "file_format": self.file_format,
+            "credential": self._credential,
+            "apply_method": self._apply_method,
+            "disk_cache": self._azc._disk_cache,
+            "parsed_cache": self._azc._parsed_cache,
+            "as_arrow": as_arrow,
+            "shared_memory": self.shared_memory,
+            "select": self._select,
+            "where": self._where
+        }
+        _input.update(kwargs)
+        _input.update(task)
+        return _input
+
+    def _parse_params(self, task: dict, data: bytes, as_arrow: bool = False, **kwargs) -> dict:
+        """
+        keywords to put ``_wrap_parse_bytes()`` in the worker process.
+
+        Returns:
+            dict
+        """
+        _input = {
+            "data": data,
+            "file_format": self.file_format,
+            "apply_method": self._apply_method,
+            "as_arrow": as_arrow,
+            "shared_memory": self.shared_memory,
+            "select": self._select,
+            "where": self._where
+        }
+        _input.update(kwargs)
+        _input.update(task)
+        return _input
+
+    def _iter_load(
+            self,
+            tasks: Optional[List[dict]] = None,
+            max_in_flight: Optional[int] = None,
+            **kwargs) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        read the files, and yield each result in the order of completion.
+        At most ``max_in_flight`` files are read or held at the same time, until the results are consumed.
+        The files are dispatched largest-first, or in the original order until ``limit()`` rows are yielded.
+
+        Args:
+            tasks: list of dict, which has ``path`` and also keywords for each file, default ``_split_path()``
+            max_in_flight: number of the files read at the same time, default twice the number of workers
+            **kwargs: keywords to put read_* function
+
+        Returns:
+            iterator of tuple of the path and pd.DataFrame
+        """
+        if self.path is None:
+            raise AzfsInputError("input azure blob path")
+        if tasks is None:
+            tasks = self._split_path()
+        if self._limit is None:
+            results = self._iter_tasks(
+                tasks=tasks, order=self._schedule(tasks=tasks), max_in_flight=max_in_flight, **kwargs)
+        else:
+            results = self._iter_tasks(
+                tasks=tasks, order=list(range(len(tasks))), max_in_flight=max_in_flight, **self._limit_params(kwargs))
+        return self._iter_paths(tasks=tasks, results=results, limit=self._limit)
+
+    def _iter_tasks(
+            self,
+            tasks: List[dict],
+            order: List[int],
+            max_workers: int = 1,
+            max_in_flight: Optional[int] = None,
+            **kwargs) -> Iterator[Tuple[int, Any]]:
+        """
+        read the tasks in ``order``, and yield each result in the order of completion.
+
+        Args:
+            tasks: list of dict, which has ``path`` and also keywords for each file
+            order: order to dispatch the tasks
+            max_workers: number of threads to read the files, when not use multiprocessing
+            max_in_flight: number of the files read at the same time, default twice the number of workers
+            **kwargs: keywords to put read_* function
+
+        Returns:
+            iterator of tuple of the index of the task and the result
+        """
+        if self.use_mp and self.io_concurrency is None:
+            window = max_in_flight if max_in_flight is not None else 2 * self.cpu_count
+            return self._iter_pool(tasks=tasks, order=order, window=window, **kwargs)
+
+        if self.use_mp:
+            # download with the threads, and parse with the processes
+            pool = self._get_pool()
+
+            def _run(task: dict) -> pd.DataFrame:
+                data = _fetch_bytes(azc=self._azc, file_format=self.file_format, **dict(kwargs, **task))
+                _input = self._parse_params(task=task, data=data, **kwargs)
+                return _from_shared_memory(pool.apply(_wrap_parse_bytes, (_input, )))
+        else:
+            def _run(task: dict) -> pd.DataFrame:
+                return self._read_task(task=task, **kwargs)
+        if self.io_concurrency is not None:
+            max_workers = self.io_concurrency
+        window = max_in_flight if max_in_flight is not None else 2 * max_workers
+        return self._iter_threads(tasks=tasks, order=order, function=_run, max_workers=max_workers, window=window)
+
+    @staticmethod
+    def _iter_paths(
+            tasks: List[dict],
+            results: Iterator[Tuple[int, pd.DataFrame]],
+            limit: Optional[int] = None) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        yield the path of the task with each result, and stop after ``limit`` rows are yielded.
+
+        Returns:
+            iterator of tuple of the path and pd.DataFrame
+        """
+        collected = 0
+        try:
+            for index, df in results:
+                if limit is not None:
+                    df = df.head(limit - collected)
+                    collected += len(df)
+                yield tasks[index]["path"], df
+                if limit is not None and collected >= limit:
+                    return
+        finally:
+            results.close()
+
+    @staticmethod
+    def _iter_threads(
+            tasks: List[dict],
+            order: List[int],
+            function: Callable,
+            max_workers: int,
+            window: int) -> Iterator[Tuple[int, Any]]:
+        """
+        call ``function(task)`` with the threads in ``order``, and yield the results in the order of completion.
+        Each task is submitted when a previous one is completed, so the idle thread takes the next one.
+
+        Returns:
+            iterator of tuple of the index of the task and the result
+        """
+        if max_workers <= 1:
+            for index in order:
+                yield index, function(tasks[index])
+            return
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        pending = {}
+        order_iter = iter(order)
+        try:
+            while True:
+                for index in order_iter:
+                    pending[executor.submit(function, tasks[index])] = index
+                    if len(pending) >= window:
+                        break
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), future.result()
+        finally:
+            # stop reading the rest, when the iterator is closed
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _iter_pool(
+            self,
+            tasks: List[dict],
+            order: List[int],
+            window: int,
+            **kwargs) -> Iterator[Tuple[int, pd.DataFrame]]:
+        """
+        read the files with the processes in ``order``, and yield the results in the order of completion.
+
+        Returns:
+            iterator of tuple of the index of the task and pd.DataFrame
+        """
+        pool = self._get_pool()
+        results = queue.Queue()
+        lock = threading.Lock()
+        closed = False
+
+        def _callback(index: int):
+            def _put(result):
+                with lock:
+                    if closed:
+                        # the iterator is already closed, so nobody attaches the result
+                        _discard_shared_memory(result)
+                    else:
+                        results.put((index, result, None))
+
+            def _put_error(error: BaseException):
+                results.put((index, None, error))
+            return _put, _put_error
+
+        in_flight = 0
+        order_iter = iter(order)
+        try:
+            while True:
+                for index in order_iter:
+                    callback, error_callback = _callback(index=index)
+                    pool.apply_async(
+                        _wrap_quick_load,
+                        (self._worker_params(task=tasks[index], **kwargs), ),
+                        callback=callback,
+                        error_callback=error_callback)
+                    in_flight += 1
+                    if in_flight >= window:
+                        break
+                if in_flight == 0:
+                    break
+                index, result, error = results.get()
+                in_flight -= 1
+                if error is not None:
+                    raise error
+                yield index, _from_shared_memory(result)
+        finally:
+            with lock:
+                closed = True
+                while not results.empty():
+                    _discard_shared_memory(results.get()[1])
+
 
 class AzFileClient:
     """
@@ -427,46 +2036,161 @@ class AzFileClient:
     # instance for context manager
     _az_context_manager = AzContextManager()
 
-    def __init__(
-            self,
-            credential: Optional[Union[str, DefaultAzureCredential]] = None,
-            connection_string: Optional[str] = None):
+    def __init__(
+            self,
+            credential: Optional[Union[str, DefaultAzureCredential]] = None,
+            connection_string: Optional[str] = None,
+            disk_cache: Optional[DiskCache] = None,
+            memory_cache: Optional[MemoryCache] = None,
+            parsed_cache: Optional[ParsedCache] = None):
+        """
+        if every argument is None, set credential as DefaultAzureCredential().
+
+        Args:
+            credential: if string, Blob Storage -> Access Keys -> Key
+            connection_string: connection_string
+            disk_cache: if set, downloaded files are cached on the local disk, and validated by ETag
+            memory_cache: if set, small files are cached in memory, and revalidated by ETag after the ttl.
+                The memory cache is looked up before the disk cache.
+            parsed_cache: if set, pd.DataFrame parsed by ``read_*`` is cached on the local disk,
+                and validated by ETag and the keywords
+        """
+        if credential is None and connection_string is None:
+            credential = DefaultAzureCredential()
+        self._client = AzfsClient(credential=credential, connection_string=connection_string)
+        self._credential = credential
+        self._disk_cache = disk_cache
+        self._memory_cache = memory_cache
+        self._parsed_cache = parsed_cache
+        self._pool = None
+        self._pool_processes = None
+        self._pool_finalizer = None
+        self._pool_lock = threading.Lock()
+
+    def __enter__(self):
+        """
+        add some functions to pandas module based on AzContextManger()
+
+        Returns:
+            instance of AzFileClient
+
+        """
+        self._az_context_manager.attach(client=self)
+        return self
+
+    def __exit__(self, exec_type, exec_value, traceback):
+        """
+        remove some functions from pandas module based on AzContextManager()
+
+        Args:
+            exec_type:
+            exec_value:
+            traceback:
+
+        Returns:
+            None
+        """
+        self._az_context_manager.detach()
+
+    def close(self):
+        """
+        close the cached service clients, and release their connection-pool.
+        The clients are created again when the next method is called.
+
+        Returns:
+            None
+
+        Examples:
+            >>> import azfs
+            >>> azc = azfs.AzFileClient()
+            >>> csv_path = "https://testazfs.blob.core.windows.net/test_container/test1.csv"
+            >>> df = azc.read_csv(path=csv_path)
+            >>> azc.close()
+
         """
-        if every argument is None, set credential as DefaultAzureCredential().
+        self.close_pool()
+        self._client.close()
 
-        Args:
-            credential: if string, Blob Storage -> Access Keys -> Key
-            connection_string: connection_string
+    def create_pool(self, processes: Optional[int] = None):
         """
-        if credential is None and connection_string is None:
-            credential = DefaultAzureCredential()
-        self._client = AzfsClient(credential=credential, connection_string=connection_string)
-        self._credential = credential
+        create the process pool, whose workers create the client and the credential only once when started,
+        and reuse them among the tasks.
+        The pool can be given to ``read(pool=...)``, and must be closed by the caller.
 
-    def __enter__(self):
-        """
-        add some functions to pandas module based on AzContextManger()
+        Args:
+            processes: number of processes, default as same as mp.cpu_count()
 
         Returns:
-            instance of AzFileClient
+            multiprocessing.pool.Pool
 
-        """
-        self._az_context_manager.attach(client=self)
-        return self
+        Examples:
+            >>> import azfs
+            >>> azc = azfs.AzFileClient()
+            >>> blob_path_pattern = "https://testazfs.blob.core.windows.net/test_container/test*.csv"
+            >>> with azc.create_pool(processes=8) as pool:
+            ...     df1 = azc.read(use_mp=True, pool=pool).csv(blob_path_pattern)
+            ...     df2 = azc.read(use_mp=True, pool=pool).csv(blob_path_pattern)
 
-    def __exit__(self, exec_type, exec_value, traceback):
         """
-        remove some functions from pandas module based on AzContextManager()
+        # DefaultCredential cannot be pickled, so each worker creates it
+        credential = self._credential if type(self._credential) is str else None
+        return mp.Pool(
+            processes,
+            initializer=_init_worker,
+            initargs=(credential, self._client._connection_string, self._disk_cache, self._parsed_cache))
+
+    def get_pool(self, processes: Optional[int] = None):
+        """
+        get the persistent process pool of the client, which is used with ``read(use_mp=True)``.
+        The pool is created at the first call, and reused until ``close_pool()`` or ``close()`` is called,
+        or created again if the number of processes is changed.
 
         Args:
-            exec_type:
-            exec_value:
-            traceback:
+            processes: number of processes, default as same as mp.cpu_count()
+
+        Returns:
+            multiprocessing.pool.Pool
+        """
+        processes = mp.cpu_count() if processes is None else processes
+        with self._pool_lock:
+            if self._pool is not None and self._pool_processes != processes:
+                self._close_pool()
+            if self._pool is None:
+                self._pool = self.create_pool(processes=processes)
+                self._pool_processes = processes
+                # terminate the workers, when the client is garbage-collected
+                self._pool_finalizer = weakref.finalize(self, self._pool.terminate)
+            return self._pool
+
+    def close_pool(self):
+        """
+        shut down the persistent process pool, after the running tasks finish.
 
         Returns:
             None
+
+        Examples:
+            >>> import azfs
+            >>> azc = azfs.AzFileClient()
+            >>> blob_path_pattern = "https://testazfs.blob.core.windows.net/test_container/test*.csv"
+            >>> df = azc.read(use_mp=True).csv(blob_path_pattern)
+            the pool started above is reused
+            >>> df = azc.read(use_mp=True).csv(blob_path_pattern)
+            >>> azc.close_pool()
+
         """
-        self._az_context_manager.detach()
+        with self._pool_lock:
+            self._close_pool()
+
+    def _close_pool(self):
+        if self._pool is None:
+            return
+        self._pool_finalizer.detach()
+        self._pool.close()
+        self._pool.join()
+        self._pool = None
+        self._pool_processes = None
+        self._pool_finalizer = None
 
     def exists(self, path: str) -> bool:
         """
@@ -579,6 +2303,8 @@ class AzFileClient:
 
         """
         _, account_kind, _, _ = BlobPathDecoder(path).get_with_url()
+        if self._memory_cache is not None:
+            self._memory_cache.invalidate(path=path)
         return self._client.get_client(account_kind=account_kind).rm(path=path)
 
     def info(self, path: str) -> dict:
@@ -692,13 +2418,24 @@ class AzFileClient:
         except IOError:
             return False
 
-    def glob(self, pattern_path: str) -> List[str]:
+    def glob(
+            self,
+            pattern_path: str,
+            detail: bool = False,
+            max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> Union[List[str], List[dict]]:
         """
-        Currently only support ``* (wildcard)`` .
+        Support ``* (wildcard)``, ``? (any char)``, ``[...] (char class)``, ``** (any directories)`` and ``{a,b}``.
         By default, ``glob()`` lists specified files with formatted-URL.
+        The directories are listed level by level from the longest prefix without wildcards,
+        and only the directories matched with the pattern are listed deeper, concurrently.
+        So the number of the requests grows with the matched directories, not with all the files in the container.
+        The alternatives of ``{a,b}`` are listed concurrently as the separate patterns,
+        and ``**`` lists all the files under the matched directories with one request for each.
 
         Args:
             pattern_path: ex: ``https://<storage_account_name>.blob.core.windows.net/<container>/*/*.csv``
+            detail: return list of dict, which has ``name`` as formatted-URL and ``size`` from the listing
+            max_concurrency: number of threads to list the directories of the same level
 
         Returns:
             lists specified files filtered by wildcard
@@ -740,53 +2477,167 @@ class AzFileClient:
                 "https://testazfs.blob.core.windows.net/test_container/some_folder/directory_1/deeper_test1.csv",
                 "https://testazfs.blob.core.windows.net/test_container/some_folder/directory_2/deeper_test2.csv"
             ]
+            the size of each file is also listed, without requesting each file
+            >>> azc.glob(path=csv_pattern_path, detail=True)
+            [
+                {"name": "https://testazfs.blob.core.windows.net/test_container/some_folder/directory_1/deeper_test1.csv", "size": 1024},
+                {"name": "https://testazfs.blob.core.windows.net/test_container/some_folder/directory_2/deeper_test2.csv", "size": 2048}
+            ]
+            ``**`` matches the files in any depth, and ``{a,b}``, ``?`` or ``[...]`` narrows the names
+            >>> csv_pattern_path = "https://testazfs.blob.core.windows.net/test_container/some_folder/**/*.csv"
+            >>> azc.glob(path=csv_pattern_path)
+            [
+                "https://testazfs.blob.core.windows.net/test_container/some_folder/directory_1/deeper_test1.csv",
+                "https://testazfs.blob.core.windows.net/test_container/some_folder/directory_2/deeper_test2.csv",
+                "https://testazfs.blob.core.windows.net/test_container/some_folder/test1.csv",
+                "https://testazfs.blob.core.windows.net/test_container/some_folder/test2.csv",
+                "https://testazfs.blob.core.windows.net/test_container/some_folder/test3.csv"
+            ]
+            >>> csv_pattern_path = "https://testazfs.blob.core.windows.net/test_container/some_folder/test[12].{csv,json}"
+            >>> azc.glob(path=csv_pattern_path)
+            [
+                "https://testazfs.blob.core.windows.net/test_container/some_folder/test1.csv",
+                "https://testazfs.blob.core.windows.net/test_container/some_folder/test1.json",
+                "https://testazfs.blob.core.windows.net/test_container/some_folder/test2.csv",
+                "https://testazfs.blob.core.windows.net/test_container/some_folder/test2.json"
+            ]
 
         Raises:
-            AzfsInputError: when ``*`` is used in root_flder under a container.
+            AzfsInputError: when the wildcard is used in root_flder under a container.
         """
-        if "*" not in pattern_path:
-            raise AzfsInputError("no any `*` in the `pattern_path`")
+        if not _is_glob_pattern(pattern_path):
+            raise AzfsInputError("no any wildcard in the `pattern_path`")
         url, account_kind, container_name, file_path = BlobPathDecoder(pattern_path).get_with_url()
 
-        acceptable_folder_pattern = r"(?P<root_folder>[^\*]+)/(?P<folders>.*)"
-        result = re.match(acceptable_folder_pattern, file_path)
-        if result:
-            result_dict = result.groupdict()
-            root_folder = result_dict['root_folder']
-        else:
-            raise AzfsInputError(
-                f"Cannot use `*` in root_folder under a container. Accepted format is {acceptable_folder_pattern}"
-            )
+        pattern_list = [pattern.split("/") for pattern in _expand_braces(file_path)]
+        for segments in pattern_list:
+            if len(segments) < 2 or _has_glob_magic(segments[0]):
+                raise AzfsInputError(
+                    "Cannot use the wildcard in root_folder under a container. Accepted format is `root_folder/...`"
+                )
         # get container root path
         base_path = f"{url}/{container_name}/"
         if account_kind in ["dfs", "blob"]:
-            file_list = self._client.get_client(account_kind=account_kind).ls(path=base_path, file_path=root_folder)
-
-            # to escape special chars for regular-expression
-            def _escape(input_str: str) -> str:
-                special_chars = ["(", ")", "[", "]"]
-                for c in special_chars:
-                    input_str = input_str.replace(c, f"\\{c}")
-                return input_str
-
-            escaped_pattern_path = _escape(pattern_path)
-            # fix pattern_path, in order to avoid matching `/`
-            replace_pattern_path = escaped_pattern_path.replace('*', '([^/])*?')
-            pattern = re.compile(f"{replace_pattern_path}$")
-            file_full_path_list = [f"{base_path}{f}" for f in file_list]
-            # filter with pattern.match
-            matched_full_path_list = [f for f in file_full_path_list if pattern.match(f)]
-            return matched_full_path_list
+            client = self._client.get_client(account_kind=account_kind)
+
+            def _glob_walk(segments: List[str]) -> List[dict]:
+                return self._glob_walk(
+                    client=client, base_path=base_path, segments=segments, max_concurrency=max_concurrency)
+
+            if len(pattern_list) == 1:
+                file_list = _glob_walk(pattern_list[0])
+            else:
+                # each alternative of the braces is listed from its own prefix
+                with ThreadPoolExecutor(max_workers=min(max_concurrency, len(pattern_list))) as executor:
+                    file_list = [f for listed in executor.map(_glob_walk, pattern_list) for f in listed]
+
+            # the same file may be matched with the alternatives
+            file_dict = {f"{base_path}{f['name']}": f["size"] for f in file_list}
+            matched_file_list = [{"name": name, "size": file_dict[name]} for name in sorted(file_dict)]
+            if detail:
+                return matched_file_list
+            return [f["name"] for f in matched_file_list]
         elif account_kind in ["queue"]:
             raise NotImplementedError
 
+    def _glob_walk(self, client, base_path: str, segments: List[str], max_concurrency: int) -> List[dict]:
+        """
+        list the files matched with the segments of the pattern, level by level.
+
+        Args:
+            client: AzBlobClient or AzDataLakeClient
+            base_path: container root path
+            segments: pattern split with ``/``, without the braces
+            max_concurrency: number of threads to list the directories of the same level
+
+        Returns:
+            list of dict, which has ``name`` from the container root and ``size``
+        """
+        # the directories before the first wildcard are not listed
+        literal_depth = 0
+        while literal_depth < len(segments) - 1 and not _has_glob_magic(segments[literal_depth]):
+            literal_depth += 1
+        directories = ["".join([f"{segment}/" for segment in segments[:literal_depth]])]
+        for depth in range(literal_depth, len(segments)):
+            if not directories:
+                return []
+            segment = segments[depth]
+            is_file = depth == len(segments) - 1
+            if segment == "**":
+                # the rest is matched with the relative path of all the files under each directory
+                pattern = _compile_glob_path(tuple(segments[depth:]))
+                listed = self._walk(
+                    client=client,
+                    base_path=base_path,
+                    file_paths=directories,
+                    max_concurrency=max_concurrency,
+                    recursive=True)
+                return [
+                    f for directory, file_list in zip(directories, listed) for f in file_list
+                    if not f["is_directory"] and pattern.fullmatch(f["name"][len(directory):])
+                ]
+            if not is_file and not _has_glob_magic(segment):
+                directories = [f"{directory}{segment}/" for directory in directories]
+                continue
+            # only the names starting with the chars before the wildcard are listed, in each directory
+            prefix = _glob_literal_prefix(segment)
+            pattern = _compile_glob_segment(segment)
+            listed = self._walk(
+                client=client,
+                base_path=base_path,
+                file_paths=[f"{directory}{prefix}" for directory in directories],
+                max_concurrency=max_concurrency)
+            matched = [
+                f for file_list in listed for f in file_list
+                if f["is_directory"] != is_file and pattern.fullmatch(f["name"].rsplit("/", 1)[-1])
+            ]
+            if is_file:
+                return matched
+            directories = [f"{f['name']}/" for f in matched]
+        return []
+
+    @staticmethod
+    def _walk(
+            client,
+            base_path: str,
+            file_paths: List[str],
+            max_concurrency: int,
+            recursive: bool = False) -> List[List[dict]]:
+        """
+        list each of ``file_paths`` with the delimiter ``/``, or recursively, concurrently.
+
+        Args:
+            client: AzBlobClient or AzDataLakeClient
+            base_path: container root path
+            file_paths: directories or the prefixes of the names, see ``ClientInterface.walk()``
+            max_concurrency: number of threads
+            recursive: list all the files under the directories, see ``ClientInterface.ls_detail()``
+
+        Returns:
+            list of the listed files for each of ``file_paths``,
+            and each file is dict, which has ``name``, ``size`` and ``is_directory``
+        """
+        def _walk_one(file_path: str) -> List[dict]:
+            if recursive:
+                return client.ls_detail(path=base_path, file_path=file_path)
+            return client.walk(path=base_path, file_path=file_path)
+
+        if len(file_paths) <= 1 or max_concurrency <= 1:
+            return [_walk_one(file_path) for file_path in file_paths]
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(file_paths))) as executor:
+            return list(executor.map(_walk_one, file_paths))
+
     def read(
             self,
             *,
             path: Union[str, List[str]] = None,
             use_mp: bool = False,
             cpu_count: Optional[int] = None,
-            file_format: str = "csv") -> DataFrameReader:
+            file_format: str = "csv",
+            split_size: Optional[int] = None,
+            io_concurrency: Optional[int] = None,
+            pool=None,
+            shared_memory: bool = False) -> DataFrameReader:
         """
         read csv, parquet, picke files in Azure Blob, like PySpark-method.
 
@@ -795,6 +2646,16 @@ class AzFileClient:
             use_mp: Default, False
             cpu_count: Default, as same as mp.cpu_count()
             file_format: determined by which function you call
+            split_size: if set, each csv file is split into byte-ranges of the size and read in parallel,
+                see ``plan_splits()``
+            io_concurrency: number of threads to download the files.
+                Without ``use_mp``, each thread also parses the file, and no process is started.
+                With ``use_mp``, the files are downloaded in this process, and parsed with ``cpu_count`` processes.
+            pool: process pool used with ``use_mp``, such as created by ``create_pool()``.
+                Default, the persistent pool of the client, see ``get_pool()``
+            shared_memory: with ``use_mp``, each worker writes the result to a memory-mapped file
+                in Arrow IPC format (in ``/dev/shm`` if exists), instead of pickling it.
+                The parent process attaches the file without copy.
 
         Returns:
             pd.DataFrame
@@ -816,10 +2677,20 @@ class AzFileClient:
             >>> df = azc.read().csv(blob_path_pattern)
             # you can use multiprocessing with `use_mp` argument
             >>> df = azc.read(use_mp=True).csv(blob_path_pattern)
+            # the processes are started at the first time, and reused until `close_pool()`
+            >>> azc.close_pool()
             # if you want to filter or apply some method, you can use your defined function as below
             >>> def filter_function(_df: pd.DataFrame, _id: str) -> pd.DataFrame:
             ...     return _df[_df['id'] == _id]
             >>> df = azc.read(use_mp=True).apply(function=filter_function, _id="aaa").csv(blob_path_pattern)
+            # one large file is also read in parallel, by splitting into byte-ranges of 256MiB
+            >>> df = azc.read(use_mp=True, split_size=256 * 2 ** 20).csv(blob_path)
+            # many small files are downloaded and parsed with threads, without starting processes
+            >>> df = azc.read(io_concurrency=16).csv(blob_path_pattern)
+            # or downloaded with 16 threads, and parsed with 4 processes
+            >>> df = azc.read(use_mp=True, cpu_count=4, io_concurrency=16).csv(blob_path_pattern)
+            # large results are returned from the processes via shared memory, and concatenated as pyarrow.Table
+            >>> table = azc.read(use_mp=True, shared_memory=True, file_format="parquet").to_arrow(blob_path_pattern)
 
 
         """
@@ -829,20 +2700,39 @@ class AzFileClient:
             path=path,
             use_mp=use_mp,
             cpu_count=cpu_count,
-            file_format=file_format)
+            file_format=file_format,
+            split_size=split_size,
+            io_concurrency=io_concurrency,
+            pool=pool,
+            shared_memory=shared_memory)
 
-    def _get(self, path: str, offset: int = None, length: int = None, **kwargs) -> Union[bytes, str, io.BytesIO, dict]:
+    def _get(
+            self,
+            path: str,
+            offset: int = None,
+            length: int = None,
+            max_concurrency: Optional[int] = None,
+            chunk_size: Optional[int] = None,
+            stream: bool = False,
+            **kwargs) -> Union[bytes, str, io.BytesIO, io.BufferedIOBase, dict]:
         """
         get data from Azure Blob Storage.
+        ``.gz`` file is decompressed, and incrementally while reading with ``stream=True``.
 
         Args:
             path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test1.csv``
             offset:
             length:
+            max_concurrency: if more than 1, the file is split into byte-ranges and downloaded concurrently.
+                with ``stream=True``, number of byte-ranges downloaded ahead in background, default 1.
+            chunk_size: size of each byte-range, default 4MiB
+            stream: if True, return file-like object which downloads each byte-range of ``chunk_size`` on reading,
+                instead of downloading whole file at once.
             **kwargs:
 
         Returns:
-            some data
+            io.BytesIO, or file-like object with ``stream=True``.
+            The file-like object should be closed after reading, to stop the background download.
 
         Examples:
             >>> import azfs
@@ -852,15 +2742,28 @@ class AzFileClient:
             >>> data = azc.get(path=csv_path)
             `download()` is same method as `get()`
             >>> data = azc.download(path=csv_path)
+            large file can be downloaded concurrently
+            >>> data = azc.get(path=csv_path, max_concurrency=8, chunk_size=8 * 2 ** 20)
+            or read as stream, to keep the memory usage small
+            >>> with azc.get(path=csv_path, stream=True) as f:
+            ...     head = f.read(1024)
 
         """
-        _, account_kind, _, _ = BlobPathDecoder(path).get_with_url()
+        if stream:
+            if offset is not None or length is not None:
+                raise AzfsInputError("`offset` and `length` are not supported with `stream=True`")
+            return self._open(path=path, max_concurrency=max_concurrency, chunk_size=chunk_size, stream=True)
 
-        file_bytes = self._client.get_client(
-            account_kind=account_kind).get(path=path, offset=offset, length=length, **kwargs)
+        file_bytes = self._download(
+            path=path,
+            offset=offset,
+            length=length,
+            max_concurrency=max_concurrency,
+            chunk_size=chunk_size,
+            **kwargs)
         # gzip圧縮ファイルは一旦ここで展開
         if path.endswith(".gz"):
-            file_bytes = gzip.decompress(file_bytes)
+            file_bytes = gzip.decompress(file_bytes.getbuffer() if type(file_bytes) is io.BytesIO else file_bytes)
 
         if type(file_bytes) is bytes:
             file_to_read = io.BytesIO(file_bytes)
@@ -869,12 +2772,175 @@ class AzFileClient:
 
         return file_to_read
 
-    def read_line_iter(self, path: str) -> iter:
+    def _download(
+            self,
+            path: str,
+            offset: int = None,
+            length: int = None,
+            max_concurrency: Optional[int] = None,
+            chunk_size: Optional[int] = None,
+            **kwargs) -> Union[bytes, io.BytesIO, dict]:
+        """
+        download data from blob or data_lake storage as it is.
+        The whole file is looked up in the memory cache, and then in the disk cache.
+
+        Returns:
+            bytes, or io.BytesIO when downloaded with ``max_concurrency``
+        """
+        _, account_kind, _, _ = BlobPathDecoder(path).get_with_url()
+        client = self._client.get_client(account_kind=account_kind)
+        use_memory_cache = \
+            self._memory_cache is not None and account_kind in ["blob", "dfs"] and offset is None and length is None
+        etag = None
+        if use_memory_cache:
+            file_bytes = self._download_with_memory_cache(path=path, client=client)
+            if file_bytes is not None:
+                return file_bytes
+            # only the file small enough is cached in memory, the others are downloaded concurrently
+            info = client.info(path=path)
+            size = info.get("size")
+            etag = info.get("etag") or None
+            use_memory_cache = etag is not None and size is not None and size <= self._memory_cache.max_size
+
+        if etag is None:
+            etag = self._cache_etag(path=path)
+        if self._disk_cache is not None and etag is not None:
+            cached_bytes = self._disk_cache.get(path=path, etag=etag, offset=offset, length=length)
+            if cached_bytes is not None:
+                if use_memory_cache:
+                    self._memory_cache.put(path=path, data=cached_bytes, etag=etag)
+                return cached_bytes
+
+        if max_concurrency is not None:
+            kwargs["max_concurrency"] = max_concurrency
+        if chunk_size is not None:
+            kwargs["chunk_size"] = chunk_size
+        file_bytes = client.get(path=path, offset=offset, length=length, **kwargs)
+        # only the whole file is cached
+        if self._disk_cache is not None and etag is not None and offset is None and length is None:
+            self._disk_cache.put(
+                path=path,
+                etag=etag,
+                data=file_bytes.getbuffer() if type(file_bytes) is io.BytesIO else file_bytes)
+        if use_memory_cache:
+            self._memory_cache.put(
+                path=path,
+                etag=etag,
+                data=file_bytes.getvalue() if type(file_bytes) is io.BytesIO else file_bytes)
+        return file_bytes
+
+    def _download_with_memory_cache(self, path: str, client) -> Optional[bytes]:
+        """
+        get the whole file from the memory cache, and revalidate the cached one with ``If-None-Match`` after the ttl.
+
+        Returns:
+            bytes, or None if not cached
+        """
+        file_bytes, etag = self._memory_cache.get(path=path)
+        if file_bytes is not None or etag is None:
+            return file_bytes
+        file_bytes, new_etag = client.get_if_modified(path=path, etag=etag)
+        if file_bytes is None:
+            # None if removed from the cache in another thread
+            return self._memory_cache.revalidated(path=path, etag=etag)
+        self._memory_cache.put(path=path, data=file_bytes, etag=new_etag)
+        return file_bytes
+
+    def cache_stats(self) -> dict:
+        """
+        get the counters of the memory cache.
+
+        Returns:
+            dict of ``hits``, ``misses``, ``revalidations``, ``not_modified``, ``entries`` and ``size``
+
+        Examples:
+            >>> import azfs
+            >>> azc = azfs.AzFileClient(memory_cache=azfs.MemoryCache())
+            >>> json_path = "https://testazfs.blob.core.windows.net/test_container/config.json"
+            >>> config = azc.read_json(json_path)
+            >>> azc.cache_stats()
+            {"hits": 0, "misses": 1, "revalidations": 0, "not_modified": 0, "entries": 1, "size": 128}
+        """
+        if self._memory_cache is None:
+            return {}
+        return self._memory_cache.stats()
+
+    def _cache_etag(self, path: str) -> Optional[str]:
+        """
+        get the current ETag of the file to validate the disk cache, with the properties request.
+
+        Returns:
+            ETag, or None if the disk cache is not used
+        """
+        if self._disk_cache is None:
+            return None
+        return self._etag(path=path)
+
+    def _etag(self, path: str) -> Optional[str]:
+        """
+        get the current ETag of the file, with the properties request.
+
+        Returns:
+            ETag, or None if the storage has no ETag
+        """
+        _, account_kind, _, _ = BlobPathDecoder(path).get_with_url()
+        if account_kind not in ["blob", "dfs"]:
+            return None
+        etag = self._client.get_client(account_kind=account_kind).info(path=path).get("etag")
+        return etag if etag else None
+
+    def _open(
+            self,
+            path: str,
+            max_concurrency: Optional[int] = None,
+            chunk_size: Optional[int] = None,
+            stream: bool = False) -> io.IOBase:
+        """
+        open the file as file-like object to pass the parsers, such as ``pd.read_csv``.
+        ``.gz`` file is decompressed incrementally while reading,
+        and closing the returned object also closes the underlying stream.
+
+        Args:
+            path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test1.csv``
+            max_concurrency: see ``get()``
+            chunk_size: see ``get()``
+            stream: see ``get()``
+
+        Returns:
+            file-like object
+        """
+        cached_file = None
+        if stream:
+            etag = self._cache_etag(path=path)
+            if etag is not None:
+                # the cached file is read from the local disk, but the stream itself is not cached
+                cached_file = self._disk_cache.open(path=path, etag=etag)
+        if cached_file is not None:
+            file_to_read = cached_file
+        elif stream:
+            _, account_kind, _, _ = BlobPathDecoder(path).get_with_url()
+            raw = StreamReader(
+                client=self._client.get_client(account_kind=account_kind),
+                path=path,
+                chunk_size=chunk_size if chunk_size is not None else DEFAULT_CHUNK_SIZE,
+                prefetch=max_concurrency if max_concurrency is not None else 1)
+            file_to_read = io.BufferedReader(raw, buffer_size=raw.chunk_size)
+        else:
+            file_bytes = self._download(path=path, max_concurrency=max_concurrency, chunk_size=chunk_size)
+            file_to_read = file_bytes if type(file_bytes) is io.BytesIO else io.BytesIO(file_bytes)
+
+        # gzip圧縮ファイルは読み込みながら展開
+        if path.endswith(".gz"):
+            file_to_read = _GzipReader(fileobj=file_to_read)
+        return file_to_read
+
+    def read_line_iter(self, path: str, size: Optional[int] = None) -> iter:
         """
         To read text file in each line with iterator.
 
         Args:
             path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test1.csv``
+            size: size of the file, if already known
 
         Returns:
             get data of the path as iterator
@@ -888,20 +2954,32 @@ class AzFileClient:
 
         """
         _, account_kind, _, _ = BlobPathDecoder(path).get_with_url()
-        return TextReader(client=self._client.get_client(account_kind=account_kind), path=path)
+        return TextReader(client=self._client.get_client(account_kind=account_kind), path=path, size=size)
 
-    def read_csv_chunk(self, path: str, chunk_size: int) -> pd.DataFrame:
+    def read_csv_chunk(
+            self,
+            path: str,
+            chunk_size: int,
+            range_size: Optional[int] = None,
+            prefetch: int = 1,
+            **kwargs) -> Iterator[pd.DataFrame]:
         """
-        !WARNING! the method may differ from current version in the future update.
-        Currently, only support for csv.
+        read csv file as iterator of pd.DataFrame, each has ``chunk_size`` rows except the last one.
+        The file is downloaded as stream of byte-ranges and the lines are split by pandas C-parser,
+        so quoted newlines are also supported, and the header is parsed only once.
+        Each chunk is promoted to the common dtype with the previous chunks (ex. ``int64`` to ``float64``),
+        but the chunks already yielded are not changed.
+        To get the same dtypes in all chunks, give ``dtype`` explicitly.
 
         Args:
             path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test1.csv``
             chunk_size: pandas-DataFrame index length to read.
+            range_size: size of each byte-range to download, default 4MiB
+            prefetch: number of byte-ranges downloaded ahead in background, 0 to disable.
+            **kwargs: keywords to put df.read_csv(), such as ``header``, ``dtype``.
 
         Returns:
-            first time: len(df.index) is `chunk_size - 1`
-            second time or later: len(df.index) is `chunk_size`
+            iterator of pd.DataFrame, len(df.index) is ``chunk_size``
 
         Examples:
             >>> import azfs
@@ -911,42 +2989,280 @@ class AzFileClient:
             >>> for _df in azc.read_csv_chunk(path=csv_path, chunk_size=read_chunk_size):
             ...   print(_df)
         """
-        warning_message = """
-            The method is under developing. 
-            The name or the arguments may differ from current version in the future update.
+        file_to_read = self._open(path, stream=True, chunk_size=range_size, max_concurrency=prefetch)
+        reader = pd.read_csv(file_to_read, chunksize=chunk_size, **kwargs)
+        dtypes = None
+        try:
+            for df in reader:
+                if dtypes is None:
+                    dtypes = df.dtypes
+                else:
+                    df, dtypes = _promote_dtypes(df=df, dtypes=dtypes)
+                yield df
+        finally:
+            reader.close()
+            file_to_read.close()
+
+    def plan_splits(
+            self,
+            path: str,
+            num_splits: Optional[int] = None,
+            split_size: Optional[int] = None,
+            size: Optional[int] = None) -> List[Tuple[int, int]]:
+        """
+        plan byte-range splits of one text file, to read the lines of the file in parallel with ``read_split()``.
+        Like Hadoop, each split reads the lines starting in ``[start, end)``,
+        so the lines across the boundaries are read exactly once without reading the file here.
+
+        Args:
+            path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test1.csv``
+            num_splits: number of splits
+            split_size: size of each split, set either ``num_splits`` or ``split_size``
+            size: size of the file, if already known
+
+        Returns:
+            list of ``(start, end)``
+
+        Raises:
+            AzfsInputError: if the file is compressed with gzip, or both or neither of the arguments are set
+
+        Examples:
+            >>> import azfs
+            >>> azc = azfs.AzFileClient()
+            >>> csv_path = "https://testazfs.blob.core.windows.net/test_container/test1.csv"
+            >>> azc.plan_splits(csv_path, num_splits=2)
+            [(0, 512), (512, 1024)]
+        """
+        if path.endswith(".gz"):
+            raise AzfsInputError("gzip file cannot be split")
+        if (num_splits is None) == (split_size is None):
+            raise AzfsInputError("set either `num_splits` or `split_size`")
+        if size is None:
+            size = self.size(path=path)
+        if split_size is None:
+            split_size = max(-(-size // max(num_splits, 1)), 1)
+        if split_size <= 0:
+            raise AzfsInputError("`split_size` must be positive")
+        return [(start, min(start + split_size, size)) for start in range(0, size, split_size)]
+
+    def _read_split_bytes(self, path: str, start: int, end: int, size: int) -> bytes:
+        """
+        read the lines starting in ``[start, end)``.
+        The range is read from ``start - 1`` to know whether a line starts at ``start``,
+        and the last line is read over ``end`` until the newline.
+
+        Returns:
+            bytes
+        """
+        end = min(end, size)
+        if start >= end:
+            return b""
+        offset = start - 1 if start > 0 else 0
+        data = self._download(path=path, offset=offset, length=end - offset)
+        data = data.getvalue() if type(data) is io.BytesIO else data
+        if start > 0:
+            # skip the line, which starts in the previous split
+            newline = data.find(b"\n")
+            if newline < 0 or newline + 1 >= len(data):
+                return b""
+            data = data[newline + 1:]
+        if end >= size or data.endswith(b"\n"):
+            return data
+
+        # complete the last line, which continues to the following split
+        _, account_kind, _, _ = BlobPathDecoder(path).get_with_url()
+        raw = StreamReader(
+            client=self._client.get_client(account_kind=account_kind),
+            path=path,
+            size=size,
+            chunk_size=2 ** 16,
+            max_chunk_size=DEFAULT_CHUNK_SIZE)
+        raw.seek(end)
+        pieces = [data]
+        try:
+            while True:
+                chunk = raw.read_chunk()
+                if not chunk:
+                    break
+                newline = chunk.find(b"\n")
+                if newline >= 0:
+                    pieces.append(chunk[:newline + 1])
+                    break
+                pieces.append(chunk)
+        finally:
+            raw.close()
+        return b"".join(pieces)
+
+    def read_split(
+            self,
+            path: str,
+            start: int,
+            end: int,
+            file_format: str = "csv",
+            size: Optional[int] = None,
+            **kwargs) -> pd.DataFrame:
+        """
+        read the lines starting in the byte-range split ``[start, end)`` as pd.DataFrame.
+        The header of csv file is also read for the split except the first one,
+        so the keywords such as ``skiprows`` and ``nrows`` are applied to each split.
+        Quoted newlines in csv are not supported.
+
+        Args:
+            path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test1.csv``
+            start: start of the split, see ``plan_splits()``
+            end: end of the split
+            file_format: ``csv`` or ``ndjson``
+            size: size of the file, if already known
+            **kwargs: keywords to put pd.read_csv() or pd.read_json()
+
+        Returns:
+            pd.DataFrame
+
+        Examples:
+            >>> import azfs
+            >>> azc = azfs.AzFileClient()
+            >>> csv_path = "https://testazfs.blob.core.windows.net/test_container/test1.csv"
+            >>> df_list = [azc.read_split(csv_path, start, end) for start, end in azc.plan_splits(csv_path, 4)]
+        """
+        data = self._read_split_data(
+            path=path, start=start, end=end, file_format=file_format, size=size, header=kwargs.get("header", "infer"))
+        return _parse_split(data=data, file_format=file_format, **kwargs)
+
+    def _read_split_data(
+            self,
+            path: str,
+            start: int,
+            end: int,
+            file_format: str = "csv",
+            size: Optional[int] = None,
+            header="infer") -> bytes:
+        """
+        download the lines starting in the split, and the header line of csv file for the split except the first one.
+
+        Returns:
+            bytes
+        """
+        if file_format not in ["csv", "ndjson"]:
+            raise AzfsInputError("file_format must be `csv` or `ndjson`")
+        if size is None:
+            size = self.size(path=path)
+        data = self._read_split_bytes(path=path, start=start, end=end, size=size)
+        if file_format == "csv" and start > 0 and header is not None:
+            # the first line, which is the only line starting in [0, 1)
+            data = self._read_split_bytes(path=path, start=0, end=1, size=size) + data
+        return data
+
+    def read_splits(
+            self,
+            path: str,
+            num_splits: Optional[int] = None,
+            split_size: Optional[int] = None,
+            file_format: str = "csv",
+            use_mp: bool = False,
+            cpu_count: Optional[int] = None,
+            iterator: bool = False,
+            **kwargs) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
         """
-        warnings.warn(warning_message, FutureWarning)
-        initial_line = ""
-        byte_list = []
+        read one large text file in parallel, by splitting into the byte-ranges aligned to the lines.
+
+        Args:
+            path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test1.csv``
+            num_splits: number of splits, default ``cpu_count``
+            split_size: size of each split
+            file_format: ``csv`` or ``ndjson``
+            use_mp: read each split in another process
+            cpu_count: number of processes, default as same as mp.cpu_count()
+            iterator: if True, return iterator of pd.DataFrame for each split in order
+            **kwargs: keywords to put pd.read_csv() or pd.read_json()
 
-        for idx, l in enumerate(self.read_line_iter(path=path)):
-            div_idx = idx % chunk_size
-            if idx == 0:
-                initial_line = l
-                byte_list.append(initial_line)
+        Returns:
+            pd.DataFrame, or iterator of pd.DataFrame
+
+        Examples:
+            >>> import azfs
+            >>> azc = azfs.AzFileClient()
+            >>> csv_path = "https://testazfs.blob.core.windows.net/test_container/test1.csv"
+            >>> df = azc.read_splits(csv_path, num_splits=8, use_mp=True)
+            >>> for _df in azc.read_splits(csv_path, split_size=2 ** 28, use_mp=True, iterator=True):
+            ...     print(_df)
+        """
+        cpu_count = mp.cpu_count() if cpu_count is None else cpu_count
+        if num_splits is None and split_size is None:
+            num_splits = cpu_count
+        size = self.size(path=path)
+        splits = self.plan_splits(path=path, num_splits=num_splits, split_size=split_size, size=size)
+        params_list = []
+        for start, end in splits:
+            _input = {"path": path, "start": start, "end": end, "file_format": file_format}
+            _input.update(kwargs)
+            params_list.append(_input)
+
+        def _iter_splits() -> Iterator[pd.DataFrame]:
+            if use_mp:
+                credential = self._credential if type(self._credential) is str else None
+                worker_params_list = [
+                    dict(p, credential=credential, disk_cache=self._disk_cache, parsed_cache=self._parsed_cache)
+                    for p in params_list
+                ]
+                for df in self.get_pool(processes=cpu_count).imap(_wrap_quick_load, worker_params_list):
+                    yield df
             else:
-                byte_list.append(l)
-            if div_idx + 1 == chunk_size:
-                file_to_read = (b"\n".join(byte_list))
-                file_to_io_read = io.BytesIO(file_to_read)
-                df = pd.read_csv(file_to_io_read)
-                yield df
+                for params in params_list:
+                    yield self.read_split(size=size, **params)
+
+        if iterator:
+            return _iter_splits()
+        df_list = list(_iter_splits())
+        if len(df_list) == 0:
+            return pd.DataFrame()
+        return pd.concat(df_list, ignore_index=True)
+
+    def _read_parsed(self, path: str, reader: str, read_function: Callable, kwargs: dict):
+        """
+        load pd.DataFrame from the parsed cache, or read it with ``read_function`` and cache it.
+        The iterator such as ``chunksize`` is not cached.
+
+        Args:
+            path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test1.csv``
+            reader: name of the reader, such as ``read_csv``
+            read_function: function to read and parse the file
+            kwargs: keywords to put the reader, which changes the result
 
-                byte_list = [initial_line]
-        # make remainder DataFrame after the for-loop
-        file_to_read = (b"\n".join(byte_list))
-        file_to_io_read = io.BytesIO(file_to_read)
-        df = pd.read_csv(file_to_io_read)
-        yield df
+        Returns:
+            pd.DataFrame, or the result of ``read_function``
+        """
+        if self._parsed_cache is None or kwargs.get("chunksize") is not None or kwargs.get("iterator"):
+            return read_function()
+        variant = self._parsed_cache.variant(reader=reader, kwargs=kwargs)
+        etag = self._etag(path=path) if variant is not None else None
+        if etag is None:
+            return read_function()
+
+        df = self._parsed_cache.get_frame(path=path, etag=etag, variant=variant)
+        if df is not None:
+            return df
+        df = read_function()
+        if isinstance(df, pd.DataFrame):
+            self._parsed_cache.put_frame(path=path, etag=etag, variant=variant, df=df)
+        return df
 
     @_az_context_manager.register(_as="read_csv_az", _to=pd)
-    def read_csv(self, path: str, **kwargs) -> pd.DataFrame:
+    def read_csv(
+            self,
+            path: str,
+            max_concurrency: Optional[int] = None,
+            chunk_size: Optional[int] = None,
+            stream: bool = False,
+            **kwargs) -> pd.DataFrame:
         """
         get csv data as pd.DataFrame from Azure Blob Storage.
         support ``csv`` and also ``csv.gz``.
 
         Args:
             path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test1.csv``
+            max_concurrency: number of threads to download the file, see ``get()``
+            chunk_size: size of each byte-range to download, see ``get()``
+            stream: download while parsing, see ``get()``
             **kwargs: keywords to put df.read_csv(), such as ``header``, ``encoding``.
 
         Returns:
@@ -961,19 +3277,38 @@ class AzFileClient:
             Using `with` statement, you can use `pandas`-like methods
             >>> with azc:
             >>>     df = pd.read_csv_az(path)
+            large file can be downloaded concurrently
+            >>> df = azc.read_csv(path=csv_path, max_concurrency=8)
+            or parsed while downloading, to keep the memory usage small
+            >>> gz_path = "https://testazfs.blob.core.windows.net/test_container/test1.csv.gz"
+            >>> df = azc.read_csv(path=gz_path, stream=True)
+            with ``chunksize`` or ``iterator=True``, the file larger than memory can be read
+            >>> for _df in azc.read_csv(path=gz_path, stream=True, chunksize=100_000):
+            ...     print(_df)
 
         """
-        file_to_read = self._get(path)
-        return pd.read_csv(file_to_read, **kwargs)
+        def _read_csv() -> pd.DataFrame:
+            file_to_read = self._open(path, max_concurrency=max_concurrency, chunk_size=chunk_size, stream=stream)
+            return _read_with_handle(pd.read_csv, file_to_read, **kwargs)
+        return self._read_parsed(path=path, reader="read_csv", read_function=_read_csv, kwargs=kwargs)
 
     @_az_context_manager.register(_as="read_table_az", _to=pd)
-    def read_table(self, path: str, **kwargs) -> pd.DataFrame:
+    def read_table(
+            self,
+            path: str,
+            max_concurrency: Optional[int] = None,
+            chunk_size: Optional[int] = None,
+            stream: bool = False,
+            **kwargs) -> pd.DataFrame:
         """
         get tsv data as pd.DataFrame from Azure Blob Storage.
         support ``tsv``.
 
         Args:
             path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test1.tsv``
+            max_concurrency: number of threads to download the file, see ``get()``
+            chunk_size: size of each byte-range to download, see ``get()``
+            stream: download while parsing, see ``get()``
             **kwargs: keywords to put df.read_csv(), such as ``header``, ``encoding``.
 
         Returns:
@@ -990,17 +3325,26 @@ class AzFileClient:
             >>>     df = pd.read_table_az(tsv_path)
 
         """
-        file_to_read = self._get(path)
-        return pd.read_table(file_to_read, **kwargs)
+        def _read_table() -> pd.DataFrame:
+            file_to_read = self._open(path, max_concurrency=max_concurrency, chunk_size=chunk_size, stream=stream)
+            return _read_with_handle(pd.read_table, file_to_read, **kwargs)
+        return self._read_parsed(path=path, reader="read_table", read_function=_read_table, kwargs=kwargs)
 
     @_az_context_manager.register(_as="read_pickle_az", _to=pd)
-    def read_pickle(self, path: str, compression="gzip") -> pd.DataFrame:
+    def read_pickle(
+            self,
+            path: str,
+            compression="gzip",
+            max_concurrency: Optional[int] = None,
+            chunk_size: Optional[int] = None) -> pd.DataFrame:
         """
         get pickled-pandas data as pd.DataFrame from Azure Blob Storage.
 
         Args:
             path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test1.pkl``
             compression: acceptable keywords are: gzip, bz2, xz. gzip is default value.
+            max_concurrency: number of threads to download the file, see ``get()``
+            chunk_size: size of each byte-range to download, see ``get()``
 
         Returns:
             pd.DataFrame
@@ -1019,21 +3363,37 @@ class AzFileClient:
             >>>     df = pd.read_pickle_az(pkl_path, compression="bz2")
 
         """
-        file_to_read = self._get(path).read()
-        if compression == "gzip":
-            file_to_read = gzip.decompress(file_to_read)
-        elif compression == "bz2":
-            file_to_read = bz2.decompress(file_to_read)
-        elif compression == "xz":
-            file_to_read = lzma.decompress(file_to_read)
-        return pd.DataFrame(pickle.loads(file_to_read))
+        def _read_pickle() -> pd.DataFrame:
+            file_to_read = self._get(path, max_concurrency=max_concurrency, chunk_size=chunk_size).read()
+            if compression == "gzip":
+                file_to_read = gzip.decompress(file_to_read)
+            elif compression == "bz2":
+                file_to_read = bz2.decompress(file_to_read)
+            elif compression == "xz":
+                file_to_read = lzma.decompress(file_to_read)
+            return pd.DataFrame(pickle.loads(file_to_read))
+        return self._read_parsed(
+            path=path, reader="read_pickle", read_function=_read_pickle, kwargs={"compression": compression})
 
     @_az_context_manager.register(_as="read_parquet_az", _to=pd)
-    def read_parquet(self, path: str) -> pd.DataFrame:
+    def read_parquet(
+            self,
+            path: str,
+            columns: Optional[List[str]] = None,
+            filters=None,
+            max_concurrency: Optional[int] = None,
+            chunk_size: Optional[int] = None) -> pd.DataFrame:
         """
+        get parquet data as pd.DataFrame from Azure Blob Storage.
+        With ``columns`` or ``filters``, only the footer and the required column-chunks are downloaded
+        with the concurrent range requests, and the row-groups are pruned by the statistics.
 
         Args:
             path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test.parquet``
+            columns: column names to read, default all columns
+            filters: filters in pyarrow style, such as ``[("date", ">=", "2026-01-01")]``
+            max_concurrency: number of threads to download the file, see ``get()``
+            chunk_size: size of each byte-range to download, see ``get()``
 
         Returns:
             pd.DataFrame
@@ -1047,20 +3407,123 @@ class AzFileClient:
             Using `with` statement, you can use `pandas`-like methods
             >>> with azc:
             >>>     df = pd.read_parquet_az(parquet_path)
+            only the required columns and row-groups are downloaded
+            >>> df = azc.read_parquet(path=parquet_path, columns=["id", "value"], filters=[("id", "<", 100)])
 
 
         """
-        import pyarrow.parquet as pq
-        data = self._get(path=path)
-        return pq.read_table(data).to_pandas()
+        def _read_parquet() -> pd.DataFrame:
+            return self.read_parquet_table(
+                path=path,
+                columns=columns,
+                filters=filters,
+                max_concurrency=max_concurrency,
+                chunk_size=chunk_size).to_pandas()
+        return self._read_parsed(
+            path=path,
+            reader="read_parquet",
+            read_function=_read_parquet,
+            kwargs={"columns": columns, "filters": filters})
+
+    def read_parquet_table(
+            self,
+            path: str,
+            columns: Optional[List[str]] = None,
+            filters=None,
+            max_concurrency: Optional[int] = None,
+            chunk_size: Optional[int] = None):
+        """
+        get parquet data as pyarrow.Table from Azure Blob Storage, without the conversion to pandas.
+        The arguments are same as ``read_parquet()``.
+
+        Args:
+            path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test.parquet``
+            columns: column names to read, default all columns
+            filters: filters in pyarrow style, such as ``[("date", ">=", "2026-01-01")]``
+            max_concurrency: number of threads to download the file, see ``get()``
+            chunk_size: size of each byte-range to download, see ``get()``
+
+        Returns:
+            pyarrow.Table
+
+        Examples:
+            >>> import azfs
+            >>> azc = azfs.AzFileClient()
+            >>> parquet_path = "https://testazfs.blob.core.windows.net/test_container/test1.parquet"
+            >>> table = azc.read_parquet_table(path=parquet_path, columns=["id", "value"])
+
+        """
+        if columns is None and filters is None:
+            import pyarrow.parquet as pq
+            data = self._get(path=path, max_concurrency=max_concurrency, chunk_size=chunk_size)
+            return pq.read_table(data)
+        return self._read_parquet_table(
+            path=path,
+            columns=columns,
+            filters=filters,
+            max_concurrency=max_concurrency,
+            chunk_size=chunk_size)
 
-    def _put(self, path: str, data) -> bool:
+    def _read_parquet_table(
+            self,
+            path: str,
+            columns: Optional[List[str]] = None,
+            filters=None,
+            max_concurrency: Optional[int] = None,
+            chunk_size: Optional[int] = None):
+        """
+        read the footer of the parquet file, and download the required column-chunks concurrently.
+        If the file is in the disk cache with the current ETag, the footer and the column-chunks are read from it.
+
+        Returns:
+            pyarrow.Table
+        """
+        import pyarrow.parquet as pq
+        _, account_kind, _, _ = BlobPathDecoder(path).get_with_url()
+        client = self._client.get_client(account_kind=account_kind)
+        info = client.info(path=path)
+        if self._disk_cache is not None and info.get("etag"):
+            cached_file = self._disk_cache.open(path=path, etag=info["etag"])
+            if cached_file is not None:
+                with cached_file:
+                    return pq.read_table(cached_file, columns=columns, filters=filters, use_pandas_metadata=True)
+        raw = RangeReader(client=client, path=path, size=info.get("size"))
+        try:
+            # pyarrow reads the last 64KiB at first, to get the footer
+            raw.fetch(ranges=[(raw.size - 2 ** 16, raw.size)])
+            metadata = pq.read_metadata(raw)
+
+            read_columns = None
+            if columns is not None:
+                # the index and the columns in the filters are also read
+                pandas_metadata = metadata.schema.to_arrow_schema().pandas_metadata or {}
+                index_columns = [c for c in pandas_metadata.get("index_columns", []) if isinstance(c, str)]
+                filter_columns = [p[0] for c in (_normalize_parquet_filters(filters) or []) for p in c]
+                read_columns = list(columns) + index_columns + filter_columns
+            row_groups = _parquet_row_groups(metadata=metadata, filters=filters)
+            raw.fetch(
+                ranges=_parquet_column_ranges(metadata=metadata, row_groups=row_groups, columns=read_columns),
+                max_concurrency=max_concurrency if max_concurrency is not None else DEFAULT_MAX_CONCURRENCY,
+                chunk_size=chunk_size if chunk_size is not None else DEFAULT_CHUNK_SIZE)
+            raw.seek(0)
+            return pq.read_table(raw, columns=columns, filters=filters, use_pandas_metadata=True)
+        finally:
+            raw.close()
+
+    def _put(
+            self,
+            path: str,
+            data,
+            block_size: Optional[int] = None,
+            max_concurrency: Optional[int] = None) -> bool:
         """
         upload data to blob or data_lake storage.
 
         Args:
             path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test1.csv``
-            data: some data to upload.
+            data: some data to upload, bytes, memoryview, file-like object or generator of bytes.
+            block_size: the data larger than ``block_size`` is split and uploaded concurrently, default 4MiB
+            max_concurrency: number of threads to upload the blocks, default 4
 
         Returns:
             True if correctly uploaded
@@ -1073,10 +3536,20 @@ class AzFileClient:
             >>> _data = azc.put(path=csv_path)
             `download()` is same method as `get()`
             >>> _data = azc.upload(path=csv_path)
+            large data can be uploaded concurrently
+            >>> with open("large_file.csv", "rb") as f:
+            ...     azc.put(path=csv_path, data=f, block_size=8 * 2 ** 20, max_concurrency=8)
 
         """
         _, account_kind, _, _ = BlobPathDecoder(path).get_with_url()
-        return self._client.get_client(account_kind=account_kind).put(path=path, data=data)
+        kwargs = {}
+        if block_size is not None:
+            kwargs["block_size"] = block_size
+        if max_concurrency is not None:
+            kwargs["max_concurrency"] = max_concurrency
+        if self._memory_cache is not None:
+            self._memory_cache.invalidate(path=path)
+        return self._client.get_client(account_kind=account_kind).put(path=path, data=data, **kwargs)
 
     @_az_context_manager.register(_as="to_csv_az", _to=pd.DataFrame)
     def write_csv(self, path: str, df: pd.DataFrame, **kwargs) -> bool:
@@ -1167,27 +3640,149 @@ class AzFileClient:
         return self._put(path=path, data=serialized_data)
 
     @_az_context_manager.register(_as="to_parquet_az", _to=pd.DataFrame)
-    def write_parquet(self, path: str, table) -> bool:
+    def write_parquet(
+            self,
+            path: str,
+            df,
+            row_group_size: int = 2 ** 20,
+            compression: Optional[str] = "snappy",
+            preserve_index: Optional[bool] = None,
+            block_size: Optional[int] = None,
+            max_concurrency: Optional[int] = None,
+            **kwargs) -> bool:
         """
-        When implementation of AzFileSystem is done, the function will be implemented.
-
+        output pandas dataframe or pyarrow table to parquet file in Blob or Datalake storage.
+        Each row-group is encoded and uploaded as soon as it is written,
+        so that the whole encoded file is not held in memory.
+        Blocks are staged (Blob) or appended (DataLake) concurrently, and committed at the end.
 
         Args:
             path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test.parquet``
-            table: parquet table
+            df: pd.DataFrame or pyarrow.Table to upload.
+            row_group_size: number of rows in each row-group, default 1Mi rows
+            compression: compression codec, such as ``snappy``, ``gzip``, ``zstd`` or None. snappy is default value.
+            preserve_index: whether to store the index of pd.DataFrame, same as ``pyarrow.Table.from_pandas()``
+            block_size: size of each uploaded block
+            max_concurrency: number of threads to upload the blocks
+            **kwargs: keywords to put pyarrow.parquet.ParquetWriter, such as ``use_dictionary``
 
         Returns:
             True: if successfully uploaded
 
         Examples:
-            >>> from azfs import AzFileSystem
-            >>> import pyarrow.parquet as pq
-            >>> fs = AzFileSystem()
-            >>> with fs.open("azure_path", "wb") as f:
-            ...     pq.write_table(table, f)
+            >>> import azfs
+            >>> azc = azfs.AzFileClient()
+            >>> parquet_path = "https://testazfs.blob.core.windows.net/test_container/test.parquet"
+            you can write parquet file in azure blob storage
+            >>> azc.write_parquet(path=parquet_path, df=df)
+            row-group size and compression can be specified
+            >>> azc.write_parquet(path=parquet_path, df=df, row_group_size=100_000, compression="zstd")
+            Using `with` statement, you can use `pandas`-like methods
+            >>> with azc:
+            >>>     df.to_parquet_az(parquet_path)
+
+        """
+        import pyarrow as pa
+        if isinstance(df, pd.DataFrame):
+            table = pa.Table.from_pandas(df, preserve_index=preserve_index)
+        else:
+            table = df
+        if row_group_size <= 0:
+            raise AzfsInputError("row_group_size must be positive")
+        return self._put(
+            path=path,
+            data=_iter_parquet_bytes(
+                table=table,
+                row_group_size=row_group_size,
+                compression=compression,
+                **kwargs),
+            block_size=block_size,
+            max_concurrency=max_concurrency)
+
+    def write_dataset(
+            self,
+            df: pd.DataFrame,
+            root: str,
+            partition_cols: List[str],
+            file_format: str = "parquet",
+            basename: Optional[str] = None,
+            max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+            **kwargs) -> List[dict]:
+        """
+        output pandas dataframe to the dataset partitioned in hive-style directories,
+        such as ``root/date=2026-01-01/part-<uuid>.parquet``.
+        Each partition is encoded and uploaded concurrently with ``max_concurrency`` threads.
+        The partition columns are stored only in the directory names, and the index is not stored.
+        The file name is unique for each call by default, so the data already in the partition is kept,
+        and the dataset is appended.
+
+        Args:
+            df: pd.DataFrame to upload.
+            root: root directory of the dataset
+            partition_cols: columns to split the data by
+            file_format: ``parquet`` or ``csv``. parquet is default value.
+            basename: name of the file in each partition, default ``part-<uuid4>.<file_format>``.
+                The file of the same name is overwritten, so give the same one to replace the partitions.
+            max_concurrency: number of partitions encoded and uploaded at the same time
+            **kwargs: keywords to put ``write_parquet()`` or df.to_csv(), such as ``compression``
+
+        Returns:
+            manifest, list of dict which has ``path``, ``size`` and ``num_rows`` of each written file
+
+        Examples:
+            >>> import azfs
+            >>> azc = azfs.AzFileClient()
+            >>> root = "https://testazfs.blob.core.windows.net/test_container/table"
+            >>> azc.write_dataset(df, root, partition_cols=["date"])
+            [
+                {"path": "https://testazfs.blob.core.windows.net/test_container/table/date=2026-01-01/part-<uuid>.parquet",
+                 "size": 1024, "num_rows": 100},
+                ...
+            ]
+            the dataset can be read with partition pruning
+            >>> df = azc.read().parquet_dataset(root, filters=[("date", "==", "2026-01-01")])
 
         """
-        raise NotImplementedError
+        if file_format not in ["parquet", "csv"]:
+            raise AzfsInputError("file_format must be `parquet` or `csv`")
+        if not partition_cols:
+            raise AzfsInputError("partition_cols must not be empty")
+        root = root if root.endswith("/") else f"{root}/"
+        if basename is None:
+            basename = f"part-{uuid.uuid4().hex}.{file_format}"
+        data_columns = [c for c in df.columns if c not in partition_cols]
+        manifest = []
+
+        def _encode(partition_df: pd.DataFrame) -> bytes:
+            if file_format == "parquet":
+                import pyarrow as pa
+                write_kwargs = dict(kwargs)
+                row_group_size = write_kwargs.pop("row_group_size", 2 ** 20)
+                compression = write_kwargs.pop("compression", "snappy")
+                table = pa.Table.from_pandas(partition_df, preserve_index=False)
+                return b"".join(_iter_parquet_bytes(
+                    table=table, row_group_size=row_group_size, compression=compression, **write_kwargs))
+            return partition_df.to_csv(**dict({"index": False}, **kwargs)).encode("utf-8")
+
+        def _write_partition(key: tuple, indices) -> None:
+            directories = []
+            for column, value in zip(partition_cols, key):
+                value = _HIVE_NULL_PARTITION if pd.isna(value) else quote(str(value), safe="")
+                directories.append(f"{quote(str(column), safe='')}={value}")
+            path = f"{root}{'/'.join(directories)}/{basename}"
+            data = _encode(df.iloc[indices][data_columns])
+            self._put(path=path, data=data)
+            manifest.append({"path": path, "size": len(data), "num_rows": len(indices)})
+
+        # group the rows at once, and take each partition by the positions
+        groups = df.groupby(partition_cols, sort=False, dropna=False).indices
+        run_concurrently(
+            function=_write_partition,
+            kwargs_iter=(
+                {"key": key if isinstance(key, tuple) else (key, ), "indices": indices}
+                for key, indices in groups.items()),
+            max_concurrency=max_concurrency)
+        return sorted(manifest, key=lambda m: m["path"])
 
     def read_json(self, path: str, **kwargs) -> dict:
         """
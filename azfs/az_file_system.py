@@ -9,6 +9,7 @@ from .utils import (
     BlobPathDecoder,
     ls_filter
 )
+from .cache import DiskCache
 from .clients import AzfsClient
 
 
@@ -24,11 +25,14 @@ class AzFileSystem(AbstractFileSystem):
             credential: Optional[Union[str, DefaultAzureCredential]] = None,
             connection_string: str = None,
             *args,
+            disk_cache: Optional[DiskCache] = None,
             **storage_options):
         super().__init__(*args, **storage_options)
         if credential is None and connection_string is None:
             credential = DefaultAzureCredential()
         self.az_client = AzfsClient(credential=credential, connection_string=connection_string)
+        # if set, the whole file is cached on the first range read, and validated by ETag
+        self.disk_cache = disk_cache
 
     def _open(
         self,
@@ -311,5 +315,16 @@ class AzFile(AbstractBufferedFile):
 
         """
         _, account_kind, _, file_path = BlobPathDecoder(self.path).get_with_url()
-        return self.fs.az_client.get_client(
-            account_kind=account_kind).get(path=self.path, offset=start, length=end-start)
+        client = self.fs.az_client.get_client(account_kind=account_kind)
+        disk_cache = self.fs.disk_cache
+        etag = self.details.get("etag") if disk_cache is not None else None
+        if not etag or self.size > disk_cache.max_size:
+            return client.get(path=self.path, offset=start, length=end-start)
+
+        data = disk_cache.get(path=self.path, etag=etag, offset=start, length=end-start)
+        if data is None:
+            # download the whole file at once, and read the following ranges from the local disk
+            file_bytes = client.get(path=self.path)
+            disk_cache.put(path=self.path, etag=etag, data=file_bytes)
+            data = file_bytes[start:end]
+        return data
@@ -0,0 +1,406 @@
+import collections
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Callable, Optional, Tuple, Union
+import pandas as pd
+
+__all__ = ["DiskCache", "MemoryCache", "ParsedCache"]
+
+
+def _hash(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+class DiskCache:
+    """
+    The class is to cache the downloaded files on the local disk, keyed by the path and the ETag.
+    Each file is written to a temporary file and renamed atomically,
+    so the cache directory can be shared among the concurrent processes.
+    The least recently used files are removed when the total size exceeds ``max_size``.
+
+    Examples:
+        >>> import azfs
+        >>> from azfs.cache import DiskCache
+        >>> azc = azfs.AzFileClient(disk_cache=DiskCache(cache_dir="/mnt/nvme/azfs", max_size=50 * 2 ** 30))
+        >>> csv_path = "https://testazfs.blob.core.windows.net/test_container/test1.csv"
+        the second read is served from the local disk, if the file is not modified
+        >>> df = azc.read_csv(csv_path)
+        >>> df = azc.read_csv(csv_path)
+    """
+    _TEMP_PREFIX = ".tmp-"
+
+    def __init__(self, cache_dir: str, max_size: int = 10 * 2 ** 30):
+        """
+
+        Args:
+            cache_dir: directory to store the cached files
+            max_size: total size of the cached files in bytes
+        """
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _file_path(self, path: str, etag: str, variant: Optional[str] = None) -> str:
+        # the prefix by the path and the etag is to find the stale files of the other etag
+        file_name = f"{_hash(path)}-{_hash(etag)[:16]}"
+        if variant is not None:
+            file_name = f"{file_name}-{_hash(variant)[:16]}"
+        return os.path.join(self.cache_dir, file_name)
+
+    def _touch(self, file_path: str):
+        # the modified time is used as the last access time for LRU eviction
+        try:
+            os.utime(file_path)
+        except OSError:
+            pass
+
+    def get(self, path: str, etag: str, offset: Optional[int] = None, length: Optional[int] = None) -> Optional[bytes]:
+        """
+        get the cached data of the path, if the ETag matches.
+
+        Args:
+            path: Azure Blob path URL format
+            etag: current ETag of the file
+            offset: start position to read
+            length: length to read, default the rest of the file
+
+        Returns:
+            bytes, or None if not cached
+        """
+        file_path = self._file_path(path=path, etag=etag)
+        try:
+            with open(file_path, "rb") as f:
+                if offset:
+                    f.seek(offset)
+                data = f.read() if length is None else f.read(length)
+        except FileNotFoundError:
+            return None
+        self._touch(file_path=file_path)
+        return data
+
+    def open(self, path: str, etag: str) -> Optional[io.BufferedReader]:
+        """
+        open the cached file of the path, if the ETag matches.
+
+        Returns:
+            file object, or None if not cached
+        """
+        file_path = self._file_path(path=path, etag=etag)
+        try:
+            f = open(file_path, "rb")
+        except FileNotFoundError:
+            return None
+        self._touch(file_path=file_path)
+        return f
+
+    def put(self, path: str, etag: str, data: Union[bytes, bytearray, memoryview]) -> bool:
+        """
+        cache the data of the path, and remove the stale data of the other ETag.
+
+        Returns:
+            True if cached, False if the data is larger than ``max_size``
+        """
+        if len(data) > self.max_size:
+            return False
+
+        def _write(f):
+            f.write(data)
+        return self._put(path=path, etag=etag, write_function=_write)
+
+    def _put(self, path: str, etag: str, write_function: Callable, variant: Optional[str] = None) -> bool:
+        """
+        write the file with ``write_function`` into a temporary file, and rename it atomically.
+
+        Returns:
+            True if cached, False if the written file is larger than ``max_size``
+        """
+        file_path = self._file_path(path=path, etag=etag, variant=variant)
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=self._TEMP_PREFIX)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write_function(f)
+            if os.path.getsize(temp_path) > self.max_size:
+                os.remove(temp_path)
+                return False
+            os.replace(temp_path, file_path)
+        except BaseException:
+            self._remove(temp_path)
+            raise
+
+        # remove the stale files of the other etag
+        path_prefix = f"{_hash(path)}-"
+        etag_prefix = os.path.basename(self._file_path(path=path, etag=etag))
+        for name in os.listdir(self.cache_dir):
+            if name.startswith(path_prefix) and not name.startswith(etag_prefix):
+                self._remove(os.path.join(self.cache_dir, name))
+        self._evict()
+        return True
+
+    @staticmethod
+    def _remove(file_path: str):
+        # the file may be already removed by another process
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            pass
+
+    def _evict(self):
+        """
+        remove the least recently used files, until the total size is less than ``max_size``.
+        """
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.startswith(self._TEMP_PREFIX) or not entry.is_file():
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total_size = sum([size for _, size, _ in entries])
+        for _, size, file_path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            self._remove(file_path)
+            total_size -= size
+
+    def clear(self):
+        """
+        remove all cached files.
+        """
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and not entry.name.startswith(self._TEMP_PREFIX):
+                self._remove(entry.path)
+
+
+class ParsedCache(DiskCache):
+    """
+    The class is to cache the parsed pd.DataFrame on the local disk in Arrow IPC (Feather V2) format,
+    keyed by the path, the ETag, the reader and its keywords.
+    The cached file is not compressed and memory-mapped to load, so it is much faster than parsing again.
+    The stale files of the other ETag are removed, and the least recently used files are removed as ``DiskCache``.
+
+    ``pyarrow`` is required.
+
+    Examples:
+        >>> import azfs
+        >>> from azfs.cache import ParsedCache
+        >>> azc = azfs.AzFileClient(parsed_cache=ParsedCache(cache_dir="/mnt/nvme/azfs_parsed"))
+        >>> csv_path = "https://testazfs.blob.core.windows.net/test_container/test1.csv"
+        the second read is loaded from the local disk, if the file and the keywords are not changed
+        >>> df = azc.read_csv(csv_path, usecols=["name"])
+        >>> df = azc.read_csv(csv_path, usecols=["name"])
+    """
+
+    @staticmethod
+    def variant(reader: str, kwargs: dict) -> Optional[str]:
+        """
+        normalize the reader and its keywords to the part of the cache key.
+
+        Args:
+            reader: name of the reader, such as ``read_csv``
+            kwargs: keywords to put the reader
+
+        Returns:
+            str, or None if the keywords cannot be normalized, such as the function
+        """
+        def _default(value):
+            if callable(value):
+                raise TypeError(f"{value} cannot be the cache key")
+            if isinstance(value, (set, frozenset)):
+                return sorted(value, key=repr)
+            return repr(value)
+        try:
+            return json.dumps({"reader": reader, "kwargs": kwargs}, sort_keys=True, default=_default)
+        except (TypeError, ValueError):
+            return None
+
+    def get_frame(self, path: str, etag: str, variant: str) -> Optional[pd.DataFrame]:
+        """
+        load the cached pd.DataFrame, if the ETag and the keywords match.
+
+        Returns:
+            pd.DataFrame, or None if not cached
+        """
+        import pyarrow as pa
+        import pyarrow.feather as feather
+        file_path = self._file_path(path=path, etag=etag, variant=variant)
+        try:
+            table = feather.read_table(file_path, memory_map=True)
+        except FileNotFoundError:
+            return None
+        except (pa.ArrowException, OSError):
+            # broken file, such as written by the older version
+            self._remove(file_path)
+            return None
+        self._touch(file_path=file_path)
+        return table.to_pandas()
+
+    def put_frame(self, path: str, etag: str, variant: str, df: pd.DataFrame) -> bool:
+        """
+        cache the parsed pd.DataFrame.
+
+        Returns:
+            True if cached, False if the DataFrame cannot be converted to Arrow, or larger than ``max_size``
+        """
+        import pyarrow as pa
+        import pyarrow.feather as feather
+        if not all([isinstance(column, str) for column in df.columns]):
+            # the column names are converted to str in Arrow
+            return False
+        try:
+            table = pa.Table.from_pandas(df)
+        except (pa.ArrowException, TypeError, ValueError):
+            # such as the column of mixed types
+            return False
+
+        def _write(f):
+            feather.write_feather(table, f, compression="uncompressed")
+        return self._put(path=path, etag=etag, write_function=_write, variant=variant)
+
+
+class MemoryCache:
+    """
+    The class is to cache the small files in memory with the ETag, bounded by the total size and the number.
+    The cached data is returned without any request within ``ttl`` seconds,
+    and after that, revalidated with the conditional request (``If-None-Match``).
+    The least recently used data are removed when exceeding ``max_size`` or ``max_entries``.
+
+    Examples:
+        >>> import azfs
+        >>> from azfs.cache import MemoryCache
+        >>> azc = azfs.AzFileClient(memory_cache=MemoryCache(max_size=16 * 2 ** 20, ttl=30))
+        >>> json_path = "https://testazfs.blob.core.windows.net/test_container/config.json"
+        >>> config = azc.read_json(json_path)
+        >>> azc.cache_stats()
+        {"hits": 0, "misses": 1, "revalidations": 0, "not_modified": 0, "entries": 1, "size": 128}
+    """
+
+    def __init__(self, max_size: int = 64 * 2 ** 20, max_entries: int = 1024, ttl: float = 60.0):
+        """
+
+        Args:
+            max_size: total size of the cached data in bytes
+            max_entries: number of the cached data
+            ttl: seconds to return the cached data without revalidation
+        """
+        self.max_size = max_size
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # path -> (data, etag, validated_at), ordered by the last access
+        self._entries = collections.OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.not_modified = 0
+
+    def __getstate__(self):
+        # lock cannot be pickled (when use multiprocessing), so drop it
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def get(self, path: str) -> Tuple[Optional[bytes], Optional[str]]:
+        """
+        get the cached data of the path.
+
+        Args:
+            path: Azure Blob path URL format
+
+        Returns:
+            ``(data, etag)`` if validated within ``ttl``,
+            ``(None, etag)`` if cached but should be revalidated,
+            ``(None, None)`` if not cached
+        """
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None:
+                self.misses += 1
+                return None, None
+            data, etag, validated_at = entry
+            self._entries.move_to_end(path)
+            if time.monotonic() - validated_at < self.ttl:
+                self.hits += 1
+                return data, etag
+            self.revalidations += 1
+            return None, etag
+
+    def revalidated(self, path: str, etag: str) -> Optional[bytes]:
+        """
+        mark the cached data as validated, when the file is not modified.
+
+        Returns:
+            the cached data, or None if already removed
+        """
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None or entry[1] != etag:
+                return None
+            self.not_modified += 1
+            self._entries[path] = (entry[0], etag, time.monotonic())
+            return entry[0]
+
+    def put(self, path: str, data: bytes, etag: str) -> bool:
+        """
+        cache the data of the path.
+
+        Returns:
+            True if cached, False if the data is larger than ``max_size``
+        """
+        with self._lock:
+            self._pop(path=path)
+            if len(data) > self.max_size:
+                return False
+            self._entries[path] = (data, etag, time.monotonic())
+            self._size += len(data)
+            while self._size > self.max_size or len(self._entries) > self.max_entries:
+                self._pop(path=next(iter(self._entries)))
+            return True
+
+    def _pop(self, path: str):
+        entry = self._entries.pop(path, None)
+        if entry is not None:
+            self._size -= len(entry[0])
+
+    def invalidate(self, path: str):
+        """
+        remove the cached data of the path, when the file is written or removed.
+        """
+        with self._lock:
+            self._pop(path=path)
+
+    def clear(self):
+        """
+        remove all cached data.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> dict:
+        """
+        get the counters of the cache.
+
+        Returns:
+            dict of ``hits``, ``misses``, ``revalidations``, ``not_modified``, ``entries`` and ``size``
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "not_modified": self.not_modified,
+                "entries": len(self._entries),
+                "size": self._size
+            }
@@ -1,5 +1,11 @@
-from typing import Union
+import bisect
+import collections
+from concurrent.futures import ThreadPoolExecutor
+import io
+import threading
+from typing import List, Optional, Tuple, Union
 from .blob_client import AzBlobClient
+from .client_interface import DEFAULT_CHUNK_SIZE, DEFAULT_MAX_CONCURRENCY
 from .datalake_client import AzDataLakeClient
 from .queue_client import AzQueueClient
 
@@ -37,12 +43,29 @@ class AzfsClient(AbstractClient):
         >>> data_path = "https://testazfs.blob.core.windows.net/test_container/test1.json"
         >>> data = AzfsClient(credential="...").get_client("blob").get(path=data_path)
 
+    Clients are created only once for each ``account_kind``, and reused until ``close()`` is called.
+    Each client also caches its service clients by ``account_url``,
+    so the connection-pool and the credential token are shared among the calls.
+
     """
     CLIENTS = {}
 
     def __init__(self, credential, connection_string):
         self._credential = credential
         self._connection_string = connection_string
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # lock and clients cannot be pickled (when use multiprocessing), so drop them
+        state = self.__dict__.copy()
+        state["_clients"] = {}
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
 
     def get_client(self, account_kind: str) -> Union[AzBlobClient, AzDataLakeClient, AzQueueClient]:
         """
@@ -58,26 +81,379 @@ class AzfsClient(AbstractClient):
             >>> azfs_client = AzfsClient(credential="...")
             >>> AzBlobClient = azfs_client.get_client("blob")
         """
-        return self.CLIENTS[account_kind](credential=self._credential, connection_string=self._connection_string)
+        with self._lock:
+            client = self._clients.get(account_kind)
+            if client is None:
+                client = self.CLIENTS[account_kind](
+                    credential=self._credential,
+                    connection_string=self._connection_string)
+                self._clients[account_kind] = client
+        return client
+
+    def close(self):
+        """
+        close all the cached clients, and release their connection-pool.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients = {}
+        for client in clients:
+            client.close()
+
+
+class StreamReader(io.RawIOBase):
+    """
+    The class is to provide seekable file-like object, which downloads only the requested byte-range.
+    Wrap with ``io.BufferedReader`` to read with the buffer of ``chunk_size``.
+
+    If ``prefetch`` is more than 0, the following byte-ranges are downloaded in background threads
+    while the current range is consumed, so that downloading overlaps with parsing.
+    If ``max_chunk_size`` is given, the size of each byte-range is doubled up to ``max_chunk_size``,
+    to reduce the number of requests for the long sequential reading.
+
+    Examples:
+        >>> client = AzfsClient(credential="...").get_client("blob")
+        >>> data_path = "https://testazfs.blob.core.windows.net/test_container/test1.csv.gz"
+        >>> raw = StreamReader(client=client, path=data_path, prefetch=2)
+        >>> f = gzip.GzipFile(fileobj=io.BufferedReader(raw, buffer_size=raw.chunk_size))
+    """
+    def __init__(
+            self,
+            client,
+            path: str,
+            size: Optional[int] = None,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+            prefetch: int = 0,
+            max_chunk_size: Optional[int] = None):
+        super().__init__()
+        self._client = client
+        self._path = path
+        # reuse one file client for every range request
+        self._file_client = client.get_file_client_from_path(path=path)
+        self._size = size if size is not None else client.info(path=path).get("size")
+        self._position = 0
+        self.chunk_size = chunk_size
+        self._initial_chunk_size = chunk_size
+        self._max_chunk_size = chunk_size if max_chunk_size is None else max(chunk_size, max_chunk_size)
+        # end of the latest fetched range, to detect the sequential reading
+        self._fetched_end = 0
+        # the latest downloaded range
+        self._buffer = b""
+        self._buffer_offset = 0
+        # read-ahead ranges, as (offset, future)
+        self._prefetch = prefetch
+        self._prefetched = collections.deque()
+        self._prefetched_end = 0
+        self._executor = ThreadPoolExecutor(max_workers=prefetch) if prefetch > 0 else None
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError(f"invalid whence: {whence}")
+        if position < 0:
+            raise ValueError(f"negative seek position: {position}")
+        self._position = position
+        return self._position
+
+    def _read_range(self, offset: int, length: int) -> bytes:
+        """
+        get bytes-data of the range from AzureStorage
+
+        Returns:
+            AzureStorageFile-byte [offset: offset + length]
+        """
+        return self._client._download_range(file_client=self._file_client, offset=offset, length=length)
+
+    def _cancel_prefetch(self):
+        """
+        cancel the read-ahead ranges, and start the size of byte-range from the initial ``chunk_size`` again.
+        """
+        while self._prefetched:
+            _, future = self._prefetched.popleft()
+            future.cancel()
+        self.chunk_size = self._initial_chunk_size
+
+    def _next_chunk_size(self) -> int:
+        """
+        get the size of the next byte-range, and grow it up to ``max_chunk_size``
+        """
+        chunk_size = self.chunk_size
+        self.chunk_size = min(self.chunk_size * 2, self._max_chunk_size)
+        return chunk_size
+
+    def _fill_prefetch(self, offset: int):
+        """
+        submit the ranges after ``offset`` to the background threads, up to ``prefetch``.
+        """
+        if self._executor is None:
+            return
+        if self._prefetched:
+            offset = self._prefetched_end
+        while len(self._prefetched) < self._prefetch and offset < self._size:
+            length = min(self._next_chunk_size(), self._size - offset)
+            self._prefetched.append((offset, self._executor.submit(self._read_range, offset, length)))
+            offset += length
+        self._prefetched_end = offset
+
+    def _fetch_chunk(self, offset: int) -> bytes:
+        """
+        get the range starting from ``offset``, from the read-ahead ranges if already downloaded.
+        """
+        if self._prefetched and self._prefetched[0][0] == offset:
+            _, future = self._prefetched.popleft()
+            data = future.result()
+        else:
+            if offset != self._fetched_end or self._prefetched:
+                # random access, so the read-ahead ranges and the grown range size are no more needed
+                self._cancel_prefetch()
+            data = self._read_range(offset=offset, length=min(self._next_chunk_size(), self._size - offset))
+        self._fetched_end = offset + len(data)
+        self._fill_prefetch(offset=self._fetched_end)
+        return data
+
+    def _buffer_position(self) -> int:
+        """
+        get the position in the latest downloaded range, after downloading the range if required.
+        """
+        buffer_position = self._position - self._buffer_offset
+        if not 0 <= buffer_position < len(self._buffer):
+            # each request is limited to `chunk_size`, to keep the memory usage small
+            self._buffer = self._fetch_chunk(offset=self._position)
+            self._buffer_offset = self._position
+            buffer_position = 0
+        return buffer_position
+
+    def read_chunk(self) -> bytes:
+        """
+        read the rest of the current byte-range, or the next byte-range without copying to another buffer.
+
+        Returns:
+            bytes, or ``b""`` if reached the end of the file
+        """
+        if self._position >= self._size:
+            return b""
+        buffer_position = self._buffer_position()
+        chunk = self._buffer[buffer_position:] if buffer_position > 0 else self._buffer
+        self._position += len(chunk)
+        return chunk
+
+    def readinto(self, b) -> int:
+        if self._position >= self._size:
+            return 0
+        buffer_position = self._buffer_position()
+        if not self._buffer:
+            return 0
+        read_length = min(len(b), len(self._buffer) - buffer_position)
+        b[:read_length] = memoryview(self._buffer)[buffer_position:buffer_position + read_length]
+        self._position += read_length
+        return read_length
+
+    def close(self):
+        if self._executor is not None:
+            self._cancel_prefetch()
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self._buffer = b""
+        super().close()
+
+
+class RangeReader(io.RawIOBase):
+    """
+    The class is to provide seekable file-like object for the columnar formats such as Parquet,
+    which reads the planned byte-ranges downloaded concurrently in advance with ``fetch()``.
+    The range not downloaded in advance is downloaded on demand, and not kept.
+
+    Examples:
+        >>> client = AzfsClient(credential="...").get_client("blob")
+        >>> data_path = "https://testazfs.blob.core.windows.net/test_container/test1.parquet"
+        >>> raw = RangeReader(client=client, path=data_path)
+        >>> raw.fetch(ranges=[(0, 1024), (4096, 8192)], max_concurrency=4)
+        >>> raw.seek(4096)
+        >>> data = raw.read(1024)
+    """
+    def __init__(self, client, path: str, size: Optional[int] = None):
+        super().__init__()
+        self._client = client
+        self._path = path
+        self._file_client = client.get_file_client_from_path(path=path)
+        self._size = size if size is not None else client.info(path=path).get("size")
+        self._position = 0
+        # downloaded ranges, sorted by the start position
+        self._starts = []
+        self._ranges = {}
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError(f"invalid whence: {whence}")
+        if position < 0:
+            raise ValueError(f"negative seek position: {position}")
+        self._position = position
+        return self._position
+
+    def fetch(
+            self,
+            ranges: List[Tuple[int, int]],
+            max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+            hole_size: int = 2 ** 16) -> None:
+        """
+        download the byte-ranges concurrently.
+        The ranges closer than ``hole_size`` are coalesced into one, and split again by ``chunk_size``.
+
+        Args:
+            ranges: list of ``(start, end)``
+            max_concurrency: number of threads
+            chunk_size: max size of each request
+            hole_size: max gap between the ranges to coalesce
+
+        Returns:
+            None
+        """
+        coalesced = []
+        for start, end in sorted(ranges):
+            start, end = max(start, 0), min(end, self._size)
+            if start >= end:
+                continue
+            if coalesced and start - coalesced[-1][1] <= hole_size:
+                coalesced[-1][1] = max(coalesced[-1][1], end)
+            else:
+                coalesced.append([start, end])
+        requests = [
+            (position, min(position + chunk_size, end))
+            for start, end in coalesced
+            for position in range(start, end, chunk_size)
+            if self._find(position) is None
+        ]
+
+        def _download(request: Tuple[int, int]) -> Tuple[int, bytes]:
+            start, end = request
+            return start, self._client._download_range(file_client=self._file_client, offset=start, length=end - start)
+
+        with ThreadPoolExecutor(max_workers=max(max_concurrency, 1)) as executor:
+            for start, data in executor.map(_download, requests):
+                bisect.insort(self._starts, start)
+                self._ranges[start] = data
+
+    def _find(self, position: int) -> Optional[int]:
+        """
+        find the start of the downloaded range, which contains ``position``.
+        """
+        index = bisect.bisect_right(self._starts, position) - 1
+        if index >= 0:
+            start = self._starts[index]
+            if position < start + len(self._ranges[start]):
+                return start
+        return None
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self._size - self._position
+        end = min(self._position + size, self._size)
+        pieces = []
+        while self._position < end:
+            start = self._find(self._position)
+            if start is not None:
+                data = self._ranges[start]
+                piece = data[self._position - start:end - start]
+            else:
+                # download until the next downloaded range
+                index = bisect.bisect_right(self._starts, self._position)
+                piece_end = min(end, self._starts[index]) if index < len(self._starts) else end
+                piece = self._client._download_range(
+                    file_client=self._file_client,
+                    offset=self._position,
+                    length=piece_end - self._position)
+                if not piece:
+                    break
+            pieces.append(piece)
+            self._position += len(piece)
+        return b"".join(pieces)
+
+    def readinto(self, b) -> int:
+        data = self.read(len(b))
+        b[:len(data)] = data
+        return len(data)
+
+    def close(self):
+        self._starts = []
+        self._ranges = {}
+        super().close()
 
 
 class TextReader:
     """
     The class is to provide line-based reading iterator.
     Reading file should be ends-with "\n", otherwise last line will be ignored.
+
+    The file is read with ``StreamReader``, reusing one file client.
+    The size of each byte-range starts from ``length``, and grows up to ``max_length``,
+    and the next byte-range is downloaded in background while the lines are consumed.
+    Call ``close()`` or use ``with`` statement, if the iteration may stop before the end of the file.
+
+    Examples:
+        >>> with TextReader(client=client, path=data_path) as text_reader:
+        ...     header = next(text_reader)
     """
-    def __init__(self, client, path: str, offset: int = 0, length: int = 2 ** 14, size: int = None):
-        self._client = client
-        self._size = client.info(path).get("size", size)
-        self._rest_part = b""
-        self._offset = offset
-        self._length = length
-        self._read_length = length
-        self._iter = 0
+    def __init__(
+            self,
+            client,
+            path: str,
+            offset: int = 0,
+            length: int = 2 ** 14,
+            size: int = None,
+            max_length: int = 8 * 2 ** 20,
+            prefetch: int = 1):
+        self._reader = StreamReader(
+            client=client,
+            path=path,
+            size=size,
+            chunk_size=length,
+            prefetch=prefetch,
+            max_chunk_size=max_length)
+        self._reader.seek(offset)
         self._path = path
-        self._byte_text = None
-        self._current_chunk_lines = None
-        self._current_chunk_lines_length = None
+        self._rest_part = b""
+        self._current_chunk_lines = []
         self._line_counter = 0
 
     def get_chunk(self) -> bytes:
@@ -87,20 +463,34 @@ class TextReader:
         Returns:
             AzureStorageFile-byte [start: end]
         """
-        if self._read_length < 0:
+        chunk = self._reader.read_chunk()
+        if not chunk:
+            self.close()
             raise StopIteration()
-        rtn = self._rest_part + self._client.get(path=self._path, offset=self._offset, length=self._length)
-        self._iter += 1
-        self._offset = self._iter * self._length
-        self._read_length = min(self._length, self._size - self._offset)
-        return rtn
+        return self._rest_part + chunk
+
+    def close(self):
+        """
+        stop downloading in background, when the iteration is stopped before the end of the file.
+        """
+        self._reader.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __del__(self):
+        # `_reader` is not set, if `__init__` failed
+        if hasattr(self, "_reader"):
+            self.close()
 
     def next_line(self) -> bytes:
-        if self._byte_text is None or self._line_counter >= self._current_chunk_lines_length:
-            self._byte_text = self.get_chunk()
-            chunk_lines = self._byte_text.split("\n".encode('utf-8'))
+        while self._line_counter >= len(self._current_chunk_lines):
+            byte_text = self.get_chunk()
+            chunk_lines = byte_text.split("\n".encode('utf-8'))
             self._current_chunk_lines = chunk_lines[:-1]
-            self._current_chunk_lines_length = len(self._current_chunk_lines)
             self._line_counter = 0
             self._rest_part = chunk_lines[-1]
         current_line = self._current_chunk_lines[self._line_counter]
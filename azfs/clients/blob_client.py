@@ -1,7 +1,14 @@
-from typing import Union
+from typing import List, Optional, Union
 from azure.identity import DefaultAzureCredential
-from azure.storage.blob import BlobClient, ContainerClient, BlobServiceClient
-from .client_interface import ClientInterface
+from azure.storage.blob import BlobBlock, BlobClient, BlobPrefix, ContainerClient, BlobServiceClient
+from .client_interface import (
+    ClientInterface,
+    DEFAULT_BLOCK_SIZE,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_MAX_CONCURRENCY,
+    iter_blocks,
+    run_concurrently
+)
 
 
 class AzBlobClient(ClientInterface):
@@ -77,16 +84,93 @@ class AzBlobClient(ClientInterface):
             [f.name for f in self.get_container_client_from_path(path=path).list_blobs(name_starts_with=file_path)]
         return blob_list
 
-    def _get(self, path: str, offset: int = None, length: int = None, **kwargs):
-        file_bytes = self.get_file_client_from_path(path=path).download_blob(offset=offset, length=length).readall()
+    def _ls_detail(self, path: str, file_path: str) -> List[dict]:
+        blob_list = self.get_container_client_from_path(path=path).list_blobs(name_starts_with=file_path)
+        return [{"name": f.name, "size": f.size, "is_directory": False} for f in blob_list]
+
+    def _walk(self, path: str, file_path: str) -> List[dict]:
+        # the blobs deeper than the delimiter are listed as one BlobPrefix, such as `dir1/`
+        walk_list = self.get_container_client_from_path(path=path).walk_blobs(
+            name_starts_with=file_path or None, delimiter="/")
+        return [
+            {"name": f.name.rstrip("/"), "size": None, "is_directory": True} if isinstance(f, BlobPrefix)
+            else {"name": f.name, "size": f.size, "is_directory": False}
+            for f in walk_list
+        ]
+
+    def _download(self, file_client: BlobClient, offset: int = None, length: int = None, **kwargs):
+        return file_client.download_blob(offset=offset, length=length, **kwargs)
+
+    def _get(
+            self,
+            path: str,
+            offset: int = None,
+            length: int = None,
+            max_concurrency: Optional[int] = None,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+            **kwargs):
+        if max_concurrency is not None and max_concurrency > 1:
+            return self._get_ranges(
+                path=path,
+                offset=offset,
+                length=length,
+                max_concurrency=max_concurrency,
+                chunk_size=chunk_size)
+        file_bytes = self._download_range(
+            file_client=self.get_file_client_from_path(path=path),
+            offset=offset,
+            length=length)
         return file_bytes
 
-    def _put(self, path: str, data):
-        self.get_file_client_from_path(path=path).upload_blob(
-            data=data,
-            length=len(data),
-            overwrite=True
-        )
+    def _put(
+            self,
+            path: str,
+            data,
+            block_size: int = DEFAULT_BLOCK_SIZE,
+            max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+            **kwargs):
+        """
+        Upload data in one request if the data is smaller than ``block_size``.
+        Otherwise, the data are split into blocks, staged concurrently with ``stage_block``,
+        and committed with ``commit_block_list``.
+
+        Args:
+            path:
+            data: bytes, memoryview, str, file-like object or iterable of bytes
+            block_size: size of each block
+            max_concurrency: number of threads to stage blocks
+
+        Returns:
+            True if correctly uploaded
+        """
+        file_client = self.get_file_client_from_path(path=path)
+        try:
+            data_length = len(data)
+        except TypeError:
+            # file-like object or generator
+            data_length = None
+        if data_length is not None and data_length <= block_size:
+            file_client.upload_blob(
+                data=data,
+                length=data_length,
+                overwrite=True
+            )
+            return True
+
+        block_list = []
+
+        def _stage_block_kwargs():
+            for idx, block in enumerate(iter_blocks(data=data, block_size=block_size)):
+                # block_id must be the same length in one blob
+                block_id = f"{idx:032d}"
+                block_list.append(BlobBlock(block_id=block_id))
+                yield {"block_id": block_id, "data": block, "length": len(block)}
+
+        run_concurrently(
+            function=file_client.stage_block,
+            kwargs_iter=_stage_block_kwargs(),
+            max_concurrency=max_concurrency)
+        file_client.commit_block_list(block_list)
         return True
 
     def _create(self, path: str):
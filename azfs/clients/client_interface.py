@@ -1,5 +1,10 @@
 from abc import abstractmethod
-from typing import Union, Optional
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import io
+import threading
+from typing import Callable, Iterable, Iterator, List, Tuple, Union, Optional
+from azure.core import MatchConditions
+from azure.core.exceptions import ResourceNotModifiedError
 from azure.identity import DefaultAzureCredential
 from azure.storage.blob import BlobClient, ContainerClient
 from azure.storage.filedatalake import DataLakeFileClient, FileSystemClient
@@ -18,6 +23,95 @@ FileSystemClientType = Union[
     FileSystemClient
 ]
 
+# default size of each byte-range, when downloading with `max_concurrency`
+DEFAULT_CHUNK_SIZE = 4 * 2 ** 20
+# default size of each block and number of threads, when uploading
+DEFAULT_BLOCK_SIZE = 4 * 2 ** 20
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+def iter_blocks(data, block_size: int) -> Iterator[bytes]:
+    """
+    split data into blocks, each length is ``block_size`` except the last one.
+
+    Args:
+        data: bytes, bytearray, memoryview, str, file-like object or iterable of bytes
+        block_size: length of each block
+
+    Returns:
+        iterator of bytes
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        view = memoryview(data)
+        for start in range(0, len(view), block_size):
+            yield bytes(view[start:start + block_size])
+    elif hasattr(data, "read"):
+        while True:
+            block = data.read(block_size)
+            if not block:
+                break
+            yield block
+    else:
+        # re-chunk the iterable (such as generator) into `block_size`
+        buffer = bytearray()
+        for piece in data:
+            buffer += piece
+            while len(buffer) >= block_size:
+                yield bytes(buffer[:block_size])
+                del buffer[:block_size]
+        if buffer:
+            yield bytes(buffer)
+
+
+class _BufferWriter:
+    """
+    writable stream over the memoryview, to download the range directly into the pre-allocated buffer.
+    """
+    def __init__(self, view: memoryview):
+        self._view = view
+        self._position = 0
+
+    def write(self, data) -> int:
+        length = len(data)
+        self._view[self._position:self._position + length] = data
+        self._position += length
+        return length
+
+    def release(self):
+        self._view.release()
+
+
+def run_concurrently(function: Callable, kwargs_iter: Iterable[dict], max_concurrency: int) -> None:
+    """
+    call ``function(**kwargs)`` for each kwargs on a thread pool.
+    Tasks in flight are limited to ``2 * max_concurrency``,
+    so that the iterable (such as blocks to upload) is not fully loaded in memory.
+
+    Args:
+        function: function to call
+        kwargs_iter: iterable of keyword arguments for the function
+        max_concurrency: number of threads
+
+    Returns:
+        None
+
+    Raises:
+        Exception: the first exception raised in the function
+    """
+    max_pending = 2 * max_concurrency
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        pending = set()
+        for kwargs in kwargs_iter:
+            pending.add(executor.submit(function, **kwargs))
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    future.result()
+        for future in pending:
+            future.result()
+
 
 class ClientInterface:
     """
@@ -30,6 +124,9 @@ class ClientInterface:
     * _ls
     * _get
     * _put
+
+    Service clients are cached by ``account_url``,
+    so that the HTTP connection-pool and the token of the credential are reused among the calls.
     """
 
     def __init__(
@@ -38,6 +135,19 @@ class ClientInterface:
             connection_string: Optional[str] = None):
         self.credential = credential
         self.connection_string = connection_string
+        self._service_clients = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # lock and service clients cannot be pickled (when use multiprocessing), so drop them
+        state = self.__dict__.copy()
+        state["_service_clients"] = {}
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
 
     @abstractmethod
     def _get_service_client_from_credential(
@@ -63,14 +173,37 @@ class ClientInterface:
         raise NotImplementedError
 
     def _get_service_client_from_url(self, account_url):
-        if self.credential is not None:
-            return self._get_service_client_from_credential(account_url=account_url, credential=self.credential)
-        elif self.connection_string is not None:
-            return self._get_service_client_from_connection_string(connection_string=self.connection_string)
+        with self._lock:
+            service_client = self._service_clients.get(account_url)
+            if service_client is not None:
+                return service_client
+            if self.credential is not None:
+                service_client = self._get_service_client_from_credential(
+                    account_url=account_url,
+                    credential=self.credential)
+            elif self.connection_string is not None:
+                service_client = self._get_service_client_from_connection_string(
+                    connection_string=self.connection_string)
+            if service_client is not None:
+                self._service_clients[account_url] = service_client
+            return service_client
 
     def get_service_client_from_url(self, account_url):
         return self._get_service_client_from_url(account_url=account_url)
 
+    def close(self):
+        """
+        close the cached service clients, and release their connection-pool.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            service_clients = list(self._service_clients.values())
+            self._service_clients = {}
+        for service_client in service_clients:
+            service_client.close()
+
     def get_file_client_from_path(self, path: str) -> FileClientType:
         """
         get file_client from given path
@@ -144,6 +277,32 @@ class ClientInterface:
         """
         raise NotImplementedError
 
+    def ls_detail(self, path: str, file_path: str) -> List[dict]:
+        return self._ls_detail(path=path, file_path=file_path)
+
+    def _ls_detail(self, path: str, file_path: str) -> List[dict]:
+        """
+        list the files with the size in bytes, in one listing.
+        The size is None, if the client does not list it.
+        :param path:
+        :param file_path:
+        :return: list of dict, which has ``name``, ``size`` and ``is_directory``
+        """
+        return [{"name": f, "size": None, "is_directory": False} for f in self._ls(path=path, file_path=file_path)]
+
+    def walk(self, path: str, file_path: str) -> List[dict]:
+        return self._walk(path=path, file_path=file_path)
+
+    def _walk(self, path: str, file_path: str) -> List[dict]:
+        """
+        list the files and the directories just under the directory of ``file_path``, with the delimiter ``/``.
+        ``file_path`` is the directory ending with ``/``, or the prefix of the names in it, such as ``data/2026-``.
+        :param path:
+        :param file_path:
+        :return: list of dict, which has ``name``, ``size`` and ``is_directory``
+        """
+        raise NotImplementedError
+
     def get(self, path: str, offset: int = None, length: int = None, **kwargs):
         """
         download data from Azure Blob or DataLake.
@@ -152,13 +311,120 @@ class ClientInterface:
             path:
             offset:
             length:
-            **kwargs:
+            **kwargs: ``max_concurrency`` and ``chunk_size`` are accepted in Blob and DataLake
 
         Returns:
 
         """
         return self._get(path=path, offset=offset, length=length, **kwargs)
 
+    @abstractmethod
+    def _download(self, file_client: FileClientType, offset: int = None, length: int = None, **kwargs):
+        """
+        abstract method to be implemented
+        start downloading the specified byte-range with one request
+
+        Args:
+            file_client: BlobClient or DataLakeFileClient
+            offset: start position of the range
+            length: length of the range
+            **kwargs: conditions of the request, such as ``etag`` and ``match_condition``
+
+        Returns:
+            StorageStreamDownloader
+        """
+        raise NotImplementedError
+
+    def get_if_modified(self, path: str, etag: Optional[str] = None) -> Tuple[Optional[bytes], Optional[str]]:
+        """
+        download the whole file with its ETag.
+        If ``etag`` is given, the file is downloaded only if modified, with ``If-None-Match`` header.
+
+        Args:
+            path:
+            etag: ETag of the data already downloaded
+
+        Returns:
+            tuple of bytes and the ETag, or ``(None, etag)`` if not modified
+        """
+        kwargs = {}
+        if etag is not None:
+            kwargs = {"etag": etag, "match_condition": MatchConditions.IfModified}
+        try:
+            downloader = self._download(file_client=self.get_file_client_from_path(path=path), **kwargs)
+        except ResourceNotModifiedError:
+            return None, etag
+        return downloader.readall(), downloader.properties.etag
+
+    def _download_range(self, file_client: FileClientType, offset: int = None, length: int = None) -> bytes:
+        """
+        download the specified byte-range with one request
+
+        Args:
+            file_client: BlobClient or DataLakeFileClient
+            offset: start position of the range
+            length: length of the range
+
+        Returns:
+            bytes
+        """
+        return self._download(file_client=file_client, offset=offset, length=length).readall()
+
+    def _get_ranges(
+            self,
+            path: str,
+            offset: int = None,
+            length: int = None,
+            max_concurrency: int = 1,
+            chunk_size: int = DEFAULT_CHUNK_SIZE) -> io.BytesIO:
+        """
+        download data by splitting into byte-ranges of ``chunk_size``,
+        and fetch them concurrently with ``max_concurrency`` threads into one pre-allocated buffer.
+
+        Args:
+            path:
+            offset: start position to download, default 0
+            length: length to download, default the rest of the file
+            max_concurrency: number of threads to download the ranges
+            chunk_size: size of each byte-range
+
+        Returns:
+            io.BytesIO, which holds the downloaded data without another copy
+        """
+        file_client = self.get_file_client_from_path(path=path)
+        start = 0 if offset is None else offset
+        if length is None:
+            length = self._info(path=path).get("size") - start
+        if length <= 0:
+            return io.BytesIO()
+        if max_concurrency <= 1 or length <= chunk_size:
+            return io.BytesIO(self._download_range(file_client=file_client, offset=start, length=length))
+
+        # allocate the internal buffer of BytesIO, and write each range directly into it
+        buffer = io.BytesIO()
+        buffer.seek(length - 1)
+        buffer.write(b"\0")
+        view = buffer.getbuffer()
+
+        def _fetch(position: int):
+            range_length = min(chunk_size, length - position)
+            writer = _BufferWriter(view=view[position:position + range_length])
+            self._download(
+                file_client=file_client,
+                offset=start + position,
+                length=range_length
+            ).readinto(writer)
+            writer.release()
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                # consume the iterator, to raise the exception if occurred
+                _ = list(executor.map(_fetch, range(0, length, chunk_size)))
+        finally:
+            view.release()
+        buffer.seek(0)
+        return buffer
+
     @abstractmethod
     def _get(self, path: str, offset: int = None, length: int = None, **kwargs):
         """
@@ -174,11 +440,11 @@ class ClientInterface:
         """
         raise NotImplementedError
 
-    def put(self, path: str, data):
-        return self._put(path=path, data=data)
+    def put(self, path: str, data, **kwargs):
+        return self._put(path=path, data=data, **kwargs)
 
     @abstractmethod
-    def _put(self, path: str, data):
+    def _put(self, path: str, data, **kwargs):
         """
         abstract method to be implemented
         :param path:
@@ -1,8 +1,17 @@
-import math
-from typing import Union
+from typing import List, Optional, Union
+from azure.core.exceptions import ResourceNotFoundError
 from azure.identity import DefaultAzureCredential
 from azure.storage.filedatalake import DataLakeFileClient, FileSystemClient, DataLakeServiceClient
-from .client_interface import ClientInterface
+from .client_interface import (
+    ClientInterface,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_MAX_CONCURRENCY,
+    iter_blocks,
+    run_concurrently
+)
+
+# 2 ** 23 = 8_388_608 ~= 10_000_000, to avoid uploading limitation in one request
+DATALAKE_BLOCK_SIZE = 2 ** 23
 
 
 class AzDataLakeClient(ClientInterface):
@@ -79,38 +88,111 @@ class AzDataLakeClient(ClientInterface):
             [f.name for f in self.get_container_client_from_path(path=path).get_paths(path=file_path, recursive=True)]
         return file_list
 
-    def _get(self, path: str, offset: int = None, length: int = None, **kwargs):
-        file_bytes = self.get_file_client_from_path(path).download_file(offset=offset, length=length).readall()
+    def _ls_detail(self, path: str, file_path: str) -> List[dict]:
+        path_list = self.get_container_client_from_path(path=path).get_paths(path=file_path, recursive=True)
+        try:
+            return [
+                {
+                    "name": f.name,
+                    "size": None if f.is_directory else f.content_length,
+                    "is_directory": bool(f.is_directory)
+                }
+                for f in path_list
+            ]
+        except ResourceNotFoundError:
+            return []
+
+    def _walk(self, path: str, file_path: str) -> List[dict]:
+        # get_paths() lists the directory, so the prefix of the names in it is filtered after listed
+        directory = file_path.rsplit("/", 1)[0] if "/" in file_path else None
+        try:
+            return [
+                {
+                    "name": f.name,
+                    "size": None if f.is_directory else f.content_length,
+                    "is_directory": bool(f.is_directory)
+                }
+                for f in self.get_container_client_from_path(path=path).get_paths(path=directory, recursive=False)
+                if f.name.startswith(file_path)
+            ]
+        except ResourceNotFoundError:
+            return []
+
+    def _download(self, file_client: DataLakeFileClient, offset: int = None, length: int = None, **kwargs):
+        return file_client.download_file(offset=offset, length=length, **kwargs)
+
+    def _get(
+            self,
+            path: str,
+            offset: int = None,
+            length: int = None,
+            max_concurrency: Optional[int] = None,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+            **kwargs):
+        if max_concurrency is not None and max_concurrency > 1:
+            return self._get_ranges(
+                path=path,
+                offset=offset,
+                length=length,
+                max_concurrency=max_concurrency,
+                chunk_size=chunk_size)
+        file_bytes = self._download_range(
+            file_client=self.get_file_client_from_path(path=path),
+            offset=offset,
+            length=length)
         return file_bytes
 
-    def _put(self, path: str, data):
+    def _put(
+            self,
+            path: str,
+            data,
+            block_size: int = DATALAKE_BLOCK_SIZE,
+            max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+            **kwargs):
         """
         In DataLake Storage Account, uploading the file over 100MB may raise Exception like
         `(RequestBodyTooLarge) The request body is too large and exceeds the maximum permissible limit`.
 
         So in order to avoid the exception above, data are uploaded by appending.
+        Each block is appended at its offset concurrently, and flushed only once at the end.
 
         Args:
             path:
-            data:
+            data: bytes, memoryview, str, file-like object or iterable of bytes
+            block_size: size of each appended block, default 8MiB
+            max_concurrency: number of threads to append blocks
 
         Returns:
 
         """
         file_client = self.get_file_client_from_path(path=path)
         _ = file_client.create_file()
-        # upload data
-        data_length = len(data)
-        # 2 ** 23 = 8_388_608 ~= 10_000_000
-        upload_unit = 2 ** 23
-        append_times = math.ceil(data_length / upload_unit)
-        # to avoid uploading limitation in one time
-        for idx in range(append_times):
-            start = idx * upload_unit
-            end = min((idx + 1) * upload_unit, data_length)
-            split_data = data[start:end]
-            # upload data
-            self.append(path=path, data=split_data, offset=start)
+        try:
+            data_length = len(data)
+        except TypeError:
+            # file-like object or generator
+            data_length = None
+        if data_length is not None and data_length <= block_size:
+            if data_length > 0:
+                file_client.append_data(data=data, offset=0, length=data_length)
+            _ = file_client.flush_data(data_length)
+            return True
+
+        # total length is determined after all blocks are read
+        uploaded_length = 0
+
+        def _append_data_kwargs():
+            nonlocal uploaded_length
+            for block in iter_blocks(data=data, block_size=block_size):
+                yield {"data": block, "offset": uploaded_length, "length": len(block)}
+                uploaded_length += len(block)
+
+        run_concurrently(
+            function=file_client.append_data,
+            kwargs_iter=_append_data_kwargs(),
+            max_concurrency=max_concurrency)
+        # write data
+        _ = file_client.flush_data(uploaded_length)
         return True
 
     def _create(self, path: str) -> dict:
@@ -71,6 +71,9 @@ class AzQueueClient(ClientInterface):
     def _ls(self, path: str, file_path: str):
         return self.get_file_client_from_path(path).peek_messages(16)
 
+    def _download(self, file_client, offset: int = None, length: int = None, **kwargs):
+        raise NotImplementedError
+
     def _get(self, path: str, offset: int = None, length: int = None, **kwargs):
         """
 
@@ -107,7 +110,7 @@ class AzQueueClient(ClientInterface):
         except StopIteration:
             return {"status": "error", "message": "queue not found"}
 
-    def _put(self, path: str, data):
+    def _put(self, path: str, data, **kwargs):
         """
         put message in queue with base64-encoded.
 
@@ -6,9 +6,14 @@ import lzma
 import os
 import pickle
 import sys
+from types import SimpleNamespace
+from typing import Dict, Optional, Union
 import pandas as pd
 import pytest
+from azure.core import MatchConditions
+from azure.core.exceptions import ResourceNotModifiedError
 import azfs
+from azfs.utils import BlobPathDecoder
 
 # テスト対象のファイルへのパスを通している
 # pytestの設定
@@ -124,6 +129,71 @@ def _get_json(mocker):
     yield func_mock
 
 
+class DownloaderMock:
+    # dummy StorageStreamDownloader class
+    def __init__(self, data: bytes, etag: Optional[str] = None):
+        self._data = data
+        self.properties = SimpleNamespace(etag=etag)
+
+    def readall(self) -> bytes:
+        return self._data
+
+    def readinto(self, stream) -> int:
+        return stream.write(self._data)
+
+
+@pytest.fixture()
+def _download(mocker):
+    """
+    mock `_download` and `_info` of the client class, to download the byte-range of the given data.
+    As same as the SDK, `offset` must be set if `length` is set,
+    and `ResourceNotModifiedError` is raised if `etag` matches with `MatchConditions.IfModified`.
+
+    Examples:
+        >>> download_mock, info_mock = _download(AzBlobClient, b"name,age\n")
+
+    """
+    def _patch(client_class, data: Union[bytes, Dict[str, bytes]], etag: Optional[str] = None):
+        # dict of the file path in the container and its data, to mock several files
+        files = data if isinstance(data, dict) else None
+
+        def _data(file_path: str) -> bytes:
+            return data if files is None else files[file_path]
+
+        def _side_effect(file_client, offset=None, length=None, **kwargs):
+            if offset is None and length is not None:
+                raise ValueError("Offset value must not be None if length is set.")
+            if kwargs.get("match_condition") == MatchConditions.IfModified and kwargs.get("etag") == etag:
+                raise ResourceNotModifiedError("The condition specified using HTTP conditional header(s) is not met.")
+            file_data = _data(getattr(file_client, "blob_name", None) or getattr(file_client, "path_name", None))
+            start = 0 if offset is None else offset
+            end = len(file_data) if length is None else start + length
+            return DownloaderMock(file_data[start:end], etag=etag)
+
+        def _info(file_path: Optional[str] = None) -> dict:
+            info = {"size": len(_data(file_path))}
+            if etag is not None:
+                info["etag"] = etag
+            return info
+
+        def _info_side_effect(path: str):
+            _, _, _, file_path = BlobPathDecoder(path).get_with_url()
+            return _info(file_path)
+
+        download_mock = mocker.MagicMock()
+        download_mock.side_effect = _side_effect
+        info_mock = mocker.MagicMock()
+        if files is None:
+            info_mock.return_value = _info()
+        else:
+            info_mock.side_effect = _info_side_effect
+        mocker.patch.object(client_class, "_download", download_mock)
+        mocker.patch.object(client_class, "_info", info_mock)
+        return download_mock, info_mock
+
+    yield _patch
+
+
 @pytest.fixture()
 def _put(mocker):
     """
@@ -170,6 +240,49 @@ def _ls_for_glob(mocker):
     yield func_mock
 
 
+@pytest.fixture()
+def _ls_detail_for_glob(mocker, _ls_for_glob):
+    """
+    the files of ``_ls_for_glob`` with the size
+    :param mocker:
+    :param _ls_for_glob:
+    :return:
+    """
+    return_value = [
+        {"name": f, "size": 10 * (i + 1), "is_directory": False} for i, f in enumerate(_ls_for_glob.return_value)
+    ]
+    func_mock = mocker.MagicMock()
+    func_mock.return_value = return_value
+    yield func_mock
+
+
+@pytest.fixture()
+def _walk_for_glob(mocker, _ls_detail_for_glob):
+    """
+    list the files of ``_ls_detail_for_glob`` with the delimiter ``/``
+    :param mocker:
+    :param _ls_detail_for_glob:
+    :return:
+    """
+    def _walk(path: str, file_path: str) -> list:
+        directory = file_path.rsplit("/", 1)[0] + "/" if "/" in file_path else ""
+        result = {}
+        for f in _ls_detail_for_glob.return_value:
+            if not f["name"].startswith(file_path):
+                continue
+            name = f["name"][len(directory):]
+            if "/" in name:
+                name = f"{directory}{name.split('/', 1)[0]}"
+                result[name] = {"name": name, "size": None, "is_directory": True}
+            else:
+                result[f["name"]] = f
+        return list(result.values())
+
+    func_mock = mocker.MagicMock()
+    func_mock.side_effect = _walk
+    yield func_mock
+
+
 @pytest.fixture()
 def _rm(mocker):
     """
@@ -199,3 +312,5 @@ def var_df() -> pd.DataFrame:
 def var_azc() -> azfs.AzFileClient:
     azc = azfs.AzFileClient()
     yield azc
+    # shut down the persistent pool started with `use_mp=True`
+    azc.close_pool()
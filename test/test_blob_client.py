@@ -1,6 +1,8 @@
+import io
+import pickle
 import pytest
 from azfs.clients.blob_client import AzBlobClient
-from azure.storage.blob import BlobClient, ContainerClient
+from azure.storage.blob import BlobClient, BlobPrefix, BlobProperties, BlobServiceClient, ContainerClient
 import azfs
 
 credential = ""
@@ -131,3 +133,130 @@ def test_blob_ls(mocker, blob_client):
     mocker.patch.object(ContainerClient, "list_blobs", func_mock)
     file_list = blob_client.ls(path=test_file_ls_path, file_path=test_file_ls_path)
     assert file_list
+
+
+def test_blob_walk(mocker):
+    # ===================== #
+    # test for AzBlobClient #
+    # ===================== #
+
+    # mock
+    blob = BlobProperties(name="root/test.csv")
+    blob.size = 500
+    func_mock = mocker.MagicMock()
+    func_mock.return_value = [BlobPrefix(None, prefix="root/dir1/"), blob]
+
+    mocker.patch.object(ContainerClient, "walk_blobs", func_mock)
+    file_list = blob_client_credential.walk(path=test_file_ls_path, file_path="root/")
+    assert file_list == [
+        {"name": "root/dir1", "size": None, "is_directory": True},
+        {"name": "root/test.csv", "size": 500, "is_directory": False}
+    ]
+    assert func_mock.call_args.kwargs == {"name_starts_with": "root/", "delimiter": "/"}
+
+
+@pytest.mark.parametrize("blob_client", [
+    # blob client
+    AzBlobClient(credential=credential),
+    AzBlobClient(credential=None, connection_string=connection_string),
+])
+def test_blob_service_client_cache(mocker, blob_client):
+    # ===================== #
+    # test for AzBlobClient #
+    # ===================== #
+
+    # the service client is created only once for each account_url
+    service_client = blob_client.get_service_client_from_url(account_url="https://test.blob.core.windows.net")
+    file_client_1 = blob_client.get_file_client_from_path(path=test_file_path)
+    file_client_2 = blob_client.get_file_client_from_path(path=test_file_path)
+    assert blob_client.get_service_client_from_url(account_url="https://test.blob.core.windows.net") is service_client
+    assert file_client_1._pipeline._transport._transport is file_client_2._pipeline._transport._transport
+
+    # lock and cached service clients are dropped, when pickled for multiprocessing
+    restored_client = pickle.loads(pickle.dumps(blob_client))
+    assert restored_client.get_service_client_from_url(
+        account_url="https://test.blob.core.windows.net") is not service_client
+
+    # the service client is closed, and created again after `close()`
+    func_mock = mocker.MagicMock()
+    mocker.patch.object(BlobServiceClient, "close", func_mock)
+    blob_client.close()
+    func_mock.assert_called_once()
+    assert blob_client.get_service_client_from_url(account_url="https://test.blob.core.windows.net") is not service_client
+
+
+def test_azfs_client_cache(mocker):
+    # ===================== #
+    # test for AzFileClient #
+    # ===================== #
+    azc_ = azfs.AzFileClient(credential=credential)
+    blob_client = azc_._client.get_client(account_kind="blob")
+    assert azc_._client.get_client(account_kind="blob") is blob_client
+    assert azc_._client.get_client(account_kind="dfs") is not blob_client
+
+    func_mock = mocker.MagicMock()
+    mocker.patch.object(AzBlobClient, "close", func_mock)
+    azc_.close()
+    func_mock.assert_called_once()
+    assert azc_._client.get_client(account_kind="blob") is not blob_client
+
+
+@pytest.mark.parametrize("blob_client", [
+    # blob client
+    blob_client_credential,
+    blob_client_connection_string,
+])
+def test_blob_get_ranges(_download, blob_client):
+    # ===================== #
+    # test for AzBlobClient #
+    # ===================== #
+    data = b'name,age\nalice,10\nbob,10\n'
+
+    # mock
+    download_mock, info_mock = _download(AzBlobClient, data)
+
+    result = blob_client.get(path=test_file_path, max_concurrency=4, chunk_size=4)
+    assert result.getvalue() == data
+    assert download_mock.call_count == 7
+
+    # with offset and length
+    result = blob_client.get(path=test_file_path, offset=5, length=10, max_concurrency=4, chunk_size=4)
+    assert result.getvalue() == data[5:15]
+
+    # the file smaller than chunk_size is downloaded with one request, from the head of the file
+    download_mock.reset_mock()
+    result = blob_client.get(path=test_file_path, max_concurrency=4, chunk_size=1024)
+    assert result.getvalue() == data
+    download_mock.assert_called_once()
+    assert download_mock.call_args.kwargs["offset"] == 0
+
+    # ===================== #
+    # test for AzFileClient #
+    # ===================== #
+    df = azc.read_csv(path=test_file_path, max_concurrency=4, chunk_size=4)
+    assert len(df.index) == 2
+
+
+@pytest.mark.parametrize("data", [
+    b'name,age\nalice,10\nbob,10\n',
+    memoryview(b'name,age\nalice,10\nbob,10\n'),
+    io.BytesIO(b'name,age\nalice,10\nbob,10\n'),
+    (b for b in [b'name,', b'age\nalice,10\n', b'bob,10\n']),
+])
+def test_blob_upload_blocks(mocker, data):
+    # ===================== #
+    # test for AzBlobClient #
+    # ===================== #
+
+    # mock
+    stage_block_mock = mocker.MagicMock()
+    commit_block_list_mock = mocker.MagicMock()
+    mocker.patch.object(BlobClient, "stage_block", stage_block_mock)
+    mocker.patch.object(BlobClient, "commit_block_list", commit_block_list_mock)
+
+    result = blob_client_credential.put(path=test_file_path, data=data, block_size=4, max_concurrency=2)
+    assert result
+    assert stage_block_mock.call_count == 7
+    staged = {c.kwargs["block_id"]: c.kwargs["data"] for c in stage_block_mock.call_args_list}
+    block_list = commit_block_list_mock.call_args[0][0]
+    assert b"".join([staged[b.id] for b in block_list]) == b'name,age\nalice,10\nbob,10\n'
@@ -0,0 +1,139 @@
+import os
+import time
+import pandas as pd
+from azfs import AzFileSystem
+from azfs.cache import DiskCache, MemoryCache, ParsedCache
+from azfs.clients.blob_client import AzBlobClient
+
+
+class TestDiskCache:
+    path = "https://testazfs.blob.core.windows.net/test_caontainer/test.csv"
+
+    def test_get_put(self, tmp_path):
+        disk_cache = DiskCache(cache_dir=str(tmp_path))
+        assert disk_cache.get(path=self.path, etag="0x1") is None
+
+        assert disk_cache.put(path=self.path, etag="0x1", data=b"name,age\n")
+        assert disk_cache.get(path=self.path, etag="0x1") == b"name,age\n"
+        assert disk_cache.get(path=self.path, etag="0x1", offset=5, length=3) == b"age"
+        with disk_cache.open(path=self.path, etag="0x1") as f:
+            assert f.read() == b"name,age\n"
+
+        # the file is modified, so the stale data is removed
+        assert disk_cache.get(path=self.path, etag="0x2") is None
+        assert disk_cache.put(path=self.path, etag="0x2", data=b"name,age\nalice,10\n")
+        assert disk_cache.get(path=self.path, etag="0x1") is None
+        assert len(os.listdir(str(tmp_path))) == 1
+
+        disk_cache.clear()
+        assert disk_cache.get(path=self.path, etag="0x2") is None
+
+    def test_evict(self, tmp_path):
+        disk_cache = DiskCache(cache_dir=str(tmp_path), max_size=10)
+        # larger than max_size is not cached
+        assert not disk_cache.put(path=self.path, etag="0x1", data=b"0123456789a")
+
+        disk_cache.put(path=f"{self.path}.1", etag="0x1", data=b"0123")
+        disk_cache.put(path=f"{self.path}.2", etag="0x1", data=b"0123")
+        # access the first file, then the second file is the least recently used
+        past = time.time() - 60
+        os.utime(disk_cache._file_path(path=f"{self.path}.1", etag="0x1"), (past, past))
+        os.utime(disk_cache._file_path(path=f"{self.path}.2", etag="0x1"), (past - 1, past - 1))
+        assert disk_cache.get(path=f"{self.path}.1", etag="0x1") == b"0123"
+
+        disk_cache.put(path=f"{self.path}.3", etag="0x1", data=b"0123")
+        assert disk_cache.get(path=f"{self.path}.1", etag="0x1") == b"0123"
+        assert disk_cache.get(path=f"{self.path}.2", etag="0x1") is None
+        assert disk_cache.get(path=f"{self.path}.3", etag="0x1") == b"0123"
+
+
+class TestMemoryCache:
+    path = "https://testazfs.blob.core.windows.net/test_caontainer/test.json"
+
+    def test_get_put(self):
+        memory_cache = MemoryCache(ttl=60)
+        assert memory_cache.get(path=self.path) == (None, None)
+        memory_cache.put(path=self.path, data=b"{}", etag="0x1")
+        assert memory_cache.get(path=self.path) == (b"{}", "0x1")
+
+        # after the ttl, the data should be revalidated
+        memory_cache.ttl = 0
+        assert memory_cache.get(path=self.path) == (None, "0x1")
+        assert memory_cache.revalidated(path=self.path, etag="0x1") == b"{}"
+        assert memory_cache.revalidated(path=self.path, etag="0x2") is None
+
+        memory_cache.invalidate(path=self.path)
+        assert memory_cache.get(path=self.path) == (None, None)
+        assert memory_cache.stats() == {
+            "hits": 1, "misses": 2, "revalidations": 1, "not_modified": 1, "entries": 0, "size": 0
+        }
+
+    def test_evict(self):
+        memory_cache = MemoryCache(max_size=10, max_entries=2)
+        # larger than max_size is not cached
+        assert not memory_cache.put(path=self.path, data=b"0123456789a", etag="0x1")
+
+        memory_cache.put(path=f"{self.path}.1", data=b"0123", etag="0x1")
+        memory_cache.put(path=f"{self.path}.2", data=b"0123", etag="0x1")
+        # access the first data, then the second data is the least recently used
+        assert memory_cache.get(path=f"{self.path}.1")[0] == b"0123"
+        memory_cache.put(path=f"{self.path}.3", data=b"01", etag="0x1")
+        assert memory_cache.get(path=f"{self.path}.2") == (None, None)
+        assert memory_cache.stats()["entries"] == 2
+
+        # exceeds max_size
+        memory_cache.put(path=f"{self.path}.4", data=b"012345678", etag="0x1")
+        assert memory_cache.stats()["entries"] == 1
+        assert memory_cache.stats()["size"] == 9
+
+
+class TestParsedCache:
+    path = "https://testazfs.blob.core.windows.net/test_caontainer/test.csv"
+
+    def test_get_put(self, tmp_path):
+        parsed_cache = ParsedCache(cache_dir=str(tmp_path))
+        df = pd.DataFrame({"name": ["alice", "bob"], "age": [10, 10]})
+        variant = parsed_cache.variant(reader="read_csv", kwargs={"usecols": ["name", "age"]})
+        assert parsed_cache.get_frame(path=self.path, etag="0x1", variant=variant) is None
+
+        assert parsed_cache.put_frame(path=self.path, etag="0x1", variant=variant, df=df)
+        pd.testing.assert_frame_equal(parsed_cache.get_frame(path=self.path, etag="0x1", variant=variant), df)
+        # the other keywords are another cache
+        other_variant = parsed_cache.variant(reader="read_csv", kwargs={"usecols": ["name"]})
+        assert parsed_cache.get_frame(path=self.path, etag="0x1", variant=other_variant) is None
+
+        # the file is modified, so the stale data is removed
+        assert parsed_cache.put_frame(path=self.path, etag="0x2", variant=variant, df=df)
+        assert parsed_cache.get_frame(path=self.path, etag="0x1", variant=variant) is None
+        assert len(os.listdir(str(tmp_path))) == 1
+
+    def test_variant(self):
+        # the order of the keywords does not matter
+        assert ParsedCache.variant("read_csv", {"sep": ",", "header": 0}) == \
+            ParsedCache.variant("read_csv", {"header": 0, "sep": ","})
+        assert ParsedCache.variant("read_csv", {}) != ParsedCache.variant("read_table", {})
+        # function cannot be the key
+        assert ParsedCache.variant("read_csv", {"converters": {"age": int}}) is None
+
+    def test_not_cached(self, tmp_path):
+        parsed_cache = ParsedCache(cache_dir=str(tmp_path))
+        variant = parsed_cache.variant(reader="read_csv", kwargs={})
+        # the column names are not str
+        assert not parsed_cache.put_frame(path=self.path, etag="0x1", variant=variant, df=pd.DataFrame({0: [1]}))
+        # the column of mixed types
+        df = pd.DataFrame({"value": [1, "a"]}, dtype="object")
+        assert not parsed_cache.put_frame(path=self.path, etag="0x1", variant=variant, df=df)
+
+
+def test_az_file_fetch_range_with_disk_cache(_download, tmp_path):
+    data = b'name,age\nalice,10\nbob,10\n'
+    download_mock, info_mock = _download(AzBlobClient, data)
+    info_mock.return_value = {"size": len(data), "etag": "0x1"}
+
+    fs = AzFileSystem(credential="", disk_cache=DiskCache(cache_dir=str(tmp_path)))
+    path = "https://testazfs.blob.core.windows.net/test_caontainer/test.csv"
+    with fs.open(path, "rb", block_size=4, cache_type="none") as f:
+        assert f.read(8) == b"name,age"
+        assert f.read() == data[8:]
+    # the whole file is downloaded once, and the ranges are read from the local disk
+    assert download_mock.call_count == 1
@@ -1,3 +1,9 @@
+import gzip
+import io
+import re
+import threading
+import time
+from typing import List
 import pytest
 
 # in order to avoid warning .coverage
@@ -10,9 +16,21 @@ else:
     cleanup_on_sigterm()
 
 import azfs
+from azfs.az_file_client import (
+    _compile_glob_path,
+    _compile_glob_segment,
+    _expand_braces,
+    _hive_partitions,
+    _parquet_column_ranges,
+    _parquet_row_groups,
+    _prune_partition
+)
 from azure.core.exceptions import ResourceNotFoundError
+from azure.storage.blob import BlobClient
+from azure.storage.filedatalake import DataLakeFileClient
 from azfs.clients.blob_client import AzBlobClient
 from azfs.clients.datalake_client import AzDataLakeClient
+from azfs.clients import StreamReader, TextReader
 from azfs.clients.client_interface import ClientInterface
 from azfs.error import (
     AzfsInputError,
@@ -113,9 +131,9 @@ class TestReadCsv:
         assert "age" in columns
         assert len(df.index) == 2
 
-    def test_blob_read_glob_csv(self, mocker, _get_csv, var_azc, _ls_for_glob):
+    def test_blob_read_glob_csv(self, mocker, _get_csv, var_azc, _walk_for_glob):
         mocker.patch.object(AzBlobClient, "_get", _get_csv)
-        mocker.patch.object(AzBlobClient, "_ls", _ls_for_glob)
+        mocker.patch.object(AzBlobClient, "_walk", _walk_for_glob)
 
         # the file below is not exists
         path = "https://testazfs.blob.core.windows.net/test_caontainer/root_folder/*.csv"
@@ -171,6 +189,65 @@ class TestReadCsv:
         assert "age" in columns
         assert len(df.index) == 2
 
+    @pytest.mark.parametrize("client_class, path", [
+        (AzBlobClient, "https://testazfs.blob.core.windows.net/test_caontainer/test.csv.gz"),
+        (AzDataLakeClient, "https://testazfs.dfs.core.windows.net/test_caontainer/test.csv.gz"),
+    ])
+    def test_read_csv_gz_stream(self, _download, var_azc, client_class, path):
+        data = gzip.compress(b'name,age\nalice,10\nbob,10\n')
+        download_mock, info_mock = _download(client_class, data)
+
+        df = var_azc.read_csv(path, stream=True, chunk_size=8)
+        columns = df.columns
+        assert "name" in columns
+        assert "age" in columns
+        assert len(df.index) == 2
+        # each request is limited to the chunk_size
+        assert max([c.kwargs["length"] for c in download_mock.call_args_list]) <= 8
+
+        with pytest.raises(AzfsInputError):
+            var_azc.get(path, offset=0, stream=True)
+
+        # without `stream`, decompressed data is returned as io.BytesIO
+        result = var_azc.get(path)
+        assert type(result) is io.BytesIO
+        assert result.read() == b'name,age\nalice,10\nbob,10\n'
+
+        # closing the gzip stream also closes the underlying StreamReader
+        with var_azc.get(path, stream=True) as f:
+            raw = f.fileobj.raw
+            assert f.read() == b'name,age\nalice,10\nbob,10\n'
+        assert raw.closed
+
+    def test_blob_read_csv_stream_chunksize(self, _download, var_azc):
+        data = b"name,age\n" + b"".join([f"user{i},{i}\n".encode("utf-8") for i in range(100)])
+        download_mock, info_mock = _download(AzBlobClient, data)
+
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.csv"
+        # read-ahead with 2 background ranges
+        df_list = list(var_azc.read_csv(path, stream=True, chunk_size=64, max_concurrency=2, chunksize=30))
+        assert [len(df.index) for df in df_list] == [30, 30, 30, 10]
+        assert pd.concat(df_list)["age"].tolist() == list(range(100))
+        # every byte-range is downloaded only once
+        offsets = [c.kwargs["offset"] for c in download_mock.call_args_list]
+        assert sorted(offsets) == list(range(0, len(data), 64))
+
+    def test_blob_read_csv_stream_close(self, mocker, _download, var_azc):
+        data = b"name,age\n" + b"".join([f"user{i},{i}\n".encode("utf-8") for i in range(100)])
+        _download(AzBlobClient, data)
+        open_spy = mocker.spy(azfs.AzFileClient, "_open")
+
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.csv"
+        # the stream is closed after reading DataFrame
+        _ = var_azc.read_csv(path, stream=True, chunk_size=64)
+        assert open_spy.spy_return.closed
+
+        # the stream is closed with the TextFileReader, even if the iteration stopped early
+        with var_azc.read_csv(path, stream=True, chunk_size=64, chunksize=10) as reader:
+            _ = next(reader)
+            assert not open_spy.spy_return.closed
+        assert open_spy.spy_return.closed
+
     def test_dfs_read_csv(self, mocker, _get_csv, var_azc):
         mocker.patch.object(AzDataLakeClient, "_get", _get_csv)
 
@@ -321,6 +398,613 @@ class TestReadPickle:
         assert len(df.index) == 2
 
 
+class TestReadParquet:
+    @staticmethod
+    def _parquet_data(num_rows: int, row_group_size: int) -> bytes:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        df = pd.DataFrame({
+            "id": list(range(num_rows)),
+            "name": [f"user{i}" for i in range(num_rows)],
+            "value": [float(i) for i in range(num_rows)]
+        })
+        buffer = io.BytesIO()
+        pq.write_table(
+            pa.Table.from_pandas(df), buffer, row_group_size=row_group_size, compression="none", use_dictionary=False)
+        return buffer.getvalue()
+
+    def test_blob_read_parquet(self, _download, var_azc):
+        data = self._parquet_data(num_rows=1000, row_group_size=250)
+        _download(AzBlobClient, data)
+
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.parquet"
+        df = var_azc.read_parquet(path)
+        assert list(df.columns) == ["id", "name", "value"]
+        assert len(df.index) == 1000
+
+    def test_blob_read_parquet_columns_filters(self, _download, var_azc):
+        # the file is much larger than the footer
+        data = self._parquet_data(num_rows=100_000, row_group_size=10_000)
+        download_mock, _ = _download(AzBlobClient, data)
+
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.parquet"
+        df = var_azc.read_parquet(path, columns=["value"], filters=[("id", ">=", 95_000)], max_concurrency=4)
+        assert list(df.columns) == ["value"]
+        assert df["value"].tolist() == [float(i) for i in range(95_000, 100_000)]
+        # only the footer and 2 column-chunks of the last row-group are downloaded
+        downloaded_size = sum([c.kwargs["length"] for c in download_mock.call_args_list])
+        assert downloaded_size < len(data) / 10
+
+        df = var_azc.read_parquet(path, columns=["id"], filters=[[("id", "<", 10)], [("id", "in", [99_995])]])
+        assert df["id"].tolist() == list(range(10)) + [99_995]
+
+    def test_parquet_row_groups_and_column_ranges(self):
+        import pyarrow.parquet as pq
+        data = self._parquet_data(num_rows=1000, row_group_size=250)
+        metadata = pq.read_metadata(io.BytesIO(data))
+
+        assert _parquet_row_groups(metadata, None) == [0, 1, 2, 3]
+        assert _parquet_row_groups(metadata, [("id", ">=", 900)]) == [3]
+        assert _parquet_row_groups(metadata, [("id", "==", 300), ("value", "<", 100.0)]) == []
+        assert _parquet_row_groups(metadata, [[("id", "==", 300)], [("id", "in", [10, 999])]]) == [0, 1, 3]
+        # not in the file, such as the partition column
+        assert _parquet_row_groups(metadata, [("date", "==", "2026-01-01")]) == [0, 1, 2, 3]
+
+        ranges = _parquet_column_ranges(metadata, row_groups=[3], columns=["value"])
+        assert len(ranges) == 1
+        column_chunk = metadata.row_group(3).column(2)
+        assert ranges[0][1] - ranges[0][0] == column_chunk.total_compressed_size
+        assert len(_parquet_column_ranges(metadata, row_groups=[0, 1], columns=None)) == 6
+
+
+def _ls_detail_of(files: dict, directories: List[str] = ()) -> List[dict]:
+    # listing of the files and the directories, as same as `ls_detail()`
+    file_list = [{"name": f, "size": len(data), "is_directory": False} for f, data in files.items()]
+    return file_list + [{"name": d, "size": None, "is_directory": True} for d in directories]
+
+
+class TestReadParquetDataset:
+    @staticmethod
+    def _dataset_files() -> dict:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        files = {}
+        for day in range(1, 11):
+            for part in range(2):
+                df = pd.DataFrame({"id": [day * 10 + part * 5 + i for i in range(5)], "value": [float(day)] * 5})
+                buffer = io.BytesIO()
+                pq.write_table(pa.Table.from_pandas(df, preserve_index=False), buffer)
+                files[f"table/date=2026-01-{day:02d}/part-{part}.parquet"] = buffer.getvalue()
+        return files
+
+    @pytest.mark.parametrize("client_class, account_kind", [
+        (AzBlobClient, "blob"),
+        (AzDataLakeClient, "dfs"),
+    ])
+    def test_read_parquet_dataset(self, mocker, _download, var_azc, client_class, account_kind):
+        files = self._dataset_files()
+        download_mock, _ = _download(client_class, files)
+        directories = []
+        if account_kind == "dfs":
+            # DataLake lists the directories, too, even if empty
+            directories = ["table", "table/date=2026-01-01", "table/date=2026-01-11"]
+        ls_mock = mocker.MagicMock()
+        ls_mock.return_value = _ls_detail_of(dict(files, **{"table/_SUCCESS": b""}), directories=directories)
+        mocker.patch.object(client_class, "_ls_detail", ls_mock)
+
+        root = f"https://testazfs.{account_kind}.core.windows.net/test_caontainer/table"
+        df = var_azc.read().parquet_dataset(
+            root,
+            filters=[("date", ">=", "2026-01-08"), ("id", "<", 100)],
+            columns=["date", "id"])
+        # listed only once
+        ls_mock.assert_called_once()
+        assert list(df.columns) == ["date", "id"]
+        assert sorted(df["date"].unique().tolist()) == ["2026-01-08", "2026-01-09"]
+        assert sorted(df["id"].tolist()) == list(range(80, 90)) + list(range(90, 100))
+        # files in the pruned partitions are not downloaded
+        file_clients = [c.kwargs["file_client"] for c in download_mock.call_args_list]
+        downloaded = {getattr(f, "blob_name", None) or getattr(f, "path_name", None) for f in file_clients}
+        assert all([f.startswith(("table/date=2026-01-08", "table/date=2026-01-09", "table/date=2026-01-10"))
+                    for f in downloaded])
+
+        assert var_azc.read().parquet_dataset(root, filters=[("date", "==", "2025-12-31")]) is None
+
+    def test_prune_partition(self):
+        partitions = _hive_partitions("date=2026-01-01/hour=3/part-0.parquet")
+        assert partitions == {"date": "2026-01-01", "hour": "3"}
+        assert _hive_partitions("key=__HIVE_DEFAULT_PARTITION__/a.parquet") == {"key": None}
+        assert _hive_partitions("name=a%2Fb/a.parquet") == {"name": "a/b"}
+
+        assert _prune_partition(partitions, None) == (True, None)
+        assert _prune_partition(partitions, [("hour", ">", 2)]) == (True, None)
+        assert _prune_partition(partitions, [("hour", ">", 3)]) == (False, None)
+        assert _prune_partition(partitions, [("hour", "in", [1, 3]), ("id", "<", 10)]) == (True, [[("id", "<", 10)]])
+        assert _prune_partition(partitions, [("hour", "not in", [1, 3])]) == (False, None)
+        assert _prune_partition(
+            partitions, [[("date", "<", "2026-01-01")], [("id", "==", 1)]]) == (True, [[("id", "==", 1)]])
+        assert _prune_partition({"key": None}, [("key", "==", "a")]) == (False, None)
+        # null never matches, also with `!=` and `not in`
+        assert _prune_partition({"key": None}, [("key", "!=", "a")]) == (False, None)
+        assert _prune_partition({"key": None}, [("key", "not in", ["a"])]) == (False, None)
+        assert _prune_partition({"key": None}, [("key", "in", ["a"])]) == (False, None)
+
+    def test_read_parquet_dataset_basename_with_equals(self, mocker, _download, var_azc):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        buffer = io.BytesIO()
+        pq.write_table(pa.Table.from_pandas(pd.DataFrame({"id": [1, 2]}), preserve_index=False), buffer)
+        files = {"table/date=2026-01-01/part=0.parquet": buffer.getvalue()}
+        _download(AzBlobClient, files)
+        mocker.patch.object(AzBlobClient, "_ls_detail", mocker.MagicMock(return_value=_ls_detail_of(files)))
+
+        # only the directories are parsed as the partitions
+        root = "https://testazfs.blob.core.windows.net/test_caontainer/table"
+        df = var_azc.read().parquet_dataset(root)
+        assert df.to_dict(orient="list") == {"id": [1, 2], "date": ["2026-01-01", "2026-01-01"]}
+
+
+class TestReadArrow:
+    @staticmethod
+    def _files() -> dict:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        files = {}
+        for i in range(3):
+            df = pd.DataFrame({"id": [i * 10 + j for j in range(10)], "value": [float(i)] * 10})
+            if i == 2:
+                # the column missing in the other files
+                df["extra"] = "x"
+            buffer = io.BytesIO()
+            pq.write_table(pa.Table.from_pandas(df, preserve_index=False), buffer)
+            files[f"test{i}.parquet"] = buffer.getvalue()
+        return files
+
+    @pytest.mark.parametrize("use_mp", [False, True])
+    def test_blob_read_parquet_to_arrow(self, _download, var_azc, use_mp):
+        import pyarrow as pa
+        files = self._files()
+        _download(AzBlobClient, files)
+        paths = [f"https://testazfs.blob.core.windows.net/test_caontainer/{f}" for f in sorted(files)]
+
+        table = var_azc.read(use_mp=use_mp, file_format="parquet").to_arrow(paths)
+        assert isinstance(table, pa.Table)
+        assert table.num_rows == 30
+        # each file is kept as the chunk, without copy
+        assert table.column("id").num_chunks == 3
+        assert table.column("extra").null_count == 20
+
+        df = var_azc.read(use_mp=use_mp).arrow(paths, file_format="parquet", columns=["id"])
+        assert list(df.columns) == ["id"]
+        assert df["id"].tolist() == list(range(30))
+        # fresh index, unlike pd.concat
+        assert df.index.tolist() == list(range(30))
+
+    def test_blob_read_csv_to_arrow(self, _download, var_azc):
+        _download(AzBlobClient, b"name,age\nalice,10\nbob,10\n")
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.csv"
+
+        table = var_azc.read().to_arrow([path, path])
+        assert table.column_names == ["name", "age"]
+        assert table.num_rows == 4
+        df = var_azc.read().apply(function=lambda _df: _df[_df["name"] == "bob"]).arrow([path, path])
+        assert df["name"].tolist() == ["bob", "bob"]
+        assert var_azc.read().to_arrow([]) is None
+
+
+def _filter_even_age(df: pd.DataFrame) -> pd.DataFrame:
+    # defined at the module level, to be pickled for multiprocessing
+    return df[df["age"] % 2 == 0]
+
+
+class TestReadIoConcurrency:
+    @staticmethod
+    def _files() -> dict:
+        return {f"test{i}.csv": f"name,age\nuser{i},{i}\n".encode("utf-8") for i in range(8)}
+
+    def test_blob_read_csv_with_threads(self, mocker, _download, var_azc):
+        download_mock, _ = _download(AzBlobClient, self._files())
+        pool_mock = mocker.patch("multiprocessing.Pool")
+        paths = [f"https://testazfs.blob.core.windows.net/test_caontainer/test{i}.csv" for i in range(8)]
+
+        df = var_azc.read(io_concurrency=4).csv(paths)
+        assert df["age"].tolist() == list(range(8))
+        assert download_mock.call_count == 8
+        # no process is started
+        pool_mock.assert_not_called()
+
+    def test_blob_read_with_threads_and_processes(self, _download, var_azc):
+        download_mock, _ = _download(AzBlobClient, self._files())
+        paths = [f"https://testazfs.blob.core.windows.net/test_caontainer/test{i}.csv" for i in range(8)]
+
+        df = var_azc.read(use_mp=True, cpu_count=2, io_concurrency=4).apply(function=_filter_even_age).csv(paths)
+        assert df["age"].tolist() == [0, 2, 4, 6]
+        # downloaded in this process
+        assert download_mock.call_count == 8
+
+        table = var_azc.read(use_mp=True, cpu_count=2, io_concurrency=4).to_arrow(paths)
+        assert table.num_rows == 8
+
+    def test_blob_read_split_with_threads_and_processes(self, _download, var_azc):
+        data = b"name,age\n" + b"".join([f"user{i},{i}\n".encode("utf-8") for i in range(100)])
+        _download(AzBlobClient, data)
+
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.csv"
+        df = var_azc.read(use_mp=True, cpu_count=2, io_concurrency=4, split_size=128).csv(path=path)
+        assert df["age"].tolist() == list(range(100))
+
+    @pytest.mark.parametrize("file_format", ["parquet", "pickle"])
+    def test_blob_read_binary_with_threads_and_processes(self, _download, var_azc, var_df, file_format):
+        if file_format == "parquet":
+            data = var_df.to_parquet()
+        else:
+            buffer = io.BytesIO()
+            var_df.to_pickle(buffer, compression="gzip")
+            data = buffer.getvalue()
+        _download(AzBlobClient, data)
+
+        path = f"https://testazfs.blob.core.windows.net/test_caontainer/test.{file_format}"
+        reader = var_azc.read(use_mp=True, cpu_count=2, io_concurrency=2)
+        df = reader.parquet([path, path]) if file_format == "parquet" else reader.pickle([path, path])
+        assert df["name"].tolist() == ["alice", "bob", "alice", "bob"]
+
+
+def _worker_client_id(_) -> int:
+    # run in the worker process
+    from azfs import az_file_client
+    assert az_file_client._worker_client is not None
+    return id(az_file_client._worker_client)
+
+
+class TestWorkerPool:
+    def test_blob_read_csv_with_persistent_pool(self, mocker, _download, var_azc):
+        _download(AzBlobClient, b"name,age\nalice,10\nbob,10\n")
+        create_pool_spy = mocker.spy(azfs.AzFileClient, "create_pool")
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.csv"
+
+        df = var_azc.read(use_mp=True, cpu_count=2).csv([path, path])
+        assert len(df.index) == 4
+        pool = var_azc.get_pool(processes=2)
+        df = var_azc.read(use_mp=True, cpu_count=2).csv([path, path])
+        assert len(df.index) == 4
+        # the pool is started only once, and reused
+        assert create_pool_spy.call_count == 1
+        assert var_azc.get_pool(processes=2) is pool
+
+        # started again with the different number of processes
+        var_azc.read(use_mp=True, cpu_count=1).csv(path)
+        assert create_pool_spy.call_count == 2
+
+        var_azc.close()
+        assert var_azc._pool is None
+
+    def test_blob_read_csv_with_given_pool(self, mocker, _download, var_azc):
+        _download(AzBlobClient, b"name,age\nalice,10\nbob,10\n")
+        get_pool_mock = mocker.patch.object(azfs.AzFileClient, "get_pool")
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.csv"
+
+        with var_azc.create_pool(processes=2) as pool:
+            df = var_azc.read(use_mp=True, pool=pool).csv([path, path])
+            assert len(df.index) == 4
+            df = var_azc.read(use_mp=True, pool=pool, io_concurrency=2).csv([path, path])
+            assert len(df.index) == 4
+        get_pool_mock.assert_not_called()
+
+    def test_worker_client_is_reused(self, var_azc):
+        with var_azc.create_pool(processes=1) as pool:
+            client_ids = pool.map(_worker_client_id, range(4))
+        assert len(set(client_ids)) == 1
+
+
+class TestSharedMemory:
+    @pytest.mark.parametrize("io_concurrency", [None, 2])
+    def test_blob_read_with_shared_memory(self, mocker, tmp_path, _download, var_azc, io_concurrency):
+        # the workers are forked after the patch
+        mocker.patch("azfs.az_file_client._SHARED_MEMORY_DIR", str(tmp_path))
+        _download(AzBlobClient, b"name,age\nalice,10\nbob,10\n")
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.csv"
+
+        reader = var_azc.read(use_mp=True, cpu_count=2, io_concurrency=io_concurrency, shared_memory=True)
+        df = reader.csv([path, path])
+        assert df["name"].tolist() == ["alice", "bob", "alice", "bob"]
+        assert df.index.tolist() == [0, 1, 0, 1]
+
+        table = var_azc.read(use_mp=True, cpu_count=2, io_concurrency=io_concurrency, shared_memory=True) \
+            .to_arrow([path, path])
+        assert table.num_rows == 4
+        # the files are removed after attached
+        assert list(tmp_path.iterdir()) == []
+
+    def test_shared_memory_result(self, tmp_path, mocker):
+        from azfs.az_file_client import _from_shared_memory, _SharedMemoryResult, _to_shared_memory
+        mocker.patch("azfs.az_file_client._SHARED_MEMORY_DIR", str(tmp_path))
+
+        df = pd.DataFrame({"id": [1, 2], "name": ["alice", "bob"]}, index=["a", "b"])
+        result = _to_shared_memory(df)
+        assert isinstance(result, _SharedMemoryResult)
+        assert _from_shared_memory(result).equals(df)
+        assert list(tmp_path.iterdir()) == []
+
+        # cannot be converted to pyarrow.Table exactly, so pickled as it is
+        df = pd.DataFrame({"mixed": [1, "a"]})
+        assert _to_shared_memory(df) is df
+        assert _from_shared_memory(df) is df
+        df = pd.DataFrame({1: [1, 2]})
+        assert _to_shared_memory(df) is df
+
+
+class TestReadIter:
+    @staticmethod
+    def _files() -> dict:
+        return {f"test{i}.csv": f"name,age\nuser{i},{i}\n".encode("utf-8") for i in range(6)}
+
+    @staticmethod
+    def _paths() -> List[str]:
+        return [f"https://testazfs.blob.core.windows.net/test_caontainer/test{i}.csv" for i in range(6)]
+
+    def test_blob_iter_csv(self, _download, var_azc):
+        _download(AzBlobClient, self._files())
+
+        result = list(var_azc.read().iter_csv(self._paths()))
+        assert [path for path, _ in result] == self._paths()
+        assert [df["age"].tolist() for _, df in result] == [[i] for i in range(6)]
+
+    def test_blob_iter_csv_with_threads(self, _download, var_azc):
+        download_mock, _ = _download(AzBlobClient, self._files())
+        side_effect = download_mock.side_effect
+        lock = threading.Lock()
+        state = {"running": 0, "max_running": 0}
+
+        def _slow_side_effect(file_client, **kwargs):
+            with lock:
+                state["running"] += 1
+                state["max_running"] = max(state["max_running"], state["running"])
+            # the first file is the slowest
+            time.sleep(0.3 if file_client.blob_name == "test0.csv" else 0.05)
+            with lock:
+                state["running"] -= 1
+            return side_effect(file_client, **kwargs)
+        download_mock.side_effect = _slow_side_effect
+
+        result = list(var_azc.read(io_concurrency=4).iter_csv(self._paths(), max_in_flight=2))
+        assert sorted([df["age"].tolist()[0] for _, df in result]) == list(range(6))
+        # yielded in the order of completion
+        assert result[0][0] != self._paths()[0]
+        assert state["max_running"] <= 2
+
+    @pytest.mark.parametrize("io_concurrency", [None, 2])
+    def test_blob_iter_csv_with_processes(self, _download, var_azc, io_concurrency):
+        _download(AzBlobClient, self._files())
+
+        reader = var_azc.read(use_mp=True, cpu_count=2, io_concurrency=io_concurrency, shared_memory=True)
+        result = dict(reader.iter_csv(self._paths(), max_in_flight=2))
+        assert sorted(result.keys()) == self._paths()
+        assert result[self._paths()[3]]["age"].tolist() == [3]
+
+        # closed before all the results are consumed
+        iterator = var_azc.read(use_mp=True, cpu_count=2).iter_csv(self._paths(), max_in_flight=2)
+        _, df = next(iterator)
+        iterator.close()
+        assert len(df.index) == 1
+
+    def test_blob_iter_parquet(self, _download, var_azc, var_df):
+        _download(AzBlobClient, var_df.to_parquet())
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.parquet"
+
+        result = list(var_azc.read(io_concurrency=2).iter_parquet([path, path], columns=["name"]))
+        assert len(result) == 2
+        assert all([list(df.columns) == ["name"] for _, df in result])
+
+        with pytest.raises(AzfsInputError):
+            var_azc.read().iter_parquet()
+
+
+class TestReadSelectWhere:
+    @staticmethod
+    def _csv_data() -> bytes:
+        return b"id,name,value\n" + b"".join([f"{i},user{i},{i * 10}\n".encode("utf-8") for i in range(10)])
+
+    def test_blob_read_csv_select_where(self, mocker, _download, var_azc):
+        _download(AzBlobClient, self._csv_data())
+        read_csv_spy = mocker.spy(azfs.AzFileClient, "read_csv")
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.csv"
+
+        df = var_azc.read().select("name").where([("value", ">=", 70)]).csv(path)
+        assert list(df.columns) == ["name"]
+        assert df["name"].tolist() == ["user7", "user8", "user9"]
+        # only the columns in select and where are parsed
+        assert read_csv_spy.call_args.kwargs["usecols"] == ["name", "value"]
+
+        df = var_azc.read().where("id < 2 or value == 90").csv(path)
+        assert df["id"].tolist() == [0, 1, 9]
+        df = var_azc.read().select(["id"]).where([[("id", "<", 1)], [("id", "in", [5])]]).csv(path)
+        assert df["id"].tolist() == [0, 5]
+
+        with pytest.raises(AzfsInputError):
+            var_azc.read().where({"id": 1})
+
+    @pytest.mark.parametrize("io_concurrency", [None, 2])
+    def test_blob_read_csv_select_where_with_processes(self, _download, var_azc, io_concurrency):
+        _download(AzBlobClient, self._csv_data())
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.csv"
+
+        reader = var_azc.read(use_mp=True, cpu_count=2, io_concurrency=io_concurrency)
+        df = reader.select("id").where([("value", "<", 20)]).csv([path, path])
+        assert list(df.columns) == ["id"]
+        assert df["id"].tolist() == [0, 1, 0, 1]
+
+    def test_blob_read_parquet_select_where(self, mocker, _download, var_azc):
+        data = TestReadParquet._parquet_data(num_rows=100_000, row_group_size=10_000)
+        download_mock, _ = _download(AzBlobClient, data)
+        read_parquet_spy = mocker.spy(azfs.AzFileClient, "read_parquet")
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.parquet"
+
+        df = var_azc.read().select("value").where([("id", ">=", 99_998)]).parquet(path)
+        assert list(df.columns) == ["value"]
+        assert df["value"].tolist() == [99_998.0, 99_999.0]
+        assert read_parquet_spy.call_args.kwargs["columns"] == ["value"]
+        assert read_parquet_spy.call_args.kwargs["filters"] == [[("id", ">=", 99_998)]]
+        downloaded_size = sum([c.kwargs["length"] for c in download_mock.call_args_list])
+        assert downloaded_size < len(data) / 10
+
+        table = var_azc.read(file_format="parquet").select("id").where([("id", "<", 2)]).to_arrow(path)
+        assert table.column_names == ["id"]
+        assert table.num_rows == 2
+
+    def test_blob_read_pickle_where(self, _download, var_azc, var_df):
+        buffer = io.BytesIO()
+        var_df.to_pickle(buffer, compression="gzip")
+        _download(AzBlobClient, buffer.getvalue())
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.pkl"
+
+        df = var_azc.read().select("name").where([("name", "!=", "alice")]).pickle(path)
+        assert df.to_dict(orient="list") == {"name": ["bob"]}
+
+    def test_read_parquet_dataset_select_where(self, mocker, _download, var_azc):
+        files = TestReadParquetDataset._dataset_files()
+        _download(AzBlobClient, files)
+        mocker.patch.object(AzBlobClient, "_ls_detail", mocker.MagicMock(return_value=_ls_detail_of(files)))
+
+        root = "https://testazfs.blob.core.windows.net/test_caontainer/table"
+        df = var_azc.read().select("date", "id").where([("date", "==", "2026-01-02")]).parquet_dataset(root)
+        assert list(df.columns) == ["date", "id"]
+        assert sorted(df["id"].tolist()) == list(range(20, 30))
+
+
+class TestReadSchedule:
+    @staticmethod
+    def _files() -> dict:
+        return {f"root_folder/test{i}.csv": f"name,age\nuser{i},{i}\n".encode("utf-8") for i in range(4)}
+
+    @staticmethod
+    def _walk(mocker, sizes: List[int]):
+        return mocker.MagicMock(return_value=[
+            {"name": f"root_folder/test{i}.csv", "size": size, "is_directory": False} for i, size in enumerate(sizes)
+        ])
+
+    def test_blob_glob_detail(self, mocker, var_azc):
+        mocker.patch.object(AzBlobClient, "_walk", self._walk(mocker, [10, 40, 20, 30]))
+
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/root_folder/*.csv"
+        file_list = var_azc.glob(pattern_path=path, detail=True)
+        assert file_list[1] == {
+            "name": "https://testazfs.blob.core.windows.net/test_caontainer/root_folder/test1.csv",
+            "size": 40
+        }
+        assert var_azc.glob(pattern_path=path) == [f["name"] for f in file_list]
+
+    def test_blob_read_largest_first(self, mocker, _download, var_azc):
+        mocker.patch.object(AzBlobClient, "_walk", self._walk(mocker, [10, 40, 20, 30]))
+        download_mock, _ = _download(AzBlobClient, self._files())
+        side_effect = download_mock.side_effect
+        lock = threading.Lock()
+        started = []
+
+        def _slow_side_effect(file_client, **kwargs):
+            with lock:
+                started.append(file_client.blob_name)
+            time.sleep(0.1)
+            return side_effect(file_client, **kwargs)
+        download_mock.side_effect = _slow_side_effect
+
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/root_folder/*.csv"
+        df = var_azc.read(io_concurrency=2).csv(path)
+        # the two largest files are read first, and concatenated in the order of the listing
+        assert sorted(started[:2]) == ["root_folder/test1.csv", "root_folder/test3.csv"]
+        assert df["age"].tolist() == [0, 1, 2, 3]
+
+    @pytest.mark.parametrize("io_concurrency", [None, 2])
+    def test_blob_read_largest_first_with_processes(self, mocker, _download, var_azc, io_concurrency):
+        mocker.patch.object(AzBlobClient, "_walk", self._walk(mocker, [10, 40, 20, 30]))
+        _download(AzBlobClient, self._files())
+
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/root_folder/*.csv"
+        reader = var_azc.read(use_mp=True, cpu_count=2, io_concurrency=io_concurrency)
+        assert reader._schedule([{"path": p} for p in reader._decode_path(path)]) == [1, 3, 2, 0]
+        df = reader.csv(path)
+        assert df["age"].tolist() == [0, 1, 2, 3]
+
+    def test_split_schedule(self, var_azc):
+        reader = var_azc.read()
+        tasks = [
+            {"path": "a.csv", "start": 0, "end": 100},
+            {"path": "a.csv", "start": 100, "end": 150},
+            {"path": "b.csv"},
+            {"path": "c.csv", "start": 0, "end": 200}
+        ]
+        assert reader._schedule(tasks) == [3, 0, 1, 2]
+
+
+class TestReadLimit:
+    @staticmethod
+    def _files() -> dict:
+        return {f"test{i}.csv": f"name,age\nuser{i},{i}\nuser{i},{i + 10}\n".encode("utf-8") for i in range(4)}
+
+    @staticmethod
+    def _paths() -> List[str]:
+        return [f"https://testazfs.blob.core.windows.net/test_caontainer/test{i}.csv" for i in range(4)]
+
+    def test_blob_read_limit(self, mocker, _download, var_azc):
+        download_mock, _ = _download(AzBlobClient, self._files())
+        read_csv_spy = mocker.spy(pd, "read_csv")
+
+        df = var_azc.read().limit(3).csv(self._paths())
+        assert df["age"].tolist() == [0, 10, 1]
+        # the rest files are not read
+        assert sorted([c.kwargs["file_client"].blob_name for c in download_mock.call_args_list]) == \
+            ["test0.csv", "test1.csv"]
+        assert all([c.kwargs["nrows"] == 3 for c in read_csv_spy.call_args_list])
+
+        df = var_azc.read(io_concurrency=2).limit(5).csv(self._paths())
+        assert df["age"].tolist() == [0, 10, 1, 11, 2]
+
+        df = var_azc.read().limit(100).csv(self._paths())
+        assert len(df.index) == 8
+
+    def test_blob_read_limit_zero(self, _download, var_azc):
+        _download(AzBlobClient, self._files())
+
+        df = var_azc.read().limit(0).csv(self._paths())
+        assert len(df.index) == 0
+        assert list(df.columns) == ["name", "age"]
+
+    def test_blob_read_limit_with_where(self, mocker, _download, var_azc):
+        _download(AzBlobClient, self._files())
+        read_csv_spy = mocker.spy(pd, "read_csv")
+
+        df = var_azc.read().where([("age", ">=", 10)]).limit(3).csv(self._paths())
+        assert df["age"].tolist() == [10, 11, 12]
+        # the rows are filtered after read, so that nrows is not pushed down
+        assert all(["nrows" not in c.kwargs for c in read_csv_spy.call_args_list])
+
+    @pytest.mark.parametrize("io_concurrency", [None, 2])
+    def test_blob_read_limit_with_processes(self, _download, var_azc, io_concurrency):
+        _download(AzBlobClient, self._files())
+
+        reader = var_azc.read(use_mp=True, cpu_count=2, io_concurrency=io_concurrency)
+        df = reader.limit(3).csv(self._paths())
+        assert df["age"].tolist() == [0, 10, 1]
+
+    def test_blob_to_arrow_limit(self, _download, var_azc):
+        _download(AzBlobClient, self._files())
+
+        table = var_azc.read(io_concurrency=2).limit(3).to_arrow(self._paths(), file_format="csv")
+        assert table.num_rows == 3
+        assert table.column("age").to_pylist() == [0, 10, 1]
+
+    def test_blob_iter_csv_limit(self, _download, var_azc):
+        _download(AzBlobClient, self._files())
+
+        result = list(var_azc.read(io_concurrency=2).limit(3).iter_csv(self._paths()))
+        assert sum([len(df.index) for _, df in result]) == 3
+
+    def test_limit_error(self, var_azc):
+        with pytest.raises(AzfsInputError):
+            var_azc.read().limit(-1)
+        with pytest.raises(AzfsInputError):
+            var_azc.read().limit(1.5)
+
+
 class TestReadJson:
 
     def test_blob_read_json(self, mocker, _get_json, var_azc, var_json):
@@ -344,75 +1028,324 @@ class TestReadJson:
 
 class TestReadLineIter:
 
-    def test_blob_read_line_iter(self, mocker, _get_csv, var_azc):
-        mocker.patch.object(AzBlobClient, "_get", _get_csv)
+    @pytest.mark.parametrize("client_class, path", [
+        (AzBlobClient, "https://testazfs.blob.core.windows.net/test_caontainer/test.csv"),
+        (AzDataLakeClient, "https://testazfs.dfs.core.windows.net/test_caontainer/test.csv"),
+    ])
+    def test_read_line_iter(self, _download, var_azc, client_class, path):
+        data = b'name,age\nalice,10\nbob,10\n'
+        download_mock, info_mock = _download(client_class, data)
 
-        return_value = {"size": len(b'name,age\nalice,10\nbob,10\n')}
-        func_mock = mocker.MagicMock()
-        func_mock.return_value = return_value
-        mocker.patch.object(AzBlobClient, "_info", func_mock)
+        # read data from not-exist path
+        line_list = [line for line in var_azc.read_line_iter(path=path)]
+        assert line_list == [b"name,age", b"alice,10", b"bob,10"]
+
+        # `_info` is not called, if the size is given
+        info_mock.reset_mock()
+        line_list = [line for line in var_azc.read_line_iter(path=path, size=len(data))]
+        assert len(line_list) == 3
+        info_mock.assert_not_called()
+
+    def test_blob_read_line_iter_adaptive_length(self, _download, var_azc):
+        data = b"".join([f"line{i}\n".encode("utf-8") for i in range(1000)])
+        download_mock, _ = _download(AzBlobClient, data)
 
-        # the file below is not exists
         path = "https://testazfs.blob.core.windows.net/test_caontainer/test.csv"
+        client = var_azc._client.get_client(account_kind="blob")
+        text_reader = TextReader(client=client, path=path, length=16, size=len(data), max_length=256)
+        line_list = [line for line in text_reader]
+        assert line_list == [f"line{i}".encode("utf-8") for i in range(1000)]
+        # the length of byte-range grows from 16 to 256
+        length_list = [c.kwargs["length"] for c in download_mock.call_args_list]
+        assert length_list[:5] == [16, 32, 64, 128, 256]
+        assert max(length_list) == 256
+
+        # the iteration stopped early, then the background download is stopped with `close()`
+        with TextReader(client=client, path=path, length=16, size=len(data)) as text_reader:
+            assert next(text_reader) == b"line0"
+            stream_reader = text_reader._reader
+        assert stream_reader.closed
+
+    def test_blob_stream_reader_random_access(self, _download, var_azc):
+        data = b"".join([f"line{i}\n".encode("utf-8") for i in range(1000)])
+        download_mock, _ = _download(AzBlobClient, data)
 
-        # read data from not-exist path
-        line_counter = 0
-        for _ in var_azc.read_line_iter(path=path):
-            line_counter += 1
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.csv"
+        client = var_azc._client.get_client(account_kind="blob")
+        stream_reader = StreamReader(client=client, path=path, size=len(data), chunk_size=16, max_chunk_size=256)
+        # the sequential reading grows the range size
+        assert [len(stream_reader.read_chunk()) for _ in range(3)] == [16, 32, 64]
+        # the range size is reset on the random access
+        stream_reader.seek(500)
+        assert stream_reader.read_chunk() == data[500:516]
+        stream_reader.close()
 
-        assert line_counter == 3
 
-    def test_dfs_read_line_iter(self, mocker, _get_csv, var_azc):
-        mocker.patch.object(AzDataLakeClient, "_get", _get_csv)
+class TestReadCsvChunk:
+    @pytest.mark.parametrize("client_class, path", [
+        (AzBlobClient, "https://testazfs.blob.core.windows.net/test_caontainer/test.csv"),
+        (AzDataLakeClient, "https://testazfs.dfs.core.windows.net/test_caontainer/test.csv"),
+    ])
+    def test_read_csv_chunk(self, _download, var_azc, client_class, path):
+        data = b'name,age\nalice,10\nbob,10\n'
+        download_mock, info_mock = _download(client_class, data)
 
-        return_value = {"size": len(b'name,age\nalice,10\nbob,10\n')}
-        func_mock = mocker.MagicMock()
-        func_mock.return_value = return_value
-        mocker.patch.object(AzDataLakeClient, "_info", func_mock)
+        chunk_size = 2
+        df_list = list(var_azc.read_csv_chunk(path, chunk_size, range_size=4))
+        assert len(df_list) == 1
+        assert len(df_list[0].index) == 2
 
-        # the file below is not exists
-        path = "https://testazfs.dfs.core.windows.net/test_caontainer/test.csv"
+        chunk_size = 1
+        df_list = list(var_azc.read_csv_chunk(path, chunk_size, range_size=4, prefetch=0))
+        assert len(df_list) == 2
+        assert all([list(df.columns) == ["name", "age"] for df in df_list])
 
-        # read data from not-exist path
-        line_counter = 0
-        for _ in var_azc.read_line_iter(path=path):
-            line_counter += 1
+    def test_blob_read_csv_chunk_quoted_newline(self, _download, var_azc):
+        data = b'name,age\n"alice\nsmith",10\nbob,\ncarol,30\n'
+        download_mock, info_mock = _download(AzBlobClient, data)
 
-        assert line_counter == 3
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.csv"
+        df_list = list(var_azc.read_csv_chunk(path, chunk_size=1, range_size=5))
+        assert [len(df.index) for df in df_list] == [1, 1, 1]
+        assert df_list[0]["name"][0] == "alice\nsmith"
+        # `age` of the 2nd chunk is NaN, so the following chunk is promoted to float64
+        assert df_list[0]["age"].dtype == "int64"
+        assert pd.isna(df_list[1]["age"].iloc[0])
+        assert df_list[2]["age"].dtype == "float64"
+        assert df_list[2]["age"].iloc[0] == 30
+
+    @pytest.mark.parametrize("data, expected", [
+        # float is not narrowed to int
+        (b'name,value\na,1\nb,1.5\n', [1, 1.5]),
+        # NaN is not cast to bool
+        (b'name,value\na,true\nb,\n', [True, None]),
+    ])
+    def test_blob_read_csv_chunk_promote_dtypes(self, _download, var_azc, data, expected):
+        _download(AzBlobClient, data)
 
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.csv"
+        df_list = list(var_azc.read_csv_chunk(path, chunk_size=1, range_size=4))
+        values = [df["value"].iloc[0] for df in df_list]
+        assert values[0] == expected[0]
+        if expected[1] is None:
+            assert pd.isna(values[1])
+        else:
+            assert values[1] == expected[1]
 
-class TestReadCsvChunk:
-    def test_blob_read_csv_chunk(self, mocker, _get_csv, var_azc):
-        mocker.patch.object(AzBlobClient, "_get", _get_csv)
-        return_value = {"size": len(b'name,age\nalice,10\nbob,10\n')}
-        func_mock = mocker.MagicMock()
-        func_mock.return_value = return_value
-        mocker.patch.object(AzBlobClient, "_info", func_mock)
+        # all chunks have the same dtype with `dtype`
+        df_list = list(var_azc.read_csv_chunk(path, chunk_size=1, range_size=4, dtype={"value": "object"}))
+        assert all([df["value"].dtype == "object" for df in df_list])
+
+
+class TestReadSplit:
+    def test_blob_plan_splits(self, _download, var_azc):
+        data = b"name,age\n" + b"".join([f"user{i},{i}\n".encode("utf-8") for i in range(100)])
+        _download(AzBlobClient, data)
 
-        # the file below is not exists
         path = "https://testazfs.blob.core.windows.net/test_caontainer/test.csv"
-        chunk_size = 2
-        chunk_counter = 0
-        with pytest.warns(FutureWarning):
-            for _ in var_azc.read_csv_chunk(path, chunk_size):
-                chunk_counter += 1
-            assert chunk_counter == 2
+        splits = var_azc.plan_splits(path, num_splits=3)
+        assert len(splits) == 3
+        assert splits[0][0] == 0
+        assert splits[-1][1] == len(data)
+        assert all([splits[i][1] == splits[i + 1][0] for i in range(len(splits) - 1)])
+        assert var_azc.plan_splits(path, split_size=len(data)) == [(0, len(data))]
 
-    def test_dfs_read_csv_chunk(self, mocker, _get_csv, var_azc):
-        mocker.patch.object(AzDataLakeClient, "_get", _get_csv)
-        return_value = {"size": len(b'name,age\nalice,10\nbob,10\n')}
-        func_mock = mocker.MagicMock()
-        func_mock.return_value = return_value
-        mocker.patch.object(AzDataLakeClient, "_info", func_mock)
+        with pytest.raises(AzfsInputError):
+            var_azc.plan_splits(path)
+        with pytest.raises(AzfsInputError):
+            var_azc.plan_splits(f"{path}.gz", num_splits=2)
+
+    @pytest.mark.parametrize("split_size", [1, 3, 7, 64, 4096])
+    def test_blob_read_split(self, _download, var_azc, split_size):
+        data = b"name,age\n" + b"".join([f"user{i},{i}\n".encode("utf-8") for i in range(100)])
+        _download(AzBlobClient, data)
+
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.csv"
+        # every line is read exactly once, even if the boundary is in the middle of the line
+        df_list = [
+            var_azc.read_split(path, start=start, end=end)
+            for start, end in var_azc.plan_splits(path, split_size=split_size)
+        ]
+        df = pd.concat(df_list, ignore_index=True)
+        assert list(df.columns) == ["name", "age"]
+        assert df["age"].tolist() == list(range(100))
+
+        df = var_azc.read_splits(path, split_size=split_size)
+        assert df["age"].tolist() == list(range(100))
+
+    def test_blob_read_split_ndjson(self, _download, var_azc):
+        data = b"".join([f'{{"name": "user{i}", "age": {i}}}\n'.encode("utf-8") for i in range(10)])
+        _download(AzBlobClient, data)
+
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.json"
+        df_list = list(var_azc.read_splits(path, num_splits=4, file_format="ndjson", iterator=True))
+        assert len(df_list) == 4
+        assert pd.concat(df_list)["age"].tolist() == list(range(10))
+
+    def test_blob_read_csv_with_split_size(self, _download, var_azc):
+        data = b"name,age\n" + b"".join([f"user{i},{i}\n".encode("utf-8") for i in range(100)])
+        _download(AzBlobClient, data)
+
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.csv"
+        df = var_azc.read(split_size=128).csv(path=path)
+        assert sorted(df["age"].tolist()) == list(range(100))
+
+        # with multiprocessing
+        df = var_azc.read(use_mp=True, split_size=128).csv(path=path)
+        assert df["age"].tolist() == list(range(100))
+        df = var_azc.read_splits(path, num_splits=4, use_mp=True, cpu_count=2)
+        assert df["age"].tolist() == list(range(100))
 
-        # the file below is not exists
-        path = "https://testazfs.dfs.core.windows.net/test_caontainer/test.csv"
-        chunk_size = 2
-        chunk_counter = 0
-        with pytest.warns(FutureWarning):
-            for _ in var_azc.read_csv_chunk(path, chunk_size):
-                chunk_counter += 1
-            assert chunk_counter == 2
+
+class TestDiskCache:
+    def test_blob_read_csv_with_disk_cache(self, _download, tmp_path):
+        data = b'name,age\nalice,10\nbob,10\n'
+        download_mock, info_mock = _download(AzBlobClient, data)
+        info_mock.return_value = {"size": len(data), "etag": "0x1"}
+
+        azc = azfs.AzFileClient(credential="", disk_cache=azfs.DiskCache(cache_dir=str(tmp_path)))
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.csv"
+        df = azc.read_csv(path)
+        assert len(df.index) == 2
+        assert download_mock.call_count == 1
+
+        # the second read is served from the local disk, also with `stream=True`
+        df = azc.read_csv(path)
+        assert len(df.index) == 2
+        df = azc.read_csv(path, stream=True)
+        assert len(df.index) == 2
+        assert download_mock.call_count == 1
+
+        # the file is modified, so downloaded again
+        info_mock.return_value = {"size": len(data), "etag": "0x2"}
+        df = azc.read_csv(path)
+        assert len(df.index) == 2
+        assert download_mock.call_count == 2
+
+
+    def test_blob_read_parquet_columns_with_disk_cache(self, _download, tmp_path, var_df):
+        data = var_df.to_parquet()
+        download_mock, _ = _download(AzBlobClient, data, etag="0x1")
+
+        azc = azfs.AzFileClient(credential="", disk_cache=azfs.DiskCache(cache_dir=str(tmp_path)))
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.parquet"
+        df = azc.read_parquet(path)
+        assert download_mock.call_count == 1
+
+        # the footer and the column-chunks are read from the cached file
+        df = azc.read_parquet(path, columns=["name"])
+        assert list(df.columns) == ["name"]
+        table = azc.read_parquet_table(path, columns=["age"], filters=[("name", "!=", "")])
+        assert table.column("age").to_pylist() == ["10", "10"]
+        assert download_mock.call_count == 1
+
+        # the file is modified, so the ranges are downloaded
+        download_mock, _ = _download(AzBlobClient, data, etag="0x2")
+        df = azc.read_parquet(path, columns=["name"])
+        assert list(df.columns) == ["name"]
+        assert download_mock.call_count > 0
+
+
+class TestMemoryCache:
+    def test_blob_read_json_with_memory_cache(self, _download):
+        data = b'{"name": "alice"}'
+        download_mock, _ = _download(AzBlobClient, data, etag="0x1")
+
+        azc = azfs.AzFileClient(credential="", memory_cache=azfs.MemoryCache(ttl=60))
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/config.json"
+        assert azc.read_json(path) == {"name": "alice"}
+        # served from memory without any request
+        assert azc.read_json(path) == {"name": "alice"}
+        assert download_mock.call_count == 1
+
+        # after the ttl, revalidated with `If-None-Match`
+        azc._memory_cache.ttl = 0
+        assert azc.read_json(path) == {"name": "alice"}
+        assert download_mock.call_count == 2
+        assert download_mock.call_args.kwargs["etag"] == "0x1"
+
+        # the file is modified
+        download_mock, _ = _download(AzBlobClient, b'{"name": "bob"}', etag="0x2")
+        assert azc.read_json(path) == {"name": "bob"}
+        assert azc.cache_stats() == {
+            "hits": 1, "misses": 1, "revalidations": 2, "not_modified": 1, "entries": 1, "size": 15
+        }
+
+
+    def test_blob_read_csv_with_memory_and_disk_cache(self, _download, tmp_path):
+        data = b'name,age\nalice,10\nbob,10\n'
+        download_mock, _ = _download(AzBlobClient, data, etag="0x1")
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.csv"
+
+        azc = azfs.AzFileClient(
+            credential="", memory_cache=azfs.MemoryCache(ttl=60), disk_cache=azfs.DiskCache(cache_dir=str(tmp_path)))
+        assert len(azc.read_csv(path).index) == 2
+        assert download_mock.call_count == 1
+
+        # the memory cache misses, and the file is served from the disk cache
+        azc = azfs.AzFileClient(
+            credential="", memory_cache=azfs.MemoryCache(ttl=60), disk_cache=azfs.DiskCache(cache_dir=str(tmp_path)))
+        assert len(azc.read_csv(path).index) == 2
+        assert download_mock.call_count == 1
+        assert azc.cache_stats()["entries"] == 1
+
+        # and then from memory
+        assert len(azc.read_csv(path).index) == 2
+        assert download_mock.call_count == 1
+        assert azc.cache_stats()["hits"] == 1
+
+    def test_blob_read_csv_larger_than_memory_cache(self, _download, tmp_path):
+        data = b'name,age\nalice,10\nbob,10\n'
+        download_mock, info_mock = _download(AzBlobClient, data, etag="0x1")
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.csv"
+
+        azc = azfs.AzFileClient(
+            credential="",
+            memory_cache=azfs.MemoryCache(max_size=8, ttl=60),
+            disk_cache=azfs.DiskCache(cache_dir=str(tmp_path)))
+        assert len(azc.read_csv(path, max_concurrency=4, chunk_size=4).index) == 2
+        # the size is checked before downloading, and the file is downloaded concurrently
+        info_mock.assert_called()
+        assert download_mock.call_count == 7
+        assert all(["match_condition" not in c.kwargs for c in download_mock.call_args_list])
+        assert azc.cache_stats()["entries"] == 0
+
+        # not downloaded again, since served from the disk cache
+        assert len(azc.read_csv(path, max_concurrency=4, chunk_size=4).index) == 2
+        assert download_mock.call_count == 7
+        assert azc.cache_stats()["entries"] == 0
+
+
+class TestParsedCache:
+    def test_blob_read_csv_with_parsed_cache(self, mocker, _download, tmp_path):
+        data = b'name,age\nalice,10\nbob,10\n'
+        download_mock, info_mock = _download(AzBlobClient, data)
+        info_mock.return_value = {"size": len(data), "etag": "0x1"}
+        read_csv_spy = mocker.spy(pd, "read_csv")
+
+        azc = azfs.AzFileClient(credential="", parsed_cache=azfs.ParsedCache(cache_dir=str(tmp_path)))
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.csv"
+        df = azc.read_csv(path, usecols=["age"])
+        # loaded from the parsed cache without downloading and parsing
+        cached_df = azc.read_csv(path, usecols=["age"])
+        pd.testing.assert_frame_equal(df, cached_df)
+        assert download_mock.call_count == 1
+        assert read_csv_spy.call_count == 1
+
+        # the other keywords are parsed again
+        df = azc.read_csv(path)
+        assert list(df.columns) == ["name", "age"]
+        assert read_csv_spy.call_count == 2
+
+        # the iterator is not cached
+        df_list = list(azc.read_csv(path, chunksize=1))
+        assert len(df_list) == 2
+        assert read_csv_spy.call_count == 3
+
+        # the file is modified
+        info_mock.return_value = {"size": len(data), "etag": "0x2"}
+        _ = azc.read_csv(path, usecols=["age"])
+        assert read_csv_spy.call_count == 4
 
 
 class TestToCsv:
@@ -497,6 +1430,131 @@ class TestToPickle:
             assert result
 
 
+class TestToParquet:
+    def test_blob_to_parquet(self, mocker, var_azc, var_df):
+        stage_block_mock = mocker.MagicMock()
+        commit_block_list_mock = mocker.MagicMock()
+        mocker.patch.object(BlobClient, "stage_block", stage_block_mock)
+        mocker.patch.object(BlobClient, "commit_block_list", commit_block_list_mock)
+
+        # the file below is not exists
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.parquet"
+
+        with var_azc:
+            result = var_df.to_parquet_az(path, row_group_size=1, block_size=64)
+        assert result
+        assert stage_block_mock.call_count > 1
+        staged = {c.kwargs["block_id"]: c.kwargs["data"] for c in stage_block_mock.call_args_list}
+        block_list = commit_block_list_mock.call_args[0][0]
+        data = b"".join([staged[b.id] for b in block_list])
+
+        import pyarrow.parquet as pq
+        parquet_file = pq.ParquetFile(io.BytesIO(data))
+        assert parquet_file.metadata.num_row_groups == len(var_df)
+        assert parquet_file.read().to_pandas().equals(var_df)
+
+    def test_dfs_to_parquet(self, mocker, var_azc, var_df):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        create_file_mock = mocker.MagicMock()
+        append_data_mock = mocker.MagicMock()
+        flush_data_mock = mocker.MagicMock()
+        mocker.patch.object(DataLakeFileClient, "create_file", create_file_mock)
+        mocker.patch.object(DataLakeFileClient, "append_data", append_data_mock)
+        mocker.patch.object(DataLakeFileClient, "flush_data", flush_data_mock)
+
+        # the file below is not exists
+        path = "https://testazfs.dfs.core.windows.net/test_caontainer/test.parquet"
+
+        table = pa.Table.from_pandas(var_df, preserve_index=False)
+        result = var_azc.write_parquet(path, table, row_group_size=2, compression="gzip", block_size=64)
+        assert result
+        appended = sorted([(c.kwargs["offset"], c.kwargs["data"]) for c in append_data_mock.call_args_list])
+        data = b"".join([d for _, d in appended])
+        flush_data_mock.assert_called_once_with(len(data))
+
+        parquet_file = pq.ParquetFile(io.BytesIO(data))
+        assert parquet_file.metadata.row_group(0).column(0).compression == "GZIP"
+        assert parquet_file.read().equals(table)
+
+    def test_to_parquet_invalid_row_group_size(self, var_azc, var_df):
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.parquet"
+        with pytest.raises(AzfsInputError):
+            var_azc.write_parquet(path, var_df, row_group_size=0)
+
+
+class TestWriteDataset:
+    @pytest.mark.parametrize("client_class, account_kind", [
+        (AzBlobClient, "blob"),
+        (AzDataLakeClient, "dfs"),
+    ])
+    def test_write_dataset(self, mocker, _download, var_azc, client_class, account_kind):
+        written = {}
+
+        def _put_side_effect(path, data, **kwargs):
+            written[path] = data
+            return True
+        mocker.patch.object(client_class, "_put", mocker.MagicMock(side_effect=_put_side_effect))
+
+        df = pd.DataFrame({
+            "date": ["2026-01-01", "2026-01-02", "2026-01-01", None],
+            "id": [1, 2, 3, 4],
+            "value": [1.0, 2.0, 3.0, 4.0]
+        })
+        root = f"https://testazfs.{account_kind}.core.windows.net/test_caontainer/table"
+        manifest = var_azc.write_dataset(df, root, partition_cols=["date"], max_concurrency=2)
+        basename = manifest[0]["path"].rsplit("/", 1)[1]
+        assert re.fullmatch(r"part-[0-9a-f]{32}\.parquet", basename)
+        assert [m["path"] for m in manifest] == [
+            f"{root}/date=2026-01-01/{basename}",
+            f"{root}/date=2026-01-02/{basename}",
+            f"{root}/date=__HIVE_DEFAULT_PARTITION__/{basename}",
+        ]
+        assert [m["num_rows"] for m in manifest] == [2, 1, 1]
+        assert all([m["size"] == len(written[m["path"]]) for m in manifest])
+
+        # the written dataset can be read with partition pruning
+        files = {path.split("/test_caontainer/")[1]: data for path, data in written.items()}
+        _download(client_class, files)
+        mocker.patch.object(client_class, "_ls_detail", mocker.MagicMock(return_value=_ls_detail_of(files)))
+        result = var_azc.read().parquet_dataset(root, filters=[("date", "==", "2026-01-01")])
+        assert result["id"].tolist() == [1, 3]
+        assert result["date"].tolist() == ["2026-01-01", "2026-01-01"]
+
+    def test_write_dataset_csv(self, mocker, var_azc):
+        put_mock = mocker.MagicMock(return_value=True)
+        mocker.patch.object(AzBlobClient, "_put", put_mock)
+
+        df = pd.DataFrame({"date": ["2026-01-01", "2026-01-01"], "kind": ["a/b", "c"], "id": [1, 2]})
+        root = "https://testazfs.blob.core.windows.net/test_caontainer/table/"
+        manifest = var_azc.write_dataset(df, root, partition_cols=["date", "kind"], file_format="csv")
+        basename = manifest[0]["path"].rsplit("/", 1)[1]
+        assert [m["path"] for m in manifest] == [
+            f"{root}date=2026-01-01/kind=a%2Fb/{basename}",
+            f"{root}date=2026-01-01/kind=c/{basename}",
+        ]
+        written = {c.kwargs["path"]: c.kwargs["data"] for c in put_mock.call_args_list}
+        assert written[f"{root}date=2026-01-01/kind=c/{basename}"] == b"id\n2\n"
+
+        with pytest.raises(AzfsInputError):
+            var_azc.write_dataset(df, root, partition_cols=["date"], file_format="json")
+
+    def test_write_dataset_basename(self, mocker, var_azc):
+        put_mock = mocker.MagicMock(return_value=True)
+        mocker.patch.object(AzBlobClient, "_put", put_mock)
+
+        df = pd.DataFrame({"date": ["2026-01-01"], "id": [1]})
+        root = "https://testazfs.blob.core.windows.net/test_caontainer/table"
+        # each call writes the new file, not to overwrite the data already written
+        first = var_azc.write_dataset(df, root, partition_cols=["date"])
+        second = var_azc.write_dataset(df, root, partition_cols=["date"])
+        assert first[0]["path"] != second[0]["path"]
+
+        # the partition is overwritten with the same basename
+        manifest = var_azc.write_dataset(df, root, partition_cols=["date"], file_format="csv", basename="data.csv")
+        assert manifest[0]["path"] == f"{root}/date=2026-01-01/data.csv"
+
+
 class TestToJson:
 
     def test_blob_to_csv(self, mocker, _put, var_azc):
@@ -577,8 +1635,8 @@ class TestGlob:
         with pytest.raises(AzfsInputError):
             var_azc.glob(path)
 
-    def test_blob_glob(self, mocker, _ls_for_glob, var_azc):
-        mocker.patch.object(AzBlobClient, "_ls", _ls_for_glob)
+    def test_blob_glob(self, mocker, _walk_for_glob, var_azc):
+        mocker.patch.object(AzBlobClient, "_walk", _walk_for_glob)
 
         # the file below is not exists
         path = "https://testazfs.blob.core.windows.net/test_caontainer/root_folder/*.csv"
@@ -606,6 +1664,135 @@ class TestGlob:
         assert "https://testazfs.blob.core.windows.net/test_caontainer/root_folder/dir1/test1.csv" in file_list
         assert "https://testazfs.blob.core.windows.net/test_caontainer/root_folder/dir1/test2.csv" in file_list
 
+    def test_blob_glob_prefix(self, mocker, _walk_for_glob, var_azc):
+        mocker.patch.object(AzBlobClient, "_walk", _walk_for_glob)
+
+        # only the directory of the longest prefix is listed
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/root_folder/dir1/*.csv"
+        assert len(var_azc.glob(pattern_path=path)) == 2
+        assert [c.kwargs["file_path"] for c in _walk_for_glob.call_args_list] == ["root_folder/dir1/"]
+
+        # the chars before `*` narrow the listing
+        _walk_for_glob.reset_mock()
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/root_folder/test*.csv"
+        assert len(var_azc.glob(pattern_path=path)) == 2
+        assert [c.kwargs["file_path"] for c in _walk_for_glob.call_args_list] == ["root_folder/test"]
+
+        # the matched directories are listed level by level
+        _walk_for_glob.reset_mock()
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/root_folder/*/test1.*"
+        file_list = var_azc.glob(pattern_path=path, max_concurrency=2)
+        assert file_list == [
+            "https://testazfs.blob.core.windows.net/test_caontainer/root_folder/dir1/test1.csv",
+            "https://testazfs.blob.core.windows.net/test_caontainer/root_folder/dir1/test1.json",
+            "https://testazfs.blob.core.windows.net/test_caontainer/root_folder/dir2/test1.csv",
+            "https://testazfs.blob.core.windows.net/test_caontainer/root_folder/dir2/test1.json"
+        ]
+        assert sorted([c.kwargs["file_path"] for c in _walk_for_glob.call_args_list]) == [
+            "root_folder/",
+            "root_folder/dir1/test1.",
+            "root_folder/dir2/test1."
+        ]
+
+        # the directories are not matched with the file pattern
+        _walk_for_glob.reset_mock()
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/root_folder/dir*"
+        assert var_azc.glob(pattern_path=path) == []
+
+    def test_blob_glob_syntax(self, mocker, _walk_for_glob, _ls_detail_for_glob, var_azc):
+        def _ls_detail(path: str, file_path: str) -> list:
+            return [f for f in _ls_detail_for_glob.return_value if f["name"].startswith(file_path)]
+        ls_detail_mock = mocker.MagicMock(side_effect=_ls_detail)
+        mocker.patch.object(AzBlobClient, "_walk", _walk_for_glob)
+        mocker.patch.object(AzBlobClient, "_ls_detail", ls_detail_mock)
+        base_path = "https://testazfs.blob.core.windows.net/test_caontainer"
+
+        # `**` lists all the files under the directory with one request
+        file_list = var_azc.glob(pattern_path=f"{base_path}/root_folder/**/*.csv")
+        assert file_list == [
+            f"{base_path}/root_folder/dir1/test1.csv",
+            f"{base_path}/root_folder/dir1/test2.csv",
+            f"{base_path}/root_folder/dir2/test1.csv",
+            f"{base_path}/root_folder/dir2/test2.csv",
+            f"{base_path}/root_folder/test1.csv",
+            f"{base_path}/root_folder/test2.csv"
+        ]
+        assert [c.kwargs["file_path"] for c in ls_detail_mock.call_args_list] == ["root_folder/"]
+        assert _walk_for_glob.call_count == 0
+        assert len(var_azc.glob(pattern_path=f"{base_path}/root_folder/**")) == 9
+        assert len(var_azc.glob(pattern_path=f"{base_path}/root_folder/dir1/**/test?.json")) == 1
+
+        # `?` and `[...]`
+        file_list = var_azc.glob(pattern_path=f"{base_path}/root_folder/dir?/test[!2].csv")
+        assert file_list == [f"{base_path}/root_folder/dir1/test1.csv", f"{base_path}/root_folder/dir2/test1.csv"]
+        file_list = var_azc.glob(pattern_path=f"{base_path}/root_folder/test[1-2].*")
+        assert len(file_list) == 3
+
+        # each alternative of the braces is listed from its own prefix
+        _walk_for_glob.reset_mock()
+        file_list = var_azc.glob(pattern_path=f"{base_path}/root_folder/{{dir1,dir2}}/test1.csv")
+        assert file_list == [f"{base_path}/root_folder/dir1/test1.csv", f"{base_path}/root_folder/dir2/test1.csv"]
+        assert sorted([c.kwargs["file_path"] for c in _walk_for_glob.call_args_list]) == [
+            "root_folder/dir1/test1.csv",
+            "root_folder/dir2/test1.csv"
+        ]
+        file_list = var_azc.glob(pattern_path=f"{base_path}/root_folder/{{test1,test*}}.{{csv,json}}", detail=True)
+        assert [f["name"] for f in file_list] == [
+            f"{base_path}/root_folder/test1.csv",
+            f"{base_path}/root_folder/test1.json",
+            f"{base_path}/root_folder/test2.csv"
+        ]
+        assert file_list[0]["size"] == 10
+
+        with pytest.raises(AzfsInputError):
+            var_azc.glob(pattern_path=f"{base_path}/{{root_folder,oth*}}/*.csv")
+        with pytest.raises(AzfsInputError):
+            var_azc.glob(pattern_path=f"{base_path}/root_folder/test1.{{csv}}")
+
+    def test_blob_read_glob_syntax(self, mocker, _get_csv, _walk_for_glob, var_azc):
+        mocker.patch.object(AzBlobClient, "_get", _get_csv)
+        mocker.patch.object(AzBlobClient, "_walk", _walk_for_glob)
+
+        path = "https://testazfs.blob.core.windows.net/test_caontainer/root_folder/{dir1,dir2}/test?.csv"
+        df = var_azc.read().csv(path=path)
+        assert len(df.index) == 8
+
+    @pytest.mark.parametrize("pattern,expected", [
+        ("a.csv", ["a.csv"]),
+        ("{a,b}.csv", ["a.csv", "b.csv"]),
+        ("{a,b}/{c,d}", ["a/c", "a/d", "b/c", "b/d"]),
+        ("x{a,b{c,d}}", ["xa", "xbc", "xbd"]),
+        ("{a,a}.csv", ["a.csv"]),
+        ("a{b.csv", ["a{b.csv"]),
+    ])
+    def test_expand_braces(self, pattern, expected):
+        assert _expand_braces(pattern) == expected
+
+    @pytest.mark.parametrize("segment,name,expected", [
+        ("*.csv", "test1.csv", True),
+        ("*.csv", "test1.xcsv", False),
+        ("test?.csv", "test1.csv", True),
+        ("test?.csv", "test10.csv", False),
+        ("test[12].csv", "test2.csv", True),
+        ("test[!12].csv", "test2.csv", False),
+        ("test[a-c].csv", "testb.csv", True),
+        ("test[].csv", "test[].csv", True),
+        ("test(1).csv", "test(1).csv", True),
+    ])
+    def test_compile_glob_segment(self, segment, name, expected):
+        assert bool(_compile_glob_segment(segment).fullmatch(name)) == expected
+
+    @pytest.mark.parametrize("segments,name,expected", [
+        (("**", "*.csv"), "a.csv", True),
+        (("**", "*.csv"), "x/y/a.csv", True),
+        (("**", "*.csv"), "x/y/a.json", False),
+        (("**",), "x/a.json", True),
+        (("*", "**", "a.csv"), "x/a.csv", True),
+        (("*", "**", "a.csv"), "a.csv", False),
+    ])
+    def test_compile_glob_path(self, segments, name, expected):
+        assert bool(_compile_glob_path(segments).fullmatch(name)) == expected
+
     def test_dfs_glob_error(self, var_azc):
         path = "https://testazfs.dfs.core.windows.net/test_caontainer/root_folder/test1.csv"
         with pytest.raises(AzfsInputError):
@@ -614,8 +1801,8 @@ class TestGlob:
         with pytest.raises(AzfsInputError):
             var_azc.glob(path)
 
-    def test_dfs_glob(self, mocker, _ls_for_glob, var_azc):
-        mocker.patch.object(AzDataLakeClient, "_ls", _ls_for_glob)
+    def test_dfs_glob(self, mocker, _walk_for_glob, var_azc):
+        mocker.patch.object(AzDataLakeClient, "_walk", _walk_for_glob)
 
         # the file below is not exists
         path = "https://testazfs.dfs.core.windows.net/test_caontainer/root_folder/*.csv"
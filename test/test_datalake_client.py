@@ -1,7 +1,9 @@
+import io
 import json
 import pytest
 from azfs.clients.datalake_client import AzDataLakeClient
-from azure.storage.filedatalake import FileSystemClient, DataLakeFileClient
+from azure.core.exceptions import ResourceNotFoundError
+from azure.storage.filedatalake import FileSystemClient, DataLakeFileClient, PathProperties
 import azfs
 
 credential = ""
@@ -181,3 +183,121 @@ def test_blob_ls(mocker, datalake_client):
     mocker.patch.object(FileSystemClient, "get_paths", func_mock)
     file_list = datalake_client.ls(path=test_file_ls_path, file_path=test_file_ls_path)
     assert file_list
+
+
+def test_datalake_walk(mocker):
+    # ======================== #
+    # test for datalake_client #
+    # ======================== #
+
+    # mock
+    func_mock = mocker.MagicMock()
+    func_mock.return_value = [
+        PathProperties(name="root/dir1", is_directory=True, content_length=0),
+        PathProperties(name="root/test.csv", is_directory=False, content_length=500),
+        PathProperties(name="root/other.csv", is_directory=False, content_length=500),
+    ]
+
+    mocker.patch.object(FileSystemClient, "get_paths", func_mock)
+    file_list = datalake_client_credential.walk(path=test_file_ls_path, file_path="root/")
+    assert file_list[:2] == [
+        {"name": "root/dir1", "size": None, "is_directory": True},
+        {"name": "root/test.csv", "size": 500, "is_directory": False}
+    ]
+    assert func_mock.call_args.kwargs == {"path": "root", "recursive": False}
+
+    # the prefix of the names is filtered after listed
+    file_list = datalake_client_credential.walk(path=test_file_ls_path, file_path="root/te")
+    assert [f["name"] for f in file_list] == ["root/test.csv"]
+
+    # the directory does not exist
+    func_mock.side_effect = ResourceNotFoundError("not found")
+    assert datalake_client_credential.walk(path=test_file_ls_path, file_path="none/") == []
+
+
+@pytest.mark.parametrize("datalake_client", [
+    # datalake client
+    datalake_client_credential,
+    datalake_client_connection_string,
+])
+def test_datalake_get_ranges(_download, datalake_client):
+    # ======================== #
+    # test for datalake_client #
+    # ======================== #
+    data = b'name,age\nalice,10\nbob,10\n'
+
+    # mock
+    download_mock, info_mock = _download(AzDataLakeClient, data)
+
+    result = datalake_client.get(path=test_file_path, max_concurrency=4, chunk_size=4)
+    assert result.getvalue() == data
+    assert download_mock.call_count == 7
+
+    # the file smaller than chunk_size is downloaded with one request, from the head of the file
+    download_mock.reset_mock()
+    result = datalake_client.get(path=test_file_path, max_concurrency=4, chunk_size=1024)
+    assert result.getvalue() == data
+    download_mock.assert_called_once()
+    assert download_mock.call_args.kwargs["offset"] == 0
+
+    # ===================== #
+    # test for AzFileClient #
+    # ===================== #
+    df = azc.read_csv(path=test_file_path, max_concurrency=4, chunk_size=4)
+    assert len(df.index) == 2
+
+
+@pytest.mark.parametrize("data", [
+    b'name,age\nalice,10\nbob,10\n',
+    io.BytesIO(b'name,age\nalice,10\nbob,10\n'),
+    (b for b in [b'name,', b'age\nalice,10\n', b'bob,10\n']),
+])
+def test_datalake_upload_blocks(mocker, data):
+    # ======================== #
+    # test for datalake_client #
+    # ======================== #
+
+    # mock
+    create_file_mock = mocker.MagicMock()
+    append_data_mock = mocker.MagicMock()
+    flush_data_mock = mocker.MagicMock()
+    mocker.patch.object(DataLakeFileClient, "create_file", create_file_mock)
+    mocker.patch.object(DataLakeFileClient, "append_data", append_data_mock)
+    mocker.patch.object(DataLakeFileClient, "flush_data", flush_data_mock)
+
+    result = datalake_client_credential.put(path=test_file_path, data=data, block_size=4, max_concurrency=2)
+    assert result
+    assert append_data_mock.call_count == 7
+    appended = sorted([(c.kwargs["offset"], c.kwargs["data"]) for c in append_data_mock.call_args_list])
+    assert b"".join([d for _, d in appended]) == b'name,age\nalice,10\nbob,10\n'
+    # flushed only once
+    flush_data_mock.assert_called_once_with(len(b'name,age\nalice,10\nbob,10\n'))
+
+
+def test_datalake_upload_small(mocker):
+    # ======================== #
+    # test for datalake_client #
+    # ======================== #
+
+    # mock
+    create_file_mock = mocker.MagicMock()
+    append_data_mock = mocker.MagicMock()
+    flush_data_mock = mocker.MagicMock()
+    mocker.patch.object(DataLakeFileClient, "create_file", create_file_mock)
+    mocker.patch.object(DataLakeFileClient, "append_data", append_data_mock)
+    mocker.patch.object(DataLakeFileClient, "flush_data", flush_data_mock)
+
+    # the data smaller than block_size is appended with one request
+    data = b'name,age\nalice,10\nbob,10\n'
+    result = datalake_client_credential.put(path=test_file_path, data=data)
+    assert result
+    append_data_mock.assert_called_once_with(data=b'name,age\nalice,10\nbob,10\n', offset=0, length=25)
+    flush_data_mock.assert_called_once_with(25)
+
+    # empty data is only flushed
+    append_data_mock.reset_mock()
+    flush_data_mock.reset_mock()
+    result = datalake_client_credential.put(path=test_file_path, data=b"")
+    assert result
+    append_data_mock.assert_not_called()
+    flush_data_mock.assert_called_once_with(0)